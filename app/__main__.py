@@ -1,6 +1,129 @@
+"""
+Mock Server Launcher.
+
+``python -m app`` starts the server in development mode: a single process
+that reloads when the code changes. Production mode runs several worker
+processes without the file watcher, for load and soak tests:
+
+    python -m app --mode production --workers 4
+
+Every option can also be set through its SERVER_* environment variable.
+
+In production mode the workers share one database. The launcher prepares it
+once before they start and configures them to share it safely: they skip the
+schema and sample data checks, multiple workers leave the per-process
+occupancy index off, and only one worker at a time runs the availability
+maintenance job. SQLite databases use the WAL ``production`` profile unless
+SQLITE_PROFILE says otherwise, so workers can read while another writes.
+
+Author: AI Assistant
+"""
+
+import argparse
+import os
+import tempfile
+from typing import Optional, Sequence
+
 import uvicorn
 
-if __name__ == "__main__":
+
+def env_flag(name: str) -> Optional[bool]:
+    """Read a boolean environment variable; None when it is not set."""
+    value = os.getenv(name)
+    return None if value is None else value.lower() in ("1", "true", "yes")
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Run the restaurant booking mock server."
+    )
+    parser.add_argument(
+        "--mode", choices=("dev", "production"),
+        default=os.getenv("SERVER_MODE", "dev")
+    )
+    parser.add_argument("--host", default=os.getenv("SERVER_HOST", "0.0.0.0"))
+    parser.add_argument(
+        "--port", type=int, default=int(os.getenv("SERVER_PORT", "8547"))
+    )
+    parser.add_argument(
+        "--workers", type=int,
+        default=int(os.getenv("SERVER_WORKERS", str(os.cpu_count() or 1))),
+        help="worker processes in production mode (default: one per CPU)"
+    )
+    parser.add_argument(
+        "--loop", choices=("auto", "asyncio", "uvloop"),
+        default=os.getenv("SERVER_LOOP", "auto"),
+        help="event loop; auto uses uvloop when installed"
+    )
+    parser.add_argument(
+        "--http", choices=("auto", "h11", "httptools"),
+        default=os.getenv("SERVER_HTTP", "auto"),
+        help="HTTP parser; auto uses httptools when installed"
+    )
+    parser.add_argument(
+        "--backlog", type=int, default=int(os.getenv("SERVER_BACKLOG", "2048")),
+        help="maximum queued connections"
+    )
+    parser.add_argument(
+        "--keep-alive", type=int, default=int(os.getenv("SERVER_KEEP_ALIVE", "5")),
+        help="seconds an idle keep-alive connection stays open"
+    )
+    parser.add_argument(
+        "--access-log", action=argparse.BooleanOptionalAction,
+        default=env_flag("SERVER_ACCESS_LOG"),
+        help="log every request (default: on in dev mode, off in production)"
+    )
+    return parser.parse_args(argv)
+
+
+def prepare_workers(workers: int, port: int) -> None:
+    """
+    Prepare the shared database once and configure workers to share it.
+
+    Settings are passed to the workers through the environment, which they
+    inherit when spawned.
+
+    Args:
+        workers: Number of worker processes that will be started
+        port: Port the server listens on, naming the maintenance lock file
+    """
+    os.environ.setdefault("SQLITE_PROFILE", "production")
+    # Imported once SQLITE_PROFILE is settled: engines are created on import
+    from app import init_db
+
+    init_db.prepare_database()
+    os.environ["DATABASE_PREPARED"] = "1"
+    if workers > 1:
+        os.environ["OCCUPANCY_INDEX"] = "0"
+        os.environ.setdefault("MAINTENANCE_LOCK_FILE", os.path.join(
+            tempfile.gettempdir(), f"restaurant-booking-{port}-maintenance.lock"
+        ))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = parse_args(argv)
+    options = dict(
+        host=args.host,
+        port=args.port,
+        loop=args.loop,
+        http=args.http,
+        backlog=args.backlog,
+        timeout_keep_alive=args.keep_alive,
+    )
+
+    if args.mode == "dev":
+        uvicorn.run(
+            "app.main:app", reload=True, reload_dirs=["app"],
+            access_log=args.access_log is not False, **options
+        )
+        return
+
+    prepare_workers(args.workers, args.port)
     uvicorn.run(
-        "app.main:app", host="0.0.0.0", port=8547, reload=True, reload_dirs=["app"]
+        "app.main:app", workers=args.workers, access_log=bool(args.access_log),
+        **options
     )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""
+In-Process Caches for Restaurant Booking API.
+
+This module holds process-wide caches for reference data that practically
+never changes but is needed on every request: restaurants and cancellation
+reasons. Entries expire after a TTL so
+changes made by other processes are eventually picked up, and ORM event hooks
+invalidate them immediately when this process modifies the underlying rows.
+
+Author: AI Assistant
+"""
+
+import os
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Set, Tuple
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Restaurant, CancellationReason
+
+# Seconds a cached restaurant stays valid; 0 disables caching
+RESTAURANT_CACHE_TTL = float(os.getenv("RESTAURANT_CACHE_TTL", "300"))
+
+# Seconds the cached cancellation reasons table stays valid; 0 disables caching
+CANCELLATION_REASON_CACHE_TTL = float(
+    os.getenv("CANCELLATION_REASON_CACHE_TTL", "300")
+)
+
+
+@dataclass(frozen=True)
+class CachedRestaurant:
+    """
+    Immutable snapshot of a restaurant row, safe to share across sessions.
+
+    Attributes:
+        id (int): Primary key identifier
+        name (str): Unique restaurant name
+        microsite_name (str): Unique microsite identifier for the restaurant
+    """
+
+    id: int
+    name: str
+    microsite_name: str
+
+
+class RestaurantCache:
+    """
+    Restaurant name to record cache with a TTL fallback.
+
+    Only restaurants that exist are cached, so newly created restaurants are
+    visible immediately without an insert hook.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[float, CachedRestaurant]] = {}
+
+    def get(self, name: str) -> Optional[CachedRestaurant]:
+        """
+        Look up a restaurant by name.
+
+        Args:
+            name: The name of the restaurant
+
+        Returns:
+            The cached restaurant, or None if absent or expired
+        """
+        entry = self._entries.get(name)
+        if entry is None:
+            return None
+        expires_at, restaurant = entry
+        if time.monotonic() >= expires_at:
+            self._entries.pop(name, None)
+            return None
+        return restaurant
+
+    def put(self, record: Restaurant) -> CachedRestaurant:
+        """
+        Cache a restaurant loaded from the database.
+
+        Args:
+            record: The restaurant ORM instance
+
+        Returns:
+            The immutable snapshot stored in the cache
+        """
+        restaurant = CachedRestaurant(
+            id=record.id, name=record.name, microsite_name=record.microsite_name
+        )
+        if self.ttl > 0:
+            self._entries[record.name] = (time.monotonic() + self.ttl, restaurant)
+        return restaurant
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """
+        Drop one cached restaurant, or all of them when no name is given.
+
+        Args:
+            name: The name of the restaurant to drop
+        """
+        if name is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(name, None)
+
+
+# Process-wide restaurant cache shared by all routers
+restaurant_cache = RestaurantCache(ttl=RESTAURANT_CACHE_TTL)
+
+
+@event.listens_for(Restaurant, "after_update")
+@event.listens_for(Restaurant, "after_delete")
+def invalidate_restaurant_cache(mapper, connection, target: Restaurant) -> None:
+    """
+    Drop all cached restaurants when this process changes one.
+
+    Everything is dropped because an update may have renamed the restaurant,
+    leaving its old name as the cache key.
+    """
+    restaurant_cache.invalidate()
+
+
+@dataclass(frozen=True)
+class CachedCancellationReason:
+    """
+    Immutable snapshot of a cancellation reason row.
+
+    Attributes:
+        id (int): Primary key identifier
+        reason (str): Short cancellation reason
+        description (str): Detailed description of the reason
+    """
+
+    id: int
+    reason: str
+    description: Optional[str]
+
+
+class CancellationReasonCache:
+    """
+    Whole-table cache of cancellation reasons with a TTL fallback.
+
+    The table is small and read on every cancellation and cancelled-booking
+    lookup, so it is loaded in full with one query. An unknown ID reloads the
+    table once, so reasons added by other processes are found without waiting
+    for the TTL. If the reload does not find it either, the miss is cached
+    until the TTL expires, so repeating an unknown ID costs no further
+    queries. Reloading for an unknown ID does not extend the TTL.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._reasons: Dict[int, CachedCancellationReason] = {}
+        self._missing: Set[int] = set()
+        self._expires_at = 0.0
+
+    async def get(
+        self, db: AsyncSession, reason_id: int
+    ) -> Optional[CachedCancellationReason]:
+        """
+        Look up a cancellation reason by ID.
+
+        Args:
+            db: Async database session used to (re)load the table
+            reason_id: ID of the cancellation reason
+
+        Returns:
+            The cancellation reason, or None if it does not exist
+        """
+        if time.monotonic() < self._expires_at:
+            if reason_id in self._reasons:
+                return self._reasons[reason_id]
+            if reason_id in self._missing:
+                return None
+
+        records = await db.scalars(select(CancellationReason))
+        reasons = {
+            record.id: CachedCancellationReason(
+                id=record.id, reason=record.reason, description=record.description
+            )
+            for record in records
+        }
+        if self.ttl > 0:
+            if time.monotonic() >= self._expires_at:
+                self._missing = set()
+                self._expires_at = time.monotonic() + self.ttl
+            self._reasons = reasons
+            self._missing = {
+                missing for missing in self._missing | {reason_id}
+                if missing not in reasons
+            }
+        return reasons.get(reason_id)
+
+    def invalidate(self) -> None:
+        """Drop the cached table so the next lookup reloads it."""
+        self._reasons = {}
+        self._missing = set()
+        self._expires_at = 0.0
+
+
+# Process-wide cancellation reason cache shared by all routers
+cancellation_reason_cache = CancellationReasonCache(ttl=CANCELLATION_REASON_CACHE_TTL)
+
+
+@event.listens_for(CancellationReason, "after_insert")
+@event.listens_for(CancellationReason, "after_update")
+@event.listens_for(CancellationReason, "after_delete")
+def invalidate_cancellation_reason_cache(
+    mapper, connection, target: CancellationReason
+) -> None:
+    """Drop the cached cancellation reasons when this process changes one."""
+    cancellation_reason_cache.invalidate()
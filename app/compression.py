@@ -0,0 +1,232 @@
+"""
+Response Compression for Restaurant Booking API.
+
+This module provides an ASGI middleware that compresses response bodies
+negotiated through Accept-Encoding. Only responses whose content type is on
+an allow-list and whose body reaches a minimum size are compressed, so small
+responses do not pay the compression cost. gzip is always available; brotli
+and zstd are used when their optional packages are installed
+(``requirements-compression.txt``).
+
+Compressed responses carry a weak ETag, since their bytes differ from the
+uncompressed representation; If-None-Match evaluation already uses the weak
+comparison, so conditional requests keep working.
+
+Author: AI Assistant
+"""
+
+import os
+import zlib
+from typing import Dict, List, Optional, Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # Optional: pip install -r requirements-compression.txt
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # Optional: pip install -r requirements-compression.txt
+    zstandard = None
+
+# Bodies smaller than this many bytes are sent uncompressed
+COMPRESSION_MINIMUM_SIZE = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))
+
+# Media types to compress; entries ending in "/" match a whole type family
+COMPRESSION_CONTENT_TYPES = [
+    media_type.strip()
+    for media_type in os.getenv(
+        "COMPRESSION_CONTENT_TYPES", "application/json,application/x-ndjson,text/"
+    ).split(",")
+    if media_type.strip()
+]
+
+# Encodings in order of server preference; an empty value disables compression
+COMPRESSION_ENCODINGS = [
+    encoding.strip()
+    for encoding in os.getenv("COMPRESSION_ENCODINGS", "br,zstd,gzip").split(",")
+    if encoding.strip()
+]
+
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+COMPRESSION_ZSTD_LEVEL = int(os.getenv("COMPRESSION_ZSTD_LEVEL", "3"))
+
+
+def available_encodings() -> List[str]:
+    """Return the content codings this process can produce."""
+    encodings = ["gzip"]
+    if brotli is not None:
+        encodings.append("br")
+    if zstandard is not None:
+        encodings.append("zstd")
+    return encodings
+
+
+class Compressor:
+    """Incremental compressor for one response body."""
+
+    def __init__(self, encoding: str) -> None:
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=COMPRESSION_BROTLI_QUALITY)
+        elif encoding == "zstd":
+            self._compressor = zstandard.ZstdCompressor(
+                level=COMPRESSION_ZSTD_LEVEL
+            ).compressobj()
+        else:
+            # wbits 16 + MAX_WBITS writes a gzip header and trailer
+            self._compressor = zlib.compressobj(
+                COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+            )
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk; output may be buffered until finish()."""
+        if self.encoding == "br":
+            return self._compressor.process(data)
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        """Return the remaining compressed output and end the stream."""
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush()
+
+
+def negotiate_encoding(
+    accept_encoding: Optional[str], encodings: Sequence[str]
+) -> Optional[str]:
+    """
+    Choose a content coding from an Accept-Encoding header.
+
+    Codings the client rates q=0 are never chosen. Among the acceptable
+    ones the server's preference order wins, which keeps the choice stable
+    across clients that list codings differently.
+
+    Args:
+        accept_encoding: Accept-Encoding header value, if any
+        encodings: Codings the server can produce, most preferred first
+
+    Returns:
+        The chosen coding, or None to send the body uncompressed
+    """
+    if not accept_encoding:
+        return None
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        weight = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip().lower() == "q":
+            try:
+                weight = float(value)
+            except ValueError:
+                weight = 0.0
+        if coding:
+            weights[coding.strip().lower()] = weight
+    for encoding in encodings:
+        if weights.get(encoding, weights.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing eligible response bodies.
+
+    Works on buffered and streaming responses alike: a body that arrives in
+    one message is compressed only if it reaches ``minimum_size``, while a
+    streamed body is compressed chunk by chunk as it is sent.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = COMPRESSION_MINIMUM_SIZE,
+        content_types: Sequence[str] = tuple(COMPRESSION_CONTENT_TYPES),
+        encodings: Sequence[str] = tuple(COMPRESSION_ENCODINGS)
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.content_types = tuple(content_types)
+        supported = available_encodings()
+        self.encodings = [encoding for encoding in encodings if encoding in supported]
+
+    def compressible(self, content_type: Optional[str]) -> bool:
+        """Check a Content-Type header against the allow-list."""
+        if not content_type:
+            return False
+        media_type = content_type.split(";")[0].strip().lower()
+        return any(
+            media_type == allowed
+            or (allowed.endswith("/") and media_type.startswith(allowed))
+            for allowed in self.content_types
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.encodings:
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(
+            Headers(scope=scope).get("accept-encoding"), self.encodings
+        )
+        start: Optional[Message] = None
+        compressor: Optional[Compressor] = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, compressor, passthrough
+            if message["type"] == "http.response.start":
+                # Held back until the first body chunk shows the body size
+                start = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if compressor is None:
+                headers = MutableHeaders(raw=start["headers"])
+                eligible = (
+                    self.compressible(headers.get("content-type"))
+                    and "content-encoding" not in headers
+                )
+                if eligible:
+                    headers.add_vary_header("Accept-Encoding")
+                if (
+                    not eligible
+                    or encoding is None
+                    or (not more_body and len(body) < self.minimum_size)
+                ):
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+
+                compressor = Compressor(encoding)
+                headers["Content-Encoding"] = encoding
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    headers["ETag"] = f"W/{etag}"
+                del headers["content-length"]
+                body = compressor.compress(body)
+                if not more_body:
+                    body += compressor.finish()
+                    headers["Content-Length"] = str(len(body))
+                await send(start)
+            else:
+                body = compressor.compress(body)
+                if not more_body:
+                    body += compressor.finish()
+
+            await send({
+                "type": "http.response.body", "body": body, "more_body": more_body
+            })
+
+        await self.app(scope, receive, send_compressed)
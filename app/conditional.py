@@ -0,0 +1,56 @@
+"""
+Conditional Request Helpers for Restaurant Booking API.
+
+This module builds strong ETags for read endpoints and evaluates
+If-None-Match headers, so polling clients get a bodiless 304 Not Modified
+response while the resource is unchanged.
+
+Author: AI Assistant
+"""
+
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Response
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a strong ETag from the values a representation depends on.
+
+    Args:
+        *parts: Values that change whenever the representation changes
+
+    Returns:
+        str: Quoted entity tag, e.g. ``"3f2a..."``
+    """
+    digest = hashlib.sha1("|".join(map(str, parts)).encode()).hexdigest()
+    return f'"{digest[:24]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against the current ETag.
+
+    Uses the weak comparison If-None-Match calls for, so ``W/"..."`` tags
+    match their strong counterpart.
+
+    Args:
+        if_none_match: Header value: ``*`` or a comma-separated list of tags
+        etag: Current entity tag of the resource
+
+    Returns:
+        bool: True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
+
+
+def not_modified(etag: str) -> Response:
+    """Build a 304 Not Modified response carrying the current ETag."""
+    return Response(status_code=304, headers={"ETag": etag})
@@ -1,34 +1,295 @@
 """
 Database Configuration and Session Management.
 
-This module sets up the SQLite database connection, session management,
-and declarative base for the restaurant booking mock API.
+This module sets up the database connection, session management, and
+declarative base for the restaurant booking mock API. A synchronous engine
+serves scripts such as database initialization, while an asyncio engine
+(aiosqlite or asyncpg) serves the async route handlers so queries do not
+block the event loop.
+
+The database is selected with the DATABASE_URL environment variable and
+defaults to the SQLite file in the project root. For server databases such as
+PostgreSQL the connection pool is configured with DB_POOL_SIZE,
+DB_MAX_OVERFLOW, DB_POOL_PRE_PING and DB_POOL_RECYCLE.
+
+SQLite connection pragmas are applied from a named tuning profile selected
+with the SQLITE_PROFILE environment variable ("default" or "production").
+Individual pragmas can be overridden with SQLITE_<PRAGMA> variables, e.g.
+SQLITE_SYNCHRONOUS=FULL or SQLITE_BUSY_TIMEOUT=10000.
 
 Author: AI Assistant
 """
 
-from typing import Generator
+import os
+import re
+import uuid
+from typing import (
+    Any, AsyncGenerator, Callable, Dict, Generator, Optional, Tuple, Union
+)
 
-from sqlalchemy import create_engine
+from fastapi import Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Engine, URL, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import NullPool, StaticPool
+
+# Database URL - defaults to a SQLite file in project root
+SQLALCHEMY_DATABASE_URL = os.getenv(
+    "DATABASE_URL", "sqlite:///./restaurant_booking.db"
+)
+
+# URL of a new private in-memory SQLite database, see create_engines()
+MEMORY_DATABASE_URL = "sqlite://"
+
+# asyncio driver used for each supported backend
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+# Connection pool settings for server databases (SQLite keeps its defaults)
+POOL_OPTIONS: Dict[str, Any] = {
+    "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+    "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower() in (
+        "1", "true", "yes"
+    ),
+    "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),  # seconds
+}
+
+
+def async_database_url(url: Union[str, URL]) -> URL:
+    """
+    Derive the asyncio driver URL for a database URL.
+
+    Args:
+        url: Synchronous database URL, e.g. ``postgresql://user@host/db``
+
+    Returns:
+        URL: The same database addressed through its asyncio driver
+
+    Raises:
+        ValueError: If the backend has no supported asyncio driver
+    """
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No asyncio driver configured for {backend!r} databases")
+    return url.set(drivername=ASYNC_DRIVERS[backend])
+
+
+def engine_options(url: Union[str, URL], asyncio: bool = False) -> Dict[str, Any]:
+    """
+    Build create_engine() keyword arguments appropriate for a database URL.
+
+    Args:
+        url: Database URL the engine will connect to
+        asyncio: Whether the options are for an asyncio engine
+
+    Returns:
+        Dict of engine options: SQLite gets its threading flag, server
+        databases get the configured QueuePool settings
+    """
+    if make_url(url).get_backend_name() == "sqlite":
+        if asyncio:
+            return {}
+        return {"connect_args": {"check_same_thread": False}}  # SQLite threading
+    return dict(POOL_OPTIONS)
+
+
+# asyncio URL for the same database, overridable with ASYNC_DATABASE_URL. Kept
+# as a URL object: str(URL) masks the password
+ASYNC_SQLALCHEMY_DATABASE_URL: Union[str, URL] = os.getenv(
+    "ASYNC_DATABASE_URL"
+) or async_database_url(SQLALCHEMY_DATABASE_URL)
+
+# Pragmas that can be tuned per profile or overridden from the environment
+SQLITE_PRAGMAS = (
+    "journal_mode", "synchronous", "mmap_size", "cache_size", "busy_timeout",
+    "temp_store"
+)
+
+# Named SQLite tuning profiles applied to every new connection
+SQLITE_PROFILES: Dict[str, Dict[str, str]] = {
+    # SQLite defaults: rollback journal, a single writer blocks all readers
+    "default": {},
+    # WAL lets readers proceed during writes; NORMAL only fsyncs at checkpoints
+    # busy_timeout comes first so switching to WAL also waits for locks
+    "production": {
+        "busy_timeout": "5000",  # Wait up to 5s for a lock before failing
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": str(256 * 1024 * 1024),  # 256 MB memory-mapped I/O
+        "cache_size": "-65536",  # Negative value is in KiB, i.e. 64 MB
+        "temp_store": "MEMORY",
+    },
+}
+
+
+def sqlite_pragmas(profile: Optional[str] = None) -> Dict[str, str]:
+    """
+    Resolve the SQLite pragmas for a tuning profile.
+
+    Args:
+        profile: Profile name; defaults to the SQLITE_PROFILE environment
+            variable, or "default" when unset
+
+    Returns:
+        Dict mapping pragma names to values, including any SQLITE_<PRAGMA>
+        environment overrides
+
+    Raises:
+        ValueError: If the profile is unknown or an override is malformed
+    """
+    profile = profile or os.getenv("SQLITE_PROFILE", "default")
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(
+            f"Unknown SQLITE_PROFILE {profile!r}, "
+            f"expected one of {sorted(SQLITE_PROFILES)}"
+        )
+
+    pragmas = dict(SQLITE_PROFILES[profile])
+    for name in SQLITE_PRAGMAS:
+        override = os.getenv(f"SQLITE_{name.upper()}")
+        if override:
+            if not re.fullmatch(r"-?\w+", override):
+                raise ValueError(
+                    f"Invalid value for SQLITE_{name.upper()}: {override!r}"
+                )
+            pragmas[name] = override
+    return pragmas
+
+
+def apply_sqlite_pragmas(target: Engine, pragmas: Dict[str, str]) -> None:
+    """
+    Run the given pragmas on every new connection opened by an engine.
+
+    Args:
+        target: Synchronous engine (use ``async_engine.sync_engine`` for
+            asyncio engines)
+        pragmas: Pragma names and values, as returned by sqlite_pragmas()
+    """
+    if not pragmas:
+        return
+
+    @event.listens_for(target, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
 
-# SQLite database URL - creates file in project root
-SQLALCHEMY_DATABASE_URL = "sqlite:///./restaurant_booking.db"
 
-# Create SQLAlchemy engine with SQLite-specific configuration
+def async_session_factory(bind: AsyncEngine) -> async_sessionmaker:
+    """
+    Build the asyncio session factory used by the API for an engine.
+
+    Args:
+        bind: asyncio engine sessions connect through
+
+    Returns:
+        async_sessionmaker: Factory for sessions whose objects stay readable
+        after commit
+    """
+    return async_sessionmaker(
+        bind=bind,
+        autoflush=False,
+        expire_on_commit=False  # Objects stay readable after commit without I/O
+    )
+
+
+def create_engines(url: Union[str, URL]) -> Tuple[Engine, AsyncEngine]:
+    """
+    Create a sync and an asyncio engine for a database owned by one app.
+
+    Used by app.main.create_app() to bind test and benchmark servers to their
+    own database. The asyncio engine does not pool connections, because
+    clients such as TestClient run each request on a new event loop and
+    asyncio driver connections cannot be reused across loops. SQLite
+    connections get the SQLITE_PROFILE pragmas, like the application's.
+
+    MEMORY_DATABASE_URL (``sqlite://``) creates a new in-memory database that
+    both engines share: a uniquely named database in SQLite's shared cache,
+    kept alive by the sync engine's single StaticPool connection until the
+    engine is disposed. Nothing is written to disk, but the shared cache locks
+    whole tables and reports a conflicting write immediately instead of
+    waiting for busy_timeout, so it suits one client at a time; use a
+    temporary file for concurrent writers.
+
+    Args:
+        url: Synchronous database URL, or MEMORY_DATABASE_URL
+
+    Returns:
+        Tuple of (sync engine, asyncio engine) on the same database
+    """
+    url = make_url(url)
+    options = engine_options(url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        url = url.set(
+            database=f"file:memory-{uuid.uuid4().hex}",
+            query={"mode": "memory", "cache": "shared", "uri": "true"}
+        )
+        options["poolclass"] = StaticPool
+
+    sync_engine = create_engine(url, **options)
+    async_engine = create_async_engine(async_database_url(url), poolclass=NullPool)
+    if sync_engine.dialect.name == "sqlite":
+        pragmas = sqlite_pragmas()
+        apply_sqlite_pragmas(sync_engine, pragmas)
+        apply_sqlite_pragmas(async_engine.sync_engine, pragmas)
+    return sync_engine, async_engine
+
+
+# Create SQLAlchemy engine with backend-specific configuration
 engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False}  # Required for SQLite threading
+    SQLALCHEMY_DATABASE_URL, **engine_options(SQLALCHEMY_DATABASE_URL)
 )
 
-# Create session factory
+# Create async SQLAlchemy engine used by the API routers
+async_engine = create_async_engine(
+    ASYNC_SQLALCHEMY_DATABASE_URL,
+    **engine_options(ASYNC_SQLALCHEMY_DATABASE_URL, asyncio=True)
+)
+
+# Tune both engines with the configured SQLite profile
+if engine.dialect.name == "sqlite":
+    SQLITE_PRAGMA_SETTINGS = sqlite_pragmas()
+    apply_sqlite_pragmas(engine, SQLITE_PRAGMA_SETTINGS)
+    apply_sqlite_pragmas(async_engine.sync_engine, SQLITE_PRAGMA_SETTINGS)
+
+# Create session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_session_factory(async_engine)
 
 # Create declarative base for all models
 Base = declarative_base()
 
 
+def conflict_insert(dialect_name: str) -> Callable[..., Any]:
+    """
+    Return the dialect's insert() construct supporting ON CONFLICT clauses.
+
+    Args:
+        dialect_name: Name of the database dialect, e.g. ``engine.dialect.name``
+
+    Returns:
+        The ``insert`` function from the SQLite or PostgreSQL dialect
+
+    Raises:
+        ValueError: If the dialect has no ON CONFLICT support here
+    """
+    if dialect_name == "postgresql":
+        return postgresql.insert
+    if dialect_name == "sqlite":
+        return sqlite.insert
+    raise ValueError(f"ON CONFLICT inserts are not supported on {dialect_name!r}")
+
+
 def get_db() -> Generator[Session, None, None]:
     """
     Database session dependency for FastAPI.
@@ -53,3 +314,34 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async database session dependency for FastAPI.
+
+    Alternate to get_db for async route handlers. Queries are awaited on the
+    aiosqlite driver, so concurrent requests overlap their I/O instead of
+    blocking the event loop. Sessions come from the serving app's
+    ``state.async_session_factory`` when set, as on apps created with
+    create_app() for their own database, and from AsyncSessionLocal otherwise.
+
+    Args:
+        request: Incoming request, identifying the app serving it
+
+    Yields:
+        AsyncSession: SQLAlchemy asyncio database session
+
+    Example:
+        Use as a FastAPI dependency:
+        ```python
+        @app.get("/example")
+        async def example_endpoint(db: AsyncSession = Depends(get_async_db)):
+            result = await db.execute(select(Restaurant))
+        ```
+    """
+    session_factory = getattr(
+        request.app.state, "async_session_factory", AsyncSessionLocal
+    )
+    async with session_factory() as db:
+        yield db
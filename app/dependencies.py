@@ -0,0 +1,46 @@
+"""
+Shared FastAPI Dependencies for Restaurant Booking API.
+
+This module provides dependencies used by more than one router.
+
+Author: AI Assistant
+"""
+
+from fastapi import Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache import CachedRestaurant, restaurant_cache
+from app.database import get_async_db
+from app.models import Restaurant
+
+
+async def get_restaurant(
+    restaurant_name: str,
+    db: AsyncSession = Depends(get_async_db)
+) -> CachedRestaurant:
+    """
+    Resolve the restaurant named in the request path.
+
+    Served from the process-wide restaurant cache; the database is only
+    queried on a cache miss.
+
+    Args:
+        restaurant_name: The name of the restaurant from the URL path
+        db: Async database session dependency
+
+    Returns:
+        CachedRestaurant: Snapshot of the restaurant record
+
+    Raises:
+        HTTPException: 404 if restaurant not found
+    """
+    restaurant = restaurant_cache.get(restaurant_name)
+    if restaurant is None:
+        record = await db.scalar(
+            select(Restaurant).where(Restaurant.name == restaurant_name)
+        )
+        if not record:
+            raise HTTPException(status_code=404, detail="Restaurant not found")
+        restaurant = restaurant_cache.put(record)
+    return restaurant
@@ -8,24 +8,152 @@ restaurants, availability slots, and cancellation reasons.
 Author: AI Assistant
 """
 
-import random
-from datetime import time, datetime, timedelta
+import os
+import sqlite3
+from datetime import time, datetime
+from pathlib import Path
+from typing import Optional, Union
+
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect, select
+from sqlalchemy.engine import Engine
+
+from app.database import engine
+from app.models import Restaurant
+from app.seed import seed_database
+
+# alembic.ini lives in the project root, next to the migrations directory
+ALEMBIC_INI = Path(__file__).resolve().parent.parent / "alembic.ini"
+
+# Revision matching the schema created by create_all before migrations existed
+BASELINE_REVISION = "0001"
+
+# Lunch and dinner sittings offered by the sample restaurant every day
+SAMPLE_TIMES = [
+    time(12, 0),   # 12:00 PM
+    time(12, 30),  # 12:30 PM
+    time(13, 0),   # 1:00 PM
+    time(13, 30),  # 1:30 PM
+    time(19, 0),   # 7:00 PM
+    time(19, 30),  # 7:30 PM
+    time(20, 0),   # 8:00 PM
+    time(20, 30),  # 8:30 PM
+]
+
+# Seed for the sample data, so every fresh database gets the same slots
+SAMPLE_DATA_SEED = 0
+
+# Prebuilt SQLite database restored on startup in place of migrating and seeding
+DATABASE_SNAPSHOT = os.getenv("DATABASE_SNAPSHOT")
+
+# Set when the database was prepared before the server started, e.g. once by
+# the multi-worker launcher, so each worker's startup skips it
+DATABASE_PREPARED = os.getenv("DATABASE_PREPARED", "").lower() in ("1", "true", "yes")
+
+
+def alembic_config() -> Config:
+    """
+    Build the Alembic configuration used to migrate the application database.
+
+    Returns:
+        Config: Alembic config with an absolute script location, so migrations
+        can run regardless of the current working directory
+    """
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option(
+        "script_location", str(ALEMBIC_INI.parent / "migrations")
+    )
+    config.attributes["configure_logger"] = False
+    return config
+
+
+def create_tables(bind: Optional[Engine] = None) -> None:
+    """
+    Bring the database schema up to date by running Alembic migrations.
+
+    Databases created by ``Base.metadata.create_all`` before migrations were
+    introduced have tables but no ``alembic_version``; they are stamped at the
+    baseline revision first so only the newer migrations are applied.
+
+    Args:
+        bind: Engine to migrate; defaults to the application engine
+    """
+    config = alembic_config()
+    with (bind or engine).begin() as connection:
+        config.attributes["connection"] = connection
+        tables = inspect(connection).get_table_names()
+
+        if "alembic_version" not in tables and "restaurants" in tables:
+            command.stamp(config, BASELINE_REVISION)
+
+        command.upgrade(config, "head")
+
+
+def restore_snapshot(
+    snapshot: Union[str, Path], bind: Optional[Engine] = None
+) -> None:
+    """
+    Replace the database contents with a prebuilt snapshot.
 
-from app.database import engine, SessionLocal
-from app.models import Base, Restaurant, AvailabilitySlot, CancellationReason
+    The snapshot is any SQLite database migrated to the current revision,
+    e.g. one written by ``python -m app.seed``. It is copied page by page with
+    the SQLite online backup API, so its tables, indexes and ANALYZE
+    statistics arrive ready to use, without the schema inspection, migration
+    and seeding queries of a normal start. Only the snapshot's Alembic
+    revision is checked.
 
+    Args:
+        snapshot: Path of the snapshot database file
+        bind: SQLite engine to restore into; defaults to the application engine
 
-def create_tables() -> None:
+    Raises:
+        RuntimeError: If the target is not SQLite or the snapshot is missing
+            or not at the current migration head
     """
-    Create all database tables based on SQLAlchemy models.
+    bind = bind or engine
+    if bind.dialect.name != "sqlite":
+        raise RuntimeError("Database snapshots can only be restored into SQLite")
+    if not Path(snapshot).is_file():
+        raise RuntimeError(f"Database snapshot {snapshot} does not exist")
 
-    This function creates the database schema by calling SQLAlchemy's
-    metadata.create_all() method.
+    source = sqlite3.connect(f"file:{snapshot}?mode=ro", uri=True)
+    try:
+        revision = source.execute("SELECT version_num FROM alembic_version").fetchone()
+        head = ScriptDirectory.from_config(alembic_config()).get_current_head()
+        if revision is None or revision[0] != head:
+            raise RuntimeError(
+                f"Database snapshot {snapshot} is not at migration head {head}; "
+                "rebuild it"
+            )
+        target = bind.raw_connection()
+        try:
+            source.backup(target.driver_connection)
+        finally:
+            target.close()
+    finally:
+        source.close()
+
+
+def prepare_database(bind: Optional[Engine] = None) -> None:
     """
-    Base.metadata.create_all(bind=engine)
+    Make the database ready to serve.
 
+    Restores DATABASE_SNAPSHOT when set; otherwise applies pending migrations
+    and seeds the sample data if the database is empty.
 
-def init_sample_data() -> None:
+    Args:
+        bind: Engine to prepare; defaults to the application engine
+    """
+    if DATABASE_SNAPSHOT:
+        restore_snapshot(DATABASE_SNAPSHOT, bind)
+    else:
+        create_tables(bind)
+        init_sample_data(bind)
+
+
+def init_sample_data(bind: Optional[Engine] = None) -> None:
     """
     Initialize database with sample data for testing.
 
@@ -34,91 +162,37 @@ def init_sample_data() -> None:
 
     Sample data includes:
     - A restaurant named "TheHungryUnicorn"
-    - 30 days of availability slots with lunch and dinner times
+    - 30 days of availability slots with lunch and dinner times, 80% of them
+      available; the same slots are unavailable on every run
     - 5 predefined cancellation reasons
 
+    Larger datasets for load testing are generated with ``python -m app.seed``.
+
+    Args:
+        bind: Engine to seed; defaults to the application engine
+
     Raises:
         Exception: If database operations fail (logged and rolled back)
     """
-    db = SessionLocal()
-
     try:
-        # Check if data already exists
-        if db.query(Restaurant).first():
-            print("Sample data already exists, skipping initialization")
-            return
-
-        # Create sample restaurant
-        restaurant = Restaurant(
-            name="TheHungryUnicorn",
-            microsite_name="TheHungryUnicorn"
-        )
-        db.add(restaurant)
-        db.commit()
-        db.refresh(restaurant)
-
-        # Create sample availability slots for the next 30 days
-        sample_times = [
-            time(12, 0),   # 12:00 PM
-            time(12, 30),  # 12:30 PM
-            time(13, 0),   # 1:00 PM
-            time(13, 30),  # 1:30 PM
-            time(19, 0),   # 7:00 PM
-            time(19, 30),  # 7:30 PM
-            time(20, 0),   # 8:00 PM
-            time(20, 30),  # 8:30 PM
-        ]
-
-        start_date = datetime.now().date()
-
-        for i in range(30):  # Next 30 days
-            current_date = start_date + timedelta(days=i)
-            for slot_time in sample_times:
-                # Randomly make some slots unavailable
-                available = random.random() > 0.2  # 80% availability
-
-                slot = AvailabilitySlot(
-                    restaurant_id=restaurant.id,
-                    date=current_date,
-                    time=slot_time,
-                    max_party_size=8,
-                    available=available
-                )
-                db.add(slot)
-
-        # Create sample cancellation reasons
-        cancellation_reasons = [
-            {
-                "id": 1,
-                "reason": "Customer Request",
-                "description": "Customer requested cancellation"
-            },
-            {
-                "id": 2,
-                "reason": "Restaurant Closure",
-                "description": "Restaurant temporarily closed"
-            },
-            {
-                "id": 3,
-                "reason": "Weather",
-                "description": "Cancelled due to weather conditions"
-            },
-            {"id": 4, "reason": "Emergency", "description": "Emergency cancellation"},
-            {"id": 5, "reason": "No Show", "description": "Customer did not show up"}
-        ]
-
-        for reason_data in cancellation_reasons:
-            reason = CancellationReason(**reason_data)
-            db.add(reason)
-
-        db.commit()
+        with (bind or engine).begin() as connection:
+            # Check if data already exists
+            if connection.scalar(select(Restaurant.id).limit(1)) is not None:
+                print("Sample data already exists, skipping initialization")
+                return
+
+            seed_database(
+                connection,
+                start_date=datetime.now().date(),
+                times=SAMPLE_TIMES,
+                days=30,
+                unavailable_ratio=0.2,
+                seed=SAMPLE_DATA_SEED
+            )
         print("Database initialized with sample data successfully!")
 
     except Exception as e:
         print(f"Error initializing database: {e}")
-        db.rollback()
-    finally:
-        db.close()
 
 
 if __name__ == "__main__":
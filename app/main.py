@@ -5,47 +5,170 @@ A complete FastAPI-based mock server that simulates a restaurant booking system.
 This server provides realistic endpoints for availability checking, booking creation,
 booking management, and cancellation operations.
 
+create_app() builds server instances; ``app`` is the one serving DATABASE_URL.
+Tests and benchmarks create their own, bound to in-memory or temporary
+databases.
+
 Author: AI Assistant
 Version: 1.0.0
 """
 
-from fastapi import FastAPI
+from typing import Optional, Tuple
+
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
 from app.routers import availability, booking
-from app.database import engine
-from app.models import Base
+from app.compression import CompressionMiddleware
+from app.database import (
+    AsyncSessionLocal, async_engine, async_session_factory, create_engines, engine
+)
+from app.metrics import (
+    METRICS_CONTENT_TYPE, METRICS_ENABLED, Metrics, MetricsMiddleware
+)
+from app.profiling import PROFILING_ENABLED, ProfilingMiddleware
+from app.query_stats import (
+    DEBUG, SLOW_QUERY_MS, QueryStatsMiddleware, instrument_engine
+)
+from app.occupancy import OCCUPANCY_INDEX_ENABLED, occupancy_index
+from app.maintenance import MaintenanceScheduler, maintenance_scheduler
 import app.init_db as init_db
 
-# Create database tables on startup
-Base.metadata.create_all(bind=engine)
-
-app = FastAPI(
-    title="Restaurant Booking Mock API",
-    description=(
-        "A complete mock restaurant booking management system built with FastAPI "
-        "and SQLite. Provides realistic endpoints for testing applications."
-    ),
-    version="1.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc"
-)
 
-# Include API routers
-app.include_router(availability.router)
-app.include_router(booking.router)
+def create_app(
+    database_url: Optional[str] = None,
+    engines: Optional[Tuple[Engine, AsyncEngine]] = None,
+    background_jobs: bool = True
+) -> FastAPI:
+    """
+    Build an instance of the mock API server.
 
+    Without arguments the app serves the application database (DATABASE_URL).
+    Given a ``database_url`` it gets a database of its own instead, e.g.
+    MEMORY_DATABASE_URL for a private in-memory SQLite database or a
+    temporary file, which its startup hook migrates and seeds through
+    init_db and its shutdown hook disposes. Given ``engines`` it serves a
+    database the caller has already prepared and will dispose, such as a
+    test fixture's, and leaves its contents alone.
 
-@app.on_event("startup")
-async def startup_event() -> None:
-    """
-    Initialize database with sample data on application startup.
+    The restaurant caches and the occupancy index are process-wide, so only
+    one app per process should be serving requests at a time; isolated
+    servers running in parallel belong in separate processes, e.g. the
+    workers of ``pytest -n auto``.
 
-    This function is called once when the FastAPI application starts.
-    It ensures the database contains sample restaurant data and availability slots.
+    Args:
+        database_url: URL of a database owned by this app
+        engines: (sync engine, asyncio engine) of a database owned by the caller
+        background_jobs: Whether to run the availability maintenance job
+
+    Returns:
+        FastAPI: The configured application
     """
-    init_db.init_sample_data()
+    app = FastAPI(
+        title="Restaurant Booking Mock API",
+        description=(
+            "A complete mock restaurant booking management system built with "
+            "FastAPI and SQLite. Provides realistic endpoints for testing "
+            "applications."
+        ),
+        version="1.0.0",
+        docs_url="/docs",
+        redoc_url="/redoc",
+        # Responses are rendered with orjson instead of the stdlib json module
+        default_response_class=ORJSONResponse
+    )
+
+    # Compress large JSON responses for clients that accept it
+    app.add_middleware(CompressionMiddleware)
+
+    # Include API routers
+    app.include_router(availability.router)
+    app.include_router(booking.router)
+    app.add_api_route("/", root, summary="API Information", tags=["Root"])
+
+    owns_database = database_url is not None
+    if owns_database:
+        engines = create_engines(database_url)
+    if engines is None:
+        app.state.engine = None
+        app.state.async_session_factory = AsyncSessionLocal
+        app.state.maintenance_scheduler = maintenance_scheduler
+    else:
+        app.state.engine, app.state.async_engine = engines
+        app.state.async_session_factory = async_session_factory(engines[1])
+        # Only one process serves this database, so no lock file is needed
+        app.state.maintenance_scheduler = MaintenanceScheduler(
+            app.state.async_session_factory, lock_file=None
+        )
+
+    sync_engine, served_async_engine = engines or (engine, async_engine)
+
+    # Attribute SQL statements to requests, for debug headers and slow queries
+    if DEBUG or SLOW_QUERY_MS > 0:
+        instrument_engine(served_async_engine.sync_engine, SLOW_QUERY_MS)
+        app.add_middleware(QueryStatsMiddleware, headers=DEBUG)
+
+    # Record request metrics around compression and SQL tallies, so latency
+    # includes their work; only the opt-in profiler wraps this
+    if METRICS_ENABLED:
+        app.state.metrics = Metrics()
+        app.state.metrics.add_engine("sync", sync_engine)
+        app.state.metrics.add_engine("async", served_async_engine.sync_engine)
+        app.add_middleware(MetricsMiddleware, metrics=app.state.metrics)
+        app.add_api_route("/metrics", metrics, include_in_schema=False)
+        app.state.metrics.register_routes(
+            route for route in app.routes if isinstance(route, APIRoute)
+        )
+
+    # Profile requests that ask for it; outermost, so profiles cover everything
+    if PROFILING_ENABLED:
+        app.add_middleware(ProfilingMiddleware)
+
+    async def startup_event() -> None:
+        """
+        Migrate and initialize the database with sample data on application startup.
+
+        This function is called once when the FastAPI application starts.
+        It applies pending schema migrations, ensures the database contains
+        sample restaurant data and availability slots, and warms the in-memory
+        slot occupancy index from the bookings table. When DATABASE_SNAPSHOT is
+        set, the prebuilt snapshot is restored instead of migrating and seeding.
+        Finally it starts the background job that rolls the availability
+        window forward.
+
+        Under the multi-worker launcher the database is prepared once before
+        the workers start (DATABASE_PREPARED) and the occupancy index is
+        disabled (OCCUPANCY_INDEX), since each worker would only see its own
+        bookings. Databases passed in as ``engines`` are not prepared.
+        """
+        if app.state.engine is None:
+            if not init_db.DATABASE_PREPARED:
+                init_db.prepare_database()
+        elif owns_database:
+            init_db.prepare_database(app.state.engine)
+        if OCCUPANCY_INDEX_ENABLED:
+            async with app.state.async_session_factory() as db:
+                await occupancy_index.rebuild(db)
+        if background_jobs:
+            app.state.maintenance_scheduler.start()
+
+    async def shutdown_event() -> None:
+        """Stop the maintenance job and release the app's own database."""
+        await app.state.maintenance_scheduler.stop()
+        if app.state.engine is not None:
+            occupancy_index.clear()
+        if owns_database:
+            await app.state.async_engine.dispose()
+            app.state.engine.dispose()
+
+    app.add_event_handler("startup", startup_event)
+    app.add_event_handler("shutdown", shutdown_event)
+    return app
 
 
-@app.get("/", summary="API Information", tags=["Root"])
 async def root() -> dict:
     """
     Get API information and available endpoints.
@@ -62,10 +185,21 @@ async def root() -> dict:
                 "/api/ConsumerApi/v1/Restaurant/{restaurant_name}/"
                 "AvailabilitySearch"
             ),
+            "availability_calendar": (
+                "/api/ConsumerApi/v1/Restaurant/{restaurant_name}/"
+                "AvailabilityCalendar"
+            ),
             "create_booking": (
                 "/api/ConsumerApi/v1/Restaurant/{restaurant_name}/"
                 "BookingWithStripeToken"
             ),
+            "create_booking_batch": (
+                "/api/ConsumerApi/v1/Restaurant/{restaurant_name}/BookingBatch"
+            ),
+            "cancel_booking_batch": (
+                "/api/ConsumerApi/v1/Restaurant/{restaurant_name}/"
+                "BookingBatch/Cancel"
+            ),
             "cancel_booking": (
                 "/api/ConsumerApi/v1/Restaurant/{restaurant_name}/Booking/"
                 "{booking_reference}/Cancel"
@@ -82,3 +216,19 @@ async def root() -> dict:
             "redoc": "/redoc"
         }
     }
+
+
+async def metrics(request: Request) -> Response:
+    """
+    Expose request and connection pool metrics for Prometheus to scrape.
+
+    Returns:
+        Response: Metrics in the Prometheus text exposition format
+    """
+    return Response(
+        request.app.state.metrics.render(), media_type=METRICS_CONTENT_TYPE
+    )
+
+
+# Application serving the DATABASE_URL database, run by uvicorn as app.main:app
+app = create_app()
@@ -0,0 +1,345 @@
+"""
+Availability Window Maintenance for Restaurant Booking API.
+
+This module keeps every restaurant's booking window rolling forward while the
+hot tables stay bounded. Each run appends the days missing from the window,
+generated from the restaurant's weekly SlotTemplate rows, deletes slots for
+days long past and moves past bookings into archived_bookings. Work is done in
+batches of about MAINTENANCE_BATCH_SIZE rows, each committed on its own, so
+the job never holds write locks for long and an interrupted run simply
+continues on the next one.
+
+MaintenanceScheduler runs the job periodically in the background of the
+server process; ``python -m app.maintenance`` runs it once. When several
+worker processes serve the same database, MAINTENANCE_LOCK_FILE names a file
+lock that lets only one of them run the job at a time. Every pass also
+verifies the process's occupancy index, repairing it after writes by other
+processes.
+
+Author: AI Assistant
+"""
+
+import asyncio
+import os
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import IO, Callable, Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # No advisory file locks, e.g. on Windows
+    fcntl = None
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import AsyncSessionLocal
+from app.models import (
+    ArchivedBooking, AvailabilitySlot, Booking, Restaurant, SlotTemplate
+)
+from app.occupancy import occupancy_index
+
+# Days from today, inclusive, that always have availability slots
+AVAILABILITY_WINDOW_DAYS = int(os.getenv("AVAILABILITY_WINDOW_DAYS", "30"))
+
+# Past days whose slots are kept before being deleted
+SLOT_RETENTION_DAYS = int(os.getenv("SLOT_RETENTION_DAYS", "7"))
+
+# Past days whose bookings stay in the bookings table before being archived
+BOOKING_RETENTION_DAYS = int(os.getenv("BOOKING_RETENTION_DAYS", "90"))
+
+# Rows written or removed per transaction
+MAINTENANCE_BATCH_SIZE = int(os.getenv("MAINTENANCE_BATCH_SIZE", "500"))
+
+# Seconds between background runs; 0 disables the scheduler
+MAINTENANCE_INTERVAL = float(os.getenv("MAINTENANCE_INTERVAL", "3600"))
+
+# Lock file held by the one process running the scheduler; unset for a single
+# process
+MAINTENANCE_LOCK_FILE = os.getenv("MAINTENANCE_LOCK_FILE")
+
+
+async def extend_availability(
+    db: AsyncSession,
+    restaurant_id: int,
+    today: date,
+    window_days: int = AVAILABILITY_WINDOW_DAYS,
+    batch_size: int = MAINTENANCE_BATCH_SIZE
+) -> int:
+    """
+    Append the days missing from a restaurant's availability window.
+
+    Days after the restaurant's last slot date, up to ``window_days`` from
+    today, get one slot per template time for their weekday. Days are
+    committed whole, so the last slot date is always a complete day.
+
+    Args:
+        db: Async database session; batches are committed
+        restaurant_id: Restaurant to extend
+        today: First day of the window
+        window_days: Number of days the window covers
+        batch_size: Approximate number of slots per transaction
+
+    Returns:
+        int: Number of slots added
+    """
+    last_date = await db.scalar(
+        select(func.max(AvailabilitySlot.date))
+        .where(AvailabilitySlot.restaurant_id == restaurant_id)
+    )
+    day = today
+    if last_date is not None and last_date >= today:
+        day = last_date + timedelta(days=1)
+    end = today + timedelta(days=window_days - 1)
+
+    templates: Dict[int, List[Tuple[time, int]]] = defaultdict(list)
+    for weekday, slot_time, max_party_size in await db.execute(
+        select(SlotTemplate.weekday, SlotTemplate.time, SlotTemplate.max_party_size)
+        .where(SlotTemplate.restaurant_id == restaurant_id)
+        .order_by(SlotTemplate.weekday, SlotTemplate.time)
+    ):
+        templates[weekday].append((slot_time, max_party_size))
+    if not templates:
+        return 0
+
+    added = 0
+    rows: List[Dict] = []
+    days: List[date] = []
+    while day <= end:
+        rows.extend(
+            {
+                "restaurant_id": restaurant_id,
+                "date": day,
+                "time": slot_time,
+                "max_party_size": max_party_size,
+                "available": True,
+                "booked_count": 0,
+            }
+            for slot_time, max_party_size in templates[day.weekday()]
+        )
+        days.append(day)
+        day += timedelta(days=1)
+        if len(rows) >= batch_size or day > end:
+            if rows:
+                await db.execute(insert(AvailabilitySlot), rows)
+            await db.commit()
+            for changed in days:
+                occupancy_index.invalidate_slots(restaurant_id, changed)
+            added += len(rows)
+            rows, days = [], []
+    return added
+
+
+async def prune_slots(
+    db: AsyncSession,
+    restaurant_id: int,
+    before: date,
+    batch_size: int = MAINTENANCE_BATCH_SIZE
+) -> int:
+    """
+    Delete a restaurant's slots dated before a day, in batches.
+
+    The pruned days are marked stale in the occupancy index once their batch
+    is committed.
+
+    Args:
+        db: Async database session; batches are committed
+        restaurant_id: Restaurant to prune
+        before: Slots dated before this day are deleted
+        batch_size: Maximum slots deleted per transaction
+
+    Returns:
+        int: Number of slots deleted
+    """
+    removed = 0
+    while True:
+        rows = (await db.execute(
+            select(AvailabilitySlot.id, AvailabilitySlot.date)
+            .where(
+                AvailabilitySlot.restaurant_id == restaurant_id,
+                AvailabilitySlot.date < before
+            )
+            .limit(batch_size)
+        )).all()
+        if not rows:
+            return removed
+        await db.execute(
+            delete(AvailabilitySlot)
+            .where(AvailabilitySlot.id.in_([slot_id for slot_id, _ in rows]))
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        for changed in {slot_date for _, slot_date in rows}:
+            occupancy_index.invalidate_slots(restaurant_id, changed)
+        removed += len(rows)
+
+
+async def archive_bookings(
+    db: AsyncSession,
+    restaurant_id: int,
+    before: date,
+    batch_size: int = MAINTENANCE_BATCH_SIZE
+) -> int:
+    """
+    Move a restaurant's bookings dated before a day into archived_bookings.
+
+    Each batch is copied and deleted in one transaction, so a booking is
+    always in exactly one of the two tables. Confirmed bookings are taken out
+    of the occupancy index once their batch is committed.
+
+    Args:
+        db: Async database session; batches are committed
+        restaurant_id: Restaurant whose bookings to archive
+        before: Bookings visiting before this day are archived
+        batch_size: Maximum bookings moved per transaction
+
+    Returns:
+        int: Number of bookings archived
+    """
+    archived = 0
+    while True:
+        rows = (await db.execute(
+            select(Booking.__table__)
+            .where(Booking.restaurant_id == restaurant_id, Booking.visit_date < before)
+            .order_by(Booking.id)
+            .limit(batch_size)
+        )).mappings().all()
+        if not rows:
+            return archived
+        archived_at = datetime.utcnow()
+        await db.execute(
+            insert(ArchivedBooking.__table__),
+            [dict(row, archived_at=archived_at) for row in rows]
+        )
+        await db.execute(
+            delete(Booking)
+            .where(Booking.id.in_([row["id"] for row in rows]))
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        for row in rows:
+            if row["status"] == "confirmed":
+                occupancy_index.add(
+                    restaurant_id, row["visit_date"], row["visit_time"], delta=-1
+                )
+        archived += len(rows)
+
+
+async def run_maintenance(
+    db: AsyncSession, today: Optional[date] = None
+) -> Dict[str, int]:
+    """
+    Roll every restaurant's availability window forward to today.
+
+    Args:
+        db: Async database session; batches are committed
+        today: Current day; defaults to the local date
+
+    Returns:
+        Dict with the numbers of slots added, slots pruned and bookings archived
+    """
+    today = today or date.today()
+    totals = {"slots_added": 0, "slots_pruned": 0, "bookings_archived": 0}
+    restaurant_ids = (await db.scalars(
+        select(Restaurant.id).order_by(Restaurant.id)
+    )).all()
+    for restaurant_id in restaurant_ids:
+        totals["slots_added"] += await extend_availability(db, restaurant_id, today)
+        totals["slots_pruned"] += await prune_slots(
+            db, restaurant_id, today - timedelta(days=SLOT_RETENTION_DAYS)
+        )
+        totals["bookings_archived"] += await archive_bookings(
+            db, restaurant_id, today - timedelta(days=BOOKING_RETENTION_DAYS)
+        )
+    return totals
+
+
+class MaintenanceScheduler:
+    """
+    Runs run_maintenance() in a background task every ``interval`` seconds.
+
+    The first run starts immediately. A failed run is reported and retried at
+    the next interval; it never stops the server. With a ``lock_file``, a run
+    only happens in the process holding an exclusive lock on it; the others
+    try to take the lock at every interval, so one of them takes over if the
+    holder exits. Every process verifies and repairs its warm occupancy index
+    at each interval, whether or not it holds the lock.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+        interval: float = MAINTENANCE_INTERVAL,
+        lock_file: Optional[str] = MAINTENANCE_LOCK_FILE
+    ) -> None:
+        self.session_factory = session_factory
+        self.interval = interval
+        self.lock_file = lock_file
+        self.last_result: Optional[Dict[str, int]] = None
+        self._task: Optional[asyncio.Task] = None
+        self._lock: Optional[IO] = None
+
+    def start(self) -> None:
+        """Start the background task unless disabled or already running."""
+        if self.interval > 0 and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the background task, wait for it and release the lock."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._lock is not None:
+            self._lock.close()
+            self._lock = None
+
+    def holds_lock(self) -> bool:
+        """
+        Check whether this process may run the job, taking the lock if free.
+
+        Returns:
+            bool: True without a lock file, or once the lock is held
+        """
+        if self.lock_file is None or self._lock is not None:
+            return True
+        if fcntl is None:
+            return False
+        handle = open(self.lock_file, "a")
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            return False
+        self._lock = handle
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                async with self.session_factory() as db:
+                    if self.holds_lock():
+                        self.last_result = await run_maintenance(db)
+                    if occupancy_index.ready:
+                        await occupancy_index.verify(db, repair=True)
+            except Exception as e:
+                print(f"Availability maintenance failed: {e}")
+            await asyncio.sleep(self.interval)
+
+
+# Process-wide scheduler, started by the application startup hook
+maintenance_scheduler = MaintenanceScheduler()
+
+
+async def main() -> None:
+    async with AsyncSessionLocal() as db:
+        result = await run_maintenance(db)
+    for name, count in result.items():
+        print(f"{name:<20}{count:>10,}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,284 @@
+"""
+Prometheus Metrics for Restaurant Booking API.
+
+This module collects request metrics in memory and renders them in the
+Prometheus text exposition format for the ``/metrics`` endpoint:
+
+- ``http_requests_total``: requests by method, route and status code
+- ``http_request_duration_seconds``: latency histogram by method and route
+- ``http_requests_in_flight``: requests currently being served, by route
+- ``db_pool_*``: connection pool gauges for each registered engine
+
+Routes are labelled with their path template, e.g.
+``/api/ConsumerApi/v1/Restaurant/{restaurant_name}/AvailabilitySearch``, so
+the number of series stays bounded. Recording a request costs two clock reads
+and a few dict updates: the route is read from the scope after FastAPI has
+routed the request rather than matched again, and in-flight gauges are only
+counted when metrics are rendered.
+
+Metrics are kept per process. Under the multi-worker launcher each scrape
+reports the worker that served it.
+
+Author: AI Assistant
+"""
+
+import os
+import time
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Whether the app exposes /metrics and records request metrics
+METRICS_ENABLED = os.getenv("METRICS", "true").lower() in ("1", "true", "yes")
+
+# Upper bounds, in seconds, of the request latency histogram buckets
+METRICS_LATENCY_BUCKETS = [
+    float(bound)
+    for bound in os.getenv(
+        "METRICS_LATENCY_BUCKETS",
+        "0.005,0.01,0.025,0.05,0.1,0.25,0.5,1,2.5,5,10"
+    ).split(",")
+    if bound.strip()
+]
+
+# Media type of the Prometheus text exposition format; charset is appended
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4"
+
+# Route label of requests that matched no route
+UNMATCHED_ROUTE = "unmatched"
+
+
+def label_value(value: str) -> str:
+    """Escape a label value for the text exposition format."""
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def format_labels(**labels: str) -> str:
+    """Render labels as ``{name="value",...}``."""
+    return "{" + ",".join(
+        f'{name}="{label_value(str(value))}"' for name, value in labels.items()
+    ) + "}"
+
+
+def route_label(scope: Scope) -> str:
+    """Return the path template of the route FastAPI matched for a request."""
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+class Histogram:
+    """
+    Bucketed distribution of observed values.
+
+    Each observation increments one bucket; buckets are only made cumulative
+    when rendered, as Prometheus expects.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # Last bucket is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record a value in the first bucket whose bound is at least value."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """Return (le, count) pairs including all smaller buckets."""
+        pairs = []
+        total = 0
+        for bound, count in zip([*self.bounds, None], self.counts):
+            total += count
+            pairs.append(("+Inf" if bound is None else f"{bound:g}", total))
+        return pairs
+
+
+class Metrics:
+    """
+    Request and connection pool metrics of one application.
+
+    Args:
+        buckets: Latency histogram bucket bounds in seconds
+    """
+
+    def __init__(
+        self, buckets: Sequence[float] = tuple(METRICS_LATENCY_BUCKETS)
+    ) -> None:
+        self.buckets = sorted(buckets)
+        self.requests: Dict[Tuple[str, str, int], int] = {}
+        self.durations: Dict[Tuple[str, str], Histogram] = {}
+        self.active: Dict[int, Scope] = {}
+        self.engines: List[Tuple[str, Engine]] = []
+        self.checked_out: Dict[str, int] = {}
+
+    def register_routes(self, routes: Iterable[BaseRoute]) -> None:
+        """
+        Start empty latency histograms for every method of the given routes.
+
+        Registered routes are reported from the first scrape, before they
+        have served any requests.
+
+        Args:
+            routes: Routes of the application, e.g. its APIRoute instances
+        """
+        for route in routes:
+            for method in sorted(getattr(route, "methods", None) or ()):
+                if (method, route.path) not in self.durations:
+                    self.durations[(method, route.path)] = Histogram(self.buckets)
+
+    def observe(self, method: str, route: str, status: int, seconds: float) -> None:
+        """Record a completed request."""
+        key = (method, route, status)
+        self.requests[key] = self.requests.get(key, 0) + 1
+        histogram = self.durations.get((method, route))
+        if histogram is None:
+            histogram = self.durations[(method, route)] = Histogram(self.buckets)
+        histogram.observe(seconds)
+
+    def add_engine(self, name: str, engine: Engine) -> None:
+        """
+        Report an engine's connection pool under ``engine="<name>"``.
+
+        QueuePool engines report their own counters. Other pools, such as
+        the NullPool of asyncio SQLite engines, keep no counts, so checked-out
+        connections are counted from pool checkout and checkin events.
+
+        Args:
+            name: Label value identifying the engine
+            engine: Synchronous engine; use ``async_engine.sync_engine`` for
+                asyncio engines
+        """
+        self.engines.append((name, engine))
+        if isinstance(engine.pool, QueuePool):
+            return
+        self.checked_out[name] = 0
+
+        @event.listens_for(engine, "checkout")
+        def count_checkout(dbapi_connection, connection_record, connection_proxy):
+            self.checked_out[name] += 1
+
+        @event.listens_for(engine, "checkin")
+        def count_checkin(dbapi_connection, connection_record):
+            self.checked_out[name] -= 1
+
+    def in_flight(self) -> Dict[Tuple[str, str], int]:
+        """Count the requests being served, by method and route."""
+        counts = {key: 0 for key in self.durations}
+        for scope in list(self.active.values()):
+            key = (scope["method"], route_label(scope))
+            counts[key] = counts.get(key, 0) + 1
+        return counts
+
+    def pool_gauges(self) -> Dict[str, List[Tuple[str, int]]]:
+        """Collect pool gauge values by metric name as (engine, value) pairs."""
+        gauges: Dict[str, List[Tuple[str, int]]] = {
+            "size": [], "checked_out": [], "checked_in": [], "overflow": []
+        }
+        for name, engine in self.engines:
+            pool = engine.pool
+            if isinstance(pool, QueuePool):
+                gauges["size"].append((name, pool.size()))
+                gauges["checked_out"].append((name, pool.checkedout()))
+                gauges["checked_in"].append((name, pool.checkedin()))
+                gauges["overflow"].append((name, max(pool.overflow(), 0)))
+            else:
+                gauges["checked_out"].append((name, self.checked_out[name]))
+        return gauges
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines = [
+            "# HELP http_requests_total HTTP requests served.",
+            "# TYPE http_requests_total counter",
+        ]
+        for (method, route, status), count in sorted(self.requests.items()):
+            labels = format_labels(method=method, route=route, status=status)
+            lines.append(f"http_requests_total{labels} {count}")
+
+        lines += [
+            "# HELP http_request_duration_seconds HTTP request latency.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (method, route), histogram in sorted(self.durations.items()):
+            for le, count in histogram.cumulative():
+                labels = format_labels(method=method, route=route, le=le)
+                lines.append(f"http_request_duration_seconds_bucket{labels} {count}")
+            labels = format_labels(method=method, route=route)
+            lines += [
+                f"http_request_duration_seconds_sum{labels} {histogram.sum}",
+                f"http_request_duration_seconds_count{labels} {histogram.count}",
+            ]
+
+        lines += [
+            "# HELP http_requests_in_flight HTTP requests currently being served.",
+            "# TYPE http_requests_in_flight gauge",
+        ]
+        for (method, route), count in sorted(self.in_flight().items()):
+            labels = format_labels(method=method, route=route)
+            lines.append(f"http_requests_in_flight{labels} {count}")
+
+        descriptions = {
+            "size": "Connections the pool keeps open.",
+            "checked_out": "Connections currently in use.",
+            "checked_in": "Idle connections in the pool.",
+            "overflow": "Connections open beyond the pool size.",
+        }
+        for gauge, values in self.pool_gauges().items():
+            if not values:
+                continue
+            lines += [
+                f"# HELP db_pool_{gauge} {descriptions[gauge]}",
+                f"# TYPE db_pool_{gauge} gauge",
+            ]
+            lines.extend(
+                f"db_pool_{gauge}{format_labels(engine=name)} {value}"
+                for name, value in values
+            )
+        return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording the count, status and latency of each request.
+
+    Added outside the app's other middleware, so latency includes their
+    work, such as compression. Only the opt-in ProfilingMiddleware wraps it.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: Metrics) -> None:
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500  # Reported if the app fails before starting a response
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        active = self.metrics.active
+        key = id(scope)
+        active[key] = scope
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            del active[key]
+            self.metrics.observe(scope["method"], route_label(scope), status, elapsed)
@@ -12,7 +12,8 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 from sqlalchemy import (
-    Column, Integer, String, DateTime, Boolean, Date, Time, Text, ForeignKey
+    Column, Integer, String, DateTime, Boolean, Date, Time, Text, ForeignKey, Index,
+    UniqueConstraint
 )
 from sqlalchemy.orm import relationship
 
@@ -63,7 +64,7 @@ class Customer(Base):
         title (str): Customer title (Mr/Mrs/Ms/Dr)
         first_name (str): Customer's first name
         surname (str): Customer's surname
-        email (str): Customer's email address (indexed)
+        email (str): Customer's email address (unique, NULL when not given)
         mobile (str): Customer's mobile phone number
         phone (str): Customer's landline phone number
         created_at (datetime): Timestamp when customer was created
@@ -80,7 +81,7 @@ class Customer(Base):
     mobile = Column(String)
     phone_country_code = Column(String)
     phone = Column(String)
-    email = Column(String, index=True)
+    email = Column(String, unique=True, index=True)
     receive_email_marketing = Column(Boolean, default=False)
     receive_sms_marketing = Column(Boolean, default=False)
     group_email_marketing_opt_in_text = Column(Text)
@@ -116,6 +117,13 @@ class Booking(Base):
     """
 
     __tablename__ = "bookings"
+    __table_args__ = (
+        # Covers slot occupancy counts: equality on restaurant/date, grouped by time
+        Index(
+            "ix_bookings_restaurant_visit",
+            "restaurant_id", "visit_date", "visit_time", "status"
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     booking_reference = Column(String, unique=True, index=True, nullable=False)
@@ -152,10 +160,18 @@ class AvailabilitySlot(Base):
         time (time): Time slot
         max_party_size (int): Maximum party size for this slot
         available (bool): Whether the slot is available for booking
+        booked_count (int): Confirmed bookings holding a reservation in the slot
         created_at (datetime): Timestamp when slot was created
     """
 
     __tablename__ = "availability_slots"
+    __table_args__ = (
+        # Serves availability search: equality on restaurant/date, party size range
+        Index(
+            "ix_availability_slots_restaurant_date",
+            "restaurant_id", "date", "max_party_size"
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     restaurant_id = Column(Integer, ForeignKey("restaurants.id"), nullable=False)
@@ -163,12 +179,78 @@ class AvailabilitySlot(Base):
     time = Column(Time, nullable=False)
     max_party_size = Column(Integer, default=8)
     available = Column(Boolean, default=True)
+    booked_count = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationships
     restaurant = relationship("Restaurant", back_populates="availability_slots")
 
 
+class SlotTemplate(Base):
+    """
+    Weekly slot template from which new availability days are generated.
+
+    Each row offers one slot time on one day of the week. The maintenance job
+    turns a restaurant's templates into AvailabilitySlot rows as its booking
+    window rolls forward.
+
+    Attributes:
+        id (int): Primary key identifier
+        restaurant_id (int): Foreign key to restaurant
+        weekday (int): Day of the week, 0 = Monday
+        time (time): Slot time
+        max_party_size (int): Maximum party size for generated slots
+    """
+
+    __tablename__ = "slot_templates"
+    __table_args__ = (
+        UniqueConstraint(
+            "restaurant_id", "weekday", "time",
+            name="uq_slot_templates_restaurant_weekday_time"
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    restaurant_id = Column(Integer, ForeignKey("restaurants.id"), nullable=False)
+    weekday = Column(Integer, nullable=False)
+    time = Column(Time, nullable=False)
+    max_party_size = Column(Integer, nullable=False, default=8)
+
+
+class ArchivedBooking(Base):
+    """
+    Past booking moved out of the bookings table by the maintenance job.
+
+    Has the columns of Booking, keeping its original id, plus the time it was
+    archived. Archived bookings are kept for reporting and are no longer
+    served by the API.
+
+    Attributes:
+        id (int): Primary key, the booking's original id
+        booking_reference (str): Booking reference code
+        archived_at (datetime): Timestamp when the booking was archived
+    """
+
+    __tablename__ = "archived_bookings"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    booking_reference = Column(String, nullable=False, index=True)
+    restaurant_id = Column(Integer, nullable=False)
+    customer_id = Column(Integer, nullable=False)
+    visit_date = Column(Date, nullable=False)
+    visit_time = Column(Time, nullable=False)
+    party_size = Column(Integer, nullable=False)
+    channel_code = Column(String, nullable=False)
+    special_requests = Column(Text)
+    is_leave_time_confirmed = Column(Boolean)
+    room_number = Column(String)
+    status = Column(String)
+    cancellation_reason_id = Column(Integer)
+    created_at = Column(DateTime)
+    updated_at = Column(DateTime)
+    archived_at = Column(DateTime, default=datetime.utcnow)
+
+
 class CancellationReason(Base):
     """
     Cancellation reason model for tracking why bookings are cancelled.
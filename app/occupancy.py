@@ -0,0 +1,580 @@
+"""
+Slot Occupancy Queries for Restaurant Booking API.
+
+This module computes how many confirmed bookings occupy each availability
+slot. Occupancy for a day, or a range of days, is resolved in a single grouped
+query so the cost of an availability search does not grow with the number of
+slots or days.
+
+Once warmed at startup, the process-wide OccupancyIndex holds the same counts
+in memory together with each day's slots, so availability searches and
+calendars are answered without SQL. The booking router updates the counts
+after each committed create, update or cancel. Code that changes slots, such
+as bulk closures and the maintenance job, marks the affected days stale, and
+they are reloaded from the database on their next read. The index is per
+process: it is only correct while this process is the sole writer, and
+verify() compares it against the database and repairs drift from other
+writers, such as ``python -m app.seed --reset``. The maintenance scheduler
+runs it on every pass. Each day also carries a version that changes with its
+bookings and slots, which availability searches use as their ETag.
+
+Capacity is enforced separately by reserve_slot(), a guarded UPDATE on the
+slot's booked_count counter. The row it updates is the only thing locked, so
+concurrent bookings for different slots do not wait on each other, and
+bookings for the same slot can never exceed MAX_BOOKINGS_PER_SLOT.
+
+Author: AI Assistant
+"""
+
+import os
+import secrets
+from dataclasses import dataclass
+from datetime import date, time, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from sqlalchemy import Row, and_, case, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import AvailabilitySlot, Booking
+
+# Simple logic: allow up to 3 bookings per time slot
+MAX_BOOKINGS_PER_SLOT = 3
+
+# Whether the startup hook warms the occupancy index. Turn it off when several
+# processes write to the same database, as each would only see its own writes
+OCCUPANCY_INDEX_ENABLED = os.getenv("OCCUPANCY_INDEX", "true").lower() in (
+    "1", "true", "yes"
+)
+
+# Occupancy index key: (restaurant_id, visit_date, visit_time)
+SlotKey = Tuple[int, date, time]
+
+# Day key: (restaurant_id, date)
+DayKey = Tuple[int, date]
+
+
+@dataclass(frozen=True)
+class CachedSlot:
+    """
+    Immutable snapshot of the availability slot columns searches report.
+
+    Attributes:
+        date (date): Date of the slot
+        time (time): Time of the slot
+        available (bool): Whether the slot accepts bookings
+        max_party_size (int): Largest party the slot accepts, if limited
+    """
+
+    date: date
+    time: time
+    available: bool
+    max_party_size: Optional[int]
+
+
+# Slot as returned by slot_occupancy(): a row, or its snapshot from the index
+Slot = Union[AvailabilitySlot, CachedSlot]
+
+# Columns of the slots kept in the index, keyed by restaurant and date
+SLOT_COLUMNS = (
+    AvailabilitySlot.restaurant_id,
+    AvailabilitySlot.date,
+    AvailabilitySlot.time,
+    AvailabilitySlot.available,
+    AvailabilitySlot.max_party_size,
+)
+
+
+def group_slots(rows: Iterable[Row]) -> Dict[DayKey, List[CachedSlot]]:
+    """Group SLOT_COLUMNS rows, ordered by time, into slot lists per day."""
+    days: Dict[DayKey, List[CachedSlot]] = {}
+    for restaurant_id, slot_date, slot_time, available, max_party_size in rows:
+        days.setdefault((restaurant_id, slot_date), []).append(
+            CachedSlot(slot_date, slot_time, bool(available), max_party_size)
+        )
+    return days
+
+
+class OccupancyIndex:
+    """
+    In-memory count of confirmed bookings per slot, and each day's slots.
+
+    Counts are keyed by (restaurant_id, visit_date, visit_time) and slots by
+    (restaurant_id, date). The index is only consulted once ``ready``, i.e.
+    after rebuild() has loaded it from the database; until then callers fall
+    back to querying the database.
+    """
+
+    def __init__(self) -> None:
+        self._counts: Dict[SlotKey, int] = {}
+        self._versions: Dict[DayKey, int] = {}
+        self._day_slots: Dict[DayKey, List[CachedSlot]] = {}
+        self._stale_days: Set[DayKey] = set()
+        self._slot_summaries: Dict[DayKey, Tuple] = {}
+        self._generation = ""
+        self._writes = 0
+        self.ready = False
+
+    def count(self, restaurant_id: int, visit_date: date, visit_time: time) -> int:
+        """Return the number of confirmed bookings in a slot."""
+        return self._counts.get((restaurant_id, visit_date, visit_time), 0)
+
+    def version(self, restaurant_id: int, visit_date: date) -> Tuple[str, int]:
+        """
+        Return a version identifying the current availability of a day.
+
+        The version changes whenever a booking in the day changes or touch()
+        is called for it. The generation part is new on every rebuild, so
+        versions are never reused across rebuilds or process restarts.
+        """
+        return self._generation, self._versions.get((restaurant_id, visit_date), 0)
+
+    def touch(self, restaurant_id: int, visit_date: date) -> None:
+        """Mark a day's availability as changed."""
+        key = (restaurant_id, visit_date)
+        self._versions[key] = self._versions.get(key, 0) + 1
+        self._writes += 1
+
+    def invalidate_slots(self, restaurant_id: int, visit_date: date) -> None:
+        """
+        Mark a day's slots as changed, e.g. after closing or adding slots.
+
+        Call only after the slot change has been committed. The day's slots
+        are reloaded from the database when next read.
+        """
+        self.touch(restaurant_id, visit_date)
+        if self.ready:
+            self._stale_days.add((restaurant_id, visit_date))
+
+    def slots(
+        self,
+        restaurant_id: int,
+        start_date: date,
+        end_date: date,
+        party_size: int
+    ) -> List[Tuple[CachedSlot, int]]:
+        """
+        Return the indexed slots of a date range with their booking counts.
+
+        Days marked stale must be reloaded with load_day_slots() first.
+
+        Args:
+            restaurant_id: ID of the restaurant to search
+            start_date: First date to return slots for
+            end_date: Last date to return slots for, inclusive
+            party_size: Minimum party size the slot must accept
+
+        Returns:
+            List of (slot, confirmed booking count) tuples ordered by date and
+            time
+        """
+        occupancy = []
+        day = start_date
+        while day <= end_date:
+            for slot in self._day_slots.get((restaurant_id, day), ()):
+                if slot.max_party_size is not None and (
+                    slot.max_party_size >= party_size
+                ):
+                    occupancy.append(
+                        (slot, self._counts.get((restaurant_id, day, slot.time), 0))
+                    )
+            day += timedelta(days=1)
+        return occupancy
+
+    def stale_days(
+        self, restaurant_id: int, start_date: date, end_date: date
+    ) -> List[date]:
+        """Return the days of a date range whose slots must be reloaded."""
+        return sorted(
+            day for stale_id, day in self._stale_days
+            if stale_id == restaurant_id and start_date <= day <= end_date
+        )
+
+    async def load_day_slots(
+        self, db: AsyncSession, restaurant_id: int, days: Iterable[date]
+    ) -> None:
+        """
+        Reload the slots of some of a restaurant's days from the database.
+
+        If the index is written while the slots are read, the days stay
+        stale, as the read may predate the write, and are reloaded again on
+        their next read.
+
+        Args:
+            db: Async database session
+            restaurant_id: ID of the restaurant whose days to reload
+            days: Dates to reload
+        """
+        days = list(days)
+        writes = self._writes
+        result = await db.execute(
+            select(*SLOT_COLUMNS)
+            .where(
+                AvailabilitySlot.restaurant_id == restaurant_id,
+                AvailabilitySlot.date.in_(days)
+            )
+            .order_by(AvailabilitySlot.date, AvailabilitySlot.time)
+        )
+        loaded = group_slots(result.all())
+        for day in days:
+            key = (restaurant_id, day)
+            self._day_slots[key] = loaded.get(key, [])
+            if self._writes == writes:
+                self._stale_days.discard(key)
+
+    def add(
+        self,
+        restaurant_id: int,
+        visit_date: date,
+        visit_time: time,
+        delta: int = 1
+    ) -> None:
+        """
+        Adjust the confirmed booking count of a slot.
+
+        Call only after the corresponding booking change has been committed.
+
+        Args:
+            restaurant_id: ID of the booked restaurant
+            visit_date: Date of the slot
+            visit_time: Time of the slot
+            delta: Change in confirmed bookings, negative for cancellations
+        """
+        if not self.ready:
+            return
+        self.touch(restaurant_id, visit_date)
+        key = (restaurant_id, visit_date, visit_time)
+        remaining = self._counts.get(key, 0) + delta
+        if remaining > 0:
+            self._counts[key] = remaining
+        else:
+            self._counts.pop(key, None)
+
+    def move(self, old: SlotKey, new: SlotKey) -> None:
+        """Move one confirmed booking from one slot to another."""
+        if old != new:
+            self.add(*old, delta=-1)
+            self.add(*new)
+
+    async def load(self, db: AsyncSession) -> Dict[SlotKey, int]:
+        """
+        Count confirmed bookings per slot directly from the database.
+
+        Args:
+            db: Async database session
+
+        Returns:
+            Dict mapping slot keys to confirmed booking counts
+        """
+        result = await db.execute(
+            select(
+                Booking.restaurant_id,
+                Booking.visit_date,
+                Booking.visit_time,
+                func.count(Booking.id)
+            )
+            .where(Booking.status == "confirmed")
+            .group_by(Booking.restaurant_id, Booking.visit_date, Booking.visit_time)
+        )
+        return {
+            (restaurant_id, visit_date, visit_time): count
+            for restaurant_id, visit_date, visit_time, count in result.all()
+        }
+
+    async def load_slots(self, db: AsyncSession) -> Dict[DayKey, Tuple]:
+        """
+        Summarize each day's slots directly from the database.
+
+        The summary changes when a day's slots are added, removed, opened,
+        closed or given another party size limit, so comparing summaries
+        finds days whose availability changed without reading every slot.
+
+        Args:
+            db: Async database session
+
+        Returns:
+            Dict mapping day keys to a summary of the day's slots
+        """
+        result = await db.execute(
+            select(
+                AvailabilitySlot.restaurant_id,
+                AvailabilitySlot.date,
+                func.count(AvailabilitySlot.id),
+                func.sum(case((AvailabilitySlot.available.is_(True), 1), else_=0)),
+                func.sum(AvailabilitySlot.max_party_size),
+                func.min(AvailabilitySlot.time),
+                func.max(AvailabilitySlot.time)
+            )
+            .group_by(AvailabilitySlot.restaurant_id, AvailabilitySlot.date)
+        )
+        return {
+            (restaurant_id, slot_date): tuple(summary)
+            for restaurant_id, slot_date, *summary in result.all()
+        }
+
+    async def rebuild(self, db: AsyncSession) -> None:
+        """Replace the index contents with counts and slots from the database."""
+        self._counts = await self.load(db)
+        self._slot_summaries = await self.load_slots(db)
+        result = await db.execute(
+            select(*SLOT_COLUMNS).order_by(
+                AvailabilitySlot.restaurant_id,
+                AvailabilitySlot.date,
+                AvailabilitySlot.time
+            )
+        )
+        self._day_slots = group_slots(result.all())
+        self._stale_days = set()
+        self._versions = {}
+        self._generation = secrets.token_hex(8)
+        self.ready = True
+
+    async def verify(
+        self, db: AsyncSession, repair: bool = False
+    ) -> Dict[SlotKey, Tuple[int, int]]:
+        """
+        Compare the index with the database.
+
+        Repairing replaces the counts, which changes every day's version, and
+        marks the days whose slots were changed by another process stale.
+        Repair is skipped if the index was written while the database was
+        read, as the read may predate those writes; the next call catches up.
+
+        Args:
+            db: Async database session
+            repair: Bring the index up to date with the database
+
+        Returns:
+            Dict mapping each inconsistent slot to (indexed count, actual count);
+            empty when the index is consistent
+        """
+        writes = self._writes
+        actual = await self.load(db)
+        slots = await self.load_slots(db)
+        mismatches = {
+            key: (self._counts.get(key, 0), actual.get(key, 0))
+            for key in self._counts.keys() | actual.keys()
+            if self._counts.get(key, 0) != actual.get(key, 0)
+        }
+        if repair and self._writes == writes:
+            if mismatches:
+                self._counts = actual
+                self._generation = secrets.token_hex(8)
+            for key in self._slot_summaries.keys() | slots.keys():
+                if self._slot_summaries.get(key) != slots.get(key):
+                    self.invalidate_slots(*key)
+            self._slot_summaries = slots
+        return mismatches
+
+    def clear(self) -> None:
+        """Empty the index and stop serving counts from it."""
+        self._counts = {}
+        self._versions = {}
+        self._day_slots = {}
+        self._stale_days = set()
+        self._slot_summaries = {}
+        self._generation = ""
+        self.ready = False
+
+
+# Process-wide occupancy index, warmed by the application startup hook
+occupancy_index = OccupancyIndex()
+
+
+async def slot_occupancy(
+    db: AsyncSession,
+    restaurant_id: int,
+    visit_date: date,
+    party_size: int
+) -> List[Tuple[Slot, int]]:
+    """
+    Load the availability slots for a day together with their booking counts.
+
+    Args:
+        db: Async database session
+        restaurant_id: ID of the restaurant to search
+        visit_date: The date to load slots for
+        party_size: Minimum party size the slot must accept
+
+    Returns:
+        List of (slot, confirmed booking count) tuples ordered by slot time
+    """
+    return await slot_occupancy_range(
+        db, restaurant_id, visit_date, visit_date, party_size
+    )
+
+
+async def slot_occupancy_range(
+    db: AsyncSession,
+    restaurant_id: int,
+    start_date: date,
+    end_date: date,
+    party_size: int
+) -> List[Tuple[Slot, int]]:
+    """
+    Load the availability slots for a date range with their booking counts.
+
+    When the occupancy index is ready, slots and counts are read from memory;
+    only days whose slots were marked stale are reloaded, in one query.
+    Otherwise confirmed bookings are grouped by visit date and time in a
+    subquery which is outer joined to the slots, so slots without bookings
+    report a count of zero, and the whole range costs a single query.
+
+    Args:
+        db: Async database session
+        restaurant_id: ID of the restaurant to search
+        start_date: First date to load slots for
+        end_date: Last date to load slots for, inclusive
+        party_size: Minimum party size the slot must accept
+
+    Returns:
+        List of (slot, confirmed booking count) tuples ordered by date and time
+    """
+    if occupancy_index.ready:
+        stale = occupancy_index.stale_days(restaurant_id, start_date, end_date)
+        if stale:
+            await occupancy_index.load_day_slots(db, restaurant_id, stale)
+        return occupancy_index.slots(restaurant_id, start_date, end_date, party_size)
+
+    slot_filter = (
+        AvailabilitySlot.restaurant_id == restaurant_id,
+        AvailabilitySlot.date.between(start_date, end_date),
+        AvailabilitySlot.max_party_size >= party_size
+    )
+    slot_order = (AvailabilitySlot.date, AvailabilitySlot.time)
+
+    booking_counts = (
+        select(
+            Booking.visit_date.label("visit_date"),
+            Booking.visit_time.label("visit_time"),
+            func.count(Booking.id).label("booking_count")
+        )
+        .where(
+            Booking.restaurant_id == restaurant_id,
+            Booking.visit_date.between(start_date, end_date),
+            Booking.status == "confirmed"
+        )
+        .group_by(Booking.visit_date, Booking.visit_time)
+        .subquery()
+    )
+
+    result = await db.execute(
+        select(
+            AvailabilitySlot,
+            func.coalesce(booking_counts.c.booking_count, 0)
+        )
+        .outerjoin(
+            booking_counts,
+            and_(
+                booking_counts.c.visit_date == AvailabilitySlot.date,
+                booking_counts.c.visit_time == AvailabilitySlot.time
+            )
+        )
+        .where(*slot_filter)
+        .order_by(*slot_order)
+    )
+
+    return [(slot, count) for slot, count in result.all()]
+
+
+async def reserve_slot(
+    db: AsyncSession,
+    restaurant_id: int,
+    visit_date: date,
+    visit_time: time,
+    party_size: int
+) -> bool:
+    """
+    Atomically take one booking place in a slot.
+
+    Increments the slot's booked_count only if the slot exists, is available,
+    accepts the party size and is below MAX_BOOKINGS_PER_SLOT. The check and
+    increment are a single UPDATE, so concurrent reservations cannot oversell
+    the slot. The reservation is committed with the caller's transaction.
+
+    Args:
+        db: Async database session; the caller commits
+        restaurant_id: ID of the restaurant to book
+        visit_date: Date of the slot
+        visit_time: Time of the slot
+        party_size: Number of people in the party
+
+    Returns:
+        bool: True if a place was reserved, False if the slot cannot take it
+    """
+    result = await db.execute(
+        update(AvailabilitySlot)
+        .where(
+            AvailabilitySlot.restaurant_id == restaurant_id,
+            AvailabilitySlot.date == visit_date,
+            AvailabilitySlot.time == visit_time,
+            AvailabilitySlot.available.is_(True),
+            AvailabilitySlot.max_party_size >= party_size,
+            AvailabilitySlot.booked_count < MAX_BOOKINGS_PER_SLOT
+        )
+        .values(booked_count=AvailabilitySlot.booked_count + 1)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
+
+
+async def release_slot(
+    db: AsyncSession,
+    restaurant_id: int,
+    visit_date: date,
+    visit_time: time,
+    places: int = 1
+) -> None:
+    """
+    Give back booking places previously taken with reserve_slot().
+
+    Args:
+        db: Async database session; the caller commits
+        restaurant_id: ID of the booked restaurant
+        visit_date: Date of the slot
+        visit_time: Time of the slot
+        places: Number of places to give back; the count never drops below 0
+    """
+    await db.execute(
+        update(AvailabilitySlot)
+        .where(
+            AvailabilitySlot.restaurant_id == restaurant_id,
+            AvailabilitySlot.date == visit_date,
+            AvailabilitySlot.time == visit_time,
+            AvailabilitySlot.booked_count > 0
+        )
+        .values(booked_count=case(
+            (AvailabilitySlot.booked_count > places,
+             AvailabilitySlot.booked_count - places),
+            else_=0
+        ))
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def reserve_slot_places(db: AsyncSession, slot_id: int, places: int) -> bool:
+    """
+    Atomically take several booking places in one slot.
+
+    The batch counterpart of reserve_slot(): all places are taken in a single
+    guarded UPDATE, or none are if the slot has since become unavailable or
+    would exceed MAX_BOOKINGS_PER_SLOT.
+
+    Args:
+        db: Async database session; the caller commits
+        slot_id: ID of the availability slot
+        places: Number of bookings to reserve places for
+
+    Returns:
+        bool: True if all places were reserved, False if none were
+    """
+    result = await db.execute(
+        update(AvailabilitySlot)
+        .where(
+            AvailabilitySlot.id == slot_id,
+            AvailabilitySlot.available.is_(True),
+            AvailabilitySlot.booked_count + places <= MAX_BOOKINGS_PER_SLOT
+        )
+        .values(booked_count=AvailabilitySlot.booked_count + places)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
@@ -0,0 +1,206 @@
+"""
+On-Demand Request Profiling for Restaurant Booking API.
+
+When PROFILING is enabled, a single request can be profiled by sending it
+with an ``X-Profile`` header or a ``profile`` query parameter. The request is
+served normally while a profiler runs, and the profile is saved in
+PROFILE_DIR before the response is sent. The response names the saved file
+in its ``X-Profile-Artifact`` header.
+
+Two profilers are supported:
+
+- ``pyinstrument``: a statistical profiler that follows the request across
+  awaits, saved as an interactive HTML call tree. Used by default when the
+  optional package is installed (``requirements-profiling.txt``).
+- ``cprofile``: the deterministic standard library profiler, saved as a
+  pstats file for ``python -m pstats`` or viewers such as snakeviz. It sees
+  everything the event loop runs during the request, including other
+  requests.
+
+The trigger value picks the profiler, e.g. ``X-Profile: cprofile``; any other
+value uses PROFILER. Only one request is profiled at a time; a request
+arriving while another is profiled is served unprofiled, with
+``X-Profile: busy``. So is a request whose profiler cannot start, e.g.
+because another profiling tool is active, with ``X-Profile: unavailable``.
+With PROFILING off the middleware is not installed, so requests pay
+nothing; with it on, untriggered requests only pay for the trigger check.
+
+Author: AI Assistant
+"""
+
+import cProfile
+import os
+import re
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import List, Optional
+from urllib.parse import parse_qs
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import pyinstrument
+except ImportError:  # Optional: pip install -r requirements-profiling.txt
+    pyinstrument = None
+
+# Whether requests can ask to be profiled
+PROFILING_ENABLED = os.getenv("PROFILING", "false").lower() in ("1", "true", "yes")
+
+# Directory profiles are saved in
+PROFILE_DIR = os.getenv("PROFILE_DIR") or os.path.join(
+    tempfile.gettempdir(), "restaurant-booking-profiles"
+)
+
+# Profiler used when the trigger does not name one
+PROFILER = os.getenv("PROFILER") or ("pyinstrument" if pyinstrument else "cprofile")
+
+# Seconds between pyinstrument samples
+PROFILE_INTERVAL = float(os.getenv("PROFILE_INTERVAL", "0.001"))
+
+# Request header and query parameter that trigger profiling
+PROFILE_HEADER = b"x-profile"
+PROFILE_QUERY_PARAMETER = "profile"
+
+
+def available_profilers() -> List[str]:
+    """Return the profilers this process can run."""
+    return ["pyinstrument", "cprofile"] if pyinstrument else ["cprofile"]
+
+
+def profile_trigger(scope: Scope) -> Optional[str]:
+    """
+    Find the profiling trigger of a request.
+
+    Args:
+        scope: ASGI HTTP scope
+
+    Returns:
+        The header or query parameter value, or None if the request does not
+        ask to be profiled
+    """
+    for name, value in scope["headers"]:
+        if name == PROFILE_HEADER:
+            return value.decode("latin-1")
+    query_string = scope.get("query_string", b"")
+    if b"profile" in query_string:
+        values = parse_qs(query_string.decode("latin-1"), keep_blank_values=True)
+        if PROFILE_QUERY_PARAMETER in values:
+            return values[PROFILE_QUERY_PARAMETER][0]
+    return None
+
+
+class Profile:
+    """
+    One running profile, saved to a file when stopped.
+
+    Args:
+        profiler: "pyinstrument" or "cprofile"
+        path: File the profile is saved to, without its extension
+    """
+
+    def __init__(self, profiler: str, path: Path) -> None:
+        self.profiler = profiler
+        if profiler == "pyinstrument":
+            self.path = path.with_suffix(".html")
+            self._profiler = pyinstrument.Profiler(
+                interval=PROFILE_INTERVAL, async_mode="enabled"
+            )
+            self._profiler.start()
+        else:
+            self.path = path.with_suffix(".prof")
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+    def stop(self) -> Path:
+        """Stop profiling and save the profile; return the file's path."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.profiler == "pyinstrument":
+            self._profiler.stop()
+            self.path.write_text(self._profiler.output_html(), encoding="utf-8")
+        else:
+            self._profiler.disable()
+            self._profiler.dump_stats(str(self.path))
+        return self.path
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware profiling requests that ask for it.
+
+    The response of a profiled request is held back until the app has
+    finished, so the profile is saved before the client receives the
+    ``X-Profile-Artifact`` header naming it.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        directory: str = PROFILE_DIR,
+        profiler: str = PROFILER
+    ) -> None:
+        self.app = app
+        self.directory = Path(directory)
+        self.profiler = profiler if profiler in available_profilers() else "cprofile"
+        self.busy = False
+
+    def artifact_path(self, scope: Scope) -> Path:
+        """Name a profile after the time, method and path of its request."""
+        path = re.sub(r"[^A-Za-z0-9]+", "-", scope["path"]).strip("-")[:80]
+        name = (
+            f"{time.strftime('%Y%m%d-%H%M%S')}-{scope['method']}-{path or 'root'}"
+            f"-{uuid.uuid4().hex[:8]}"
+        )
+        return self.directory / name
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        trigger = profile_trigger(scope)
+        if trigger is None:
+            await self.app(scope, receive, send)
+            return
+
+        if self.busy:
+            await self.serve_unprofiled(scope, receive, send, "busy")
+            return
+
+        profiler = trigger if trigger in available_profilers() else self.profiler
+        messages: List[Message] = []
+
+        async def hold(message: Message) -> None:
+            messages.append(message)
+
+        self.busy = True
+        try:
+            try:
+                profile = Profile(profiler, self.artifact_path(scope))
+            except (RuntimeError, ValueError):
+                # Another profiler is already running in this process
+                await self.serve_unprofiled(scope, receive, send, "unavailable")
+                return
+            try:
+                await self.app(scope, receive, hold)
+            finally:
+                artifact = profile.stop()
+        finally:
+            self.busy = False
+
+        for message in messages:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Profile-Artifact"] = str(artifact)
+            await send(message)
+
+    async def serve_unprofiled(
+        self, scope: Scope, receive: Receive, send: Send, reason: str
+    ) -> None:
+        """Serve a triggered request without profiling, saying why in X-Profile."""
+        async def send_reason(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Profile"] = reason
+            await send(message)
+
+        await self.app(scope, receive, send_reason)
@@ -0,0 +1,185 @@
+"""
+SQL Query Instrumentation for Restaurant Booking API.
+
+This module attributes the SQL statements an engine runs, and the time they
+take, to the request that ran them. QueryStatsMiddleware starts a
+RequestQueries tally for each request in a context variable, and engine
+events add every statement to the tally of the request being served. The
+context variable follows the request into SQLAlchemy's asyncio greenlets, so
+concurrent requests are counted separately.
+
+In debug mode (DEBUG) each response reports its tally in the
+``X-DB-Query-Count`` and ``X-DB-Time-Ms`` headers, which makes N+1 query
+patterns visible from any client. Statements slower than SLOW_QUERY_MS are
+written to the slow-query log with their normalized SQL, which has literals
+and parameter lists collapsed so similar statements log identically, and the
+route that ran them. The log goes to stderr, or is appended to SLOW_QUERY_LOG.
+
+Author: AI Assistant
+"""
+
+import logging
+import os
+import re
+import time
+import weakref
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.metrics import route_label
+
+# Debug mode: responses report the statements they ran in X-DB-* headers
+DEBUG = os.getenv("DEBUG", "false").lower() in ("1", "true", "yes")
+
+# Statements taking at least this many milliseconds are logged; 0 disables
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "100"))
+
+# File the slow-query log is appended to; unset logs to stderr
+SLOW_QUERY_LOG = os.getenv("SLOW_QUERY_LOG")
+
+slow_query_log = logging.getLogger("app.slow_queries")
+if SLOW_QUERY_LOG:
+    _handler = logging.FileHandler(SLOW_QUERY_LOG)
+    _handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+    slow_query_log.addHandler(_handler)
+
+# Literals and placeholders replaced by "?" in normalized SQL
+_LITERALS = re.compile(
+    r"'(?:[^']|'')*'"  # String literals
+    r"|\$\d+"  # asyncpg placeholders
+    r"|%\(\w+\)s|%s"  # psycopg2 placeholders
+    r"|(?<![\w.])\d+(?:\.\d+)?\b"  # Numbers that are not part of a name
+)
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_REPEATED_LISTS = re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class RequestQueries:
+    """Tally of the statements run while serving one request."""
+
+    __slots__ = ("scope", "count", "seconds")
+
+    def __init__(self, scope: Optional[Scope] = None) -> None:
+        self.scope = scope
+        self.count = 0
+        self.seconds = 0.0
+
+    @property
+    def source(self) -> str:
+        """Describe what ran the statements, e.g. ``GET /``."""
+        if self.scope is None:
+            return "background"
+        return f"{self.scope['method']} {route_label(self.scope)}"
+
+
+# Engines whose statements are already timed
+_instrumented_engines: "weakref.WeakSet[Engine]" = weakref.WeakSet()
+
+# Tally of the request being served in the current context, if any
+current_queries: ContextVar[Optional[RequestQueries]] = ContextVar(
+    "current_queries", default=None
+)
+
+
+def normalize_sql(statement: str) -> str:
+    """
+    Reduce a statement to its shape for logging.
+
+    Literals and placeholders become ``?``, lists of them become ``(...)``
+    and repeated lists, e.g. multi-row VALUES, a single ``(...), ...``.
+    Whitespace is collapsed.
+
+    Args:
+        statement: SQL as sent to the driver
+
+    Returns:
+        str: Normalized SQL
+    """
+    sql = _LITERALS.sub("?", statement)
+    sql = _VALUE_LIST.sub("(...)", sql)
+    sql = _REPEATED_LISTS.sub("(...), ...", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def instrument_engine(engine: Engine, slow_query_ms: float = SLOW_QUERY_MS) -> None:
+    """
+    Time every statement an engine runs and attribute it to the current request.
+
+    Statements run outside a request, e.g. by the maintenance job, are only
+    checked against the slow-query threshold. Instrumenting an engine twice
+    has no further effect.
+
+    Args:
+        engine: Synchronous engine; use ``async_engine.sync_engine`` for
+            asyncio engines
+        slow_query_ms: Threshold for the slow-query log in milliseconds;
+            0 disables the log
+    """
+    if engine in _instrumented_engines:
+        return
+    _instrumented_engines.add(engine)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def record_query(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        queries = current_queries.get()
+        if queries is not None:
+            queries.count += 1
+            queries.seconds += elapsed
+        if slow_query_ms > 0 and elapsed * 1000 >= slow_query_ms:
+            source = queries.source if queries is not None else "background"
+            slow_query_log.warning(
+                "slow query %.1f ms in %s: %s",
+                elapsed * 1000, source, normalize_sql(statement)
+            )
+
+    @event.listens_for(engine, "handle_error")
+    def discard_timer(exception_context):
+        # The failed statement never reaches after_cursor_execute
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("query_started"):
+            connection.info["query_started"].pop()
+
+
+class QueryStatsMiddleware:
+    """
+    ASGI middleware tallying the statements each request runs.
+
+    With ``headers`` the tally is added to the response as
+    ``X-DB-Query-Count`` and ``X-DB-Time-Ms``, covering the statements run
+    before the response started.
+    """
+
+    def __init__(self, app: ASGIApp, headers: bool = DEBUG) -> None:
+        self.app = app
+        self.headers = headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        queries = RequestQueries(scope)
+
+        async def send_with_stats(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-DB-Query-Count"] = str(queries.count)
+                headers["X-DB-Time-Ms"] = f"{queries.seconds * 1000:.2f}"
+            await send(message)
+
+        token = current_queries.set(queries)
+        try:
+            await self.app(scope, receive, send_with_stats if self.headers else send)
+        finally:
+            current_queries.reset(token)
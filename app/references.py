@@ -0,0 +1,54 @@
+"""
+Booking References for Restaurant Booking API.
+
+A booking reference is a number written in base 36 with a fixed number of
+digits, e.g. ``7K2QX0B``. The booking router draws the numbers at random,
+and the seed data generator walks them in a seeded order; both spell them
+with encode_reference().
+
+Author: AI Assistant
+"""
+
+import secrets
+import string
+
+# Booking references are strings of REFERENCE_LENGTH characters over this alphabet
+REFERENCE_ALPHABET = string.digits + string.ascii_uppercase
+REFERENCE_LENGTH = 7
+
+
+def reference_space() -> int:
+    """Return the number of distinct booking references."""
+    return len(REFERENCE_ALPHABET) ** REFERENCE_LENGTH
+
+
+def encode_reference(number: int) -> str:
+    """
+    Spell a number as a booking reference, least significant digit first.
+
+    Args:
+        number: Number below reference_space()
+
+    Returns:
+        str: The REFERENCE_LENGTH-character reference
+    """
+    base = len(REFERENCE_ALPHABET)
+    reference = []
+    for _ in range(REFERENCE_LENGTH):
+        number, digit = divmod(number, base)
+        reference.append(REFERENCE_ALPHABET[digit])
+    return "".join(reference)
+
+
+def generate_booking_reference() -> str:
+    """
+    Generate a random 7-character alphanumeric booking reference.
+
+    References are drawn from the OS random source, so separate worker
+    processes never share a sequence. Uniqueness is enforced on insert by
+    the booking router's insert_booking.
+
+    Returns:
+        str: A random booking reference code
+    """
+    return encode_reference(secrets.randbelow(reference_space()))
@@ -2,19 +2,28 @@
 Availability Router for Restaurant Booking API.
 
 This module handles restaurant availability searching functionality,
-including time slot availability checks and booking constraint validation.
+including time slot availability checks and booking constraint validation,
+for a single day or as a calendar over a range of days.
 
 Author: AI Assistant
 """
 
 from datetime import date
-from typing import Dict, Any
+from typing import Dict, List, Optional, Union
 
-from fastapi import APIRouter, Form, Depends, HTTPException, Header
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Form, Depends, HTTPException, Header, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
-from app.models import Restaurant, AvailabilitySlot, Booking
+from app.cache import CachedRestaurant
+from app.conditional import etag_matches, make_etag, not_modified
+from app.database import get_async_db
+from app.dependencies import get_restaurant
+from app.occupancy import (
+    MAX_BOOKINGS_PER_SLOT, occupancy_index, slot_occupancy, slot_occupancy_range
+)
+from app.schemas import (
+    AvailabilityCalendarResponse, AvailabilitySearchResponse, AvailableSlot
+)
 
 router = APIRouter(prefix="/api/ConsumerApi/v1/Restaurant", tags=["availability"])
 
@@ -26,6 +35,9 @@ MOCK_BEARER_TOKEN = (
     "2094SB3J3XW-KdBc0DY9a2Jiu_56ud8"
 )
 
+# Longest date range a single calendar request may cover, in days
+MAX_CALENDAR_DAYS = 90
+
 
 def verify_token(authorization: str = Header(...)) -> str:
     """
@@ -59,78 +71,171 @@ def verify_token(authorization: str = Header(...)) -> str:
 @router.post(
     "/{restaurant_name}/AvailabilitySearch",
     summary="Search Available Time Slots",
-    response_description="Available booking slots with availability status"
+    response_description="Available booking slots with availability status",
+    response_model=AvailabilitySearchResponse
 )
 async def availability_search(
     restaurant_name: str,
+    response: Response,
     VisitDate: date = Form(..., description="Visit date in YYYY-MM-DD format"),
     PartySize: int = Form(..., description="Number of people in the party"),
     ChannelCode: str = Form(..., description="Booking channel (e.g., 'ONLINE')"),
-    db: Session = Depends(get_db),
-    token: str = Depends(verify_token)
-) -> Dict[str, Any]:
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+    token: str = Depends(verify_token),
+    restaurant: CachedRestaurant = Depends(get_restaurant)
+) -> Union[AvailabilitySearchResponse, Response]:
     """
     Search for available booking slots at a restaurant.
 
     Retrieves available time slots for a specific restaurant, date, and party size.
     The system checks base availability slots and current booking counts to determine
-    real-time availability.
+    real-time availability. Booking counts come from the in-memory occupancy
+    index, or from one grouped query until the index has been warmed.
+
+    The response carries an ETag, and a matching If-None-Match returns 304
+    with no body. With the index warm the ETag comes from the day's occupancy
+    version without querying the database; otherwise it is derived from the
+    loaded slots and counts before the response is built.
 
     Args:
         restaurant_name: The name of the restaurant
+        response: Response used to set the ETag header
         VisitDate: The desired visit date
         PartySize: Number of people in the party
         ChannelCode: The booking channel identifier
-        db: Database session dependency
+        if_none_match: ETags of the client's cached copies
+        db: Async database session dependency
         token: Authentication token dependency
+        restaurant: Restaurant resolved from the path via the restaurant cache
 
     Returns:
-        Dict containing restaurant info and available time slots
+        AvailabilitySearchResponse with restaurant info and available time
+        slots, or a 304 response if the client's copy is current
 
     Raises:
         HTTPException: 404 if restaurant not found
         HTTPException: 401 if authentication fails
     """
-    # Find restaurant by name
-    restaurant = db.query(Restaurant).filter(Restaurant.name == restaurant_name).first()
-    if not restaurant:
-        raise HTTPException(status_code=404, detail="Restaurant not found")
-
-    # Get availability slots for the requested date
-    slots = db.query(AvailabilitySlot).filter(
-        AvailabilitySlot.restaurant_id == restaurant.id,
-        AvailabilitySlot.date == VisitDate,
-        AvailabilitySlot.max_party_size >= PartySize
-    ).all()
-
-    # Check for existing bookings at each slot time
+    request_parts = (restaurant_name, restaurant.id, VisitDate, PartySize, ChannelCode)
+    indexed = occupancy_index.ready
+    if indexed:
+        etag = make_etag(
+            *request_parts, *occupancy_index.version(restaurant.id, VisitDate)
+        )
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+    # Get availability slots for the requested date with their booking counts
+    occupancy = await slot_occupancy(db, restaurant.id, VisitDate, PartySize)
+    if not indexed:
+        etag = make_etag(*request_parts, *(
+            (slot.time, slot.available, slot.max_party_size, existing_bookings)
+            for slot, existing_bookings in occupancy
+        ))
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+    response.headers["ETag"] = etag
+
     available_slots = []
-    for slot in slots:
-        # Count existing bookings for this time slot
-        existing_bookings = db.query(Booking).filter(
-            Booking.restaurant_id == restaurant.id,
-            Booking.visit_date == VisitDate,
-            Booking.visit_time == slot.time,
-            Booking.status == "confirmed"
-        ).count()
-
-        # Simple logic: allow up to 3 bookings per time slot
-        max_bookings_per_slot = 3
-        is_available = slot.available and existing_bookings < max_bookings_per_slot
-
-        available_slots.append({
-            "time": slot.time.strftime("%H:%M:%S"),
-            "available": is_available,
-            "max_party_size": slot.max_party_size,
-            "current_bookings": existing_bookings
-        })
-
-    return {
-        "restaurant": restaurant_name,
-        "restaurant_id": restaurant.id,
-        "visit_date": VisitDate,
-        "party_size": PartySize,
-        "channel_code": ChannelCode,
-        "available_slots": available_slots,
-        "total_slots": len(available_slots)
-    }
+    for slot, existing_bookings in occupancy:
+        is_available = slot.available and existing_bookings < MAX_BOOKINGS_PER_SLOT
+
+        available_slots.append(AvailableSlot(
+            time=slot.time,
+            available=is_available,
+            max_party_size=slot.max_party_size,
+            current_bookings=existing_bookings
+        ))
+
+    return AvailabilitySearchResponse(
+        restaurant=restaurant_name,
+        restaurant_id=restaurant.id,
+        visit_date=VisitDate,
+        party_size=PartySize,
+        channel_code=ChannelCode,
+        available_slots=available_slots,
+        total_slots=len(available_slots)
+    )
+
+
+@router.post(
+    "/{restaurant_name}/AvailabilityCalendar",
+    summary="Search Available Time Slots Over a Date Range",
+    response_description="Remaining bookings per slot for each day in the range",
+    response_model=AvailabilityCalendarResponse
+)
+async def availability_calendar(
+    restaurant_name: str,
+    StartDate: date = Form(..., description="First date in YYYY-MM-DD format"),
+    EndDate: date = Form(..., description="Last date (inclusive) in YYYY-MM-DD format"),
+    PartySize: int = Form(..., description="Number of people in the party"),
+    ChannelCode: str = Form(..., description="Booking channel (e.g., 'ONLINE')"),
+    db: AsyncSession = Depends(get_async_db),
+    token: str = Depends(verify_token),
+    restaurant: CachedRestaurant = Depends(get_restaurant)
+) -> AvailabilityCalendarResponse:
+    """
+    Search availability for every day in a date range at once.
+
+    Replaces one AvailabilitySearch per day with a single request whose slots
+    and booking counts are loaded in one query, however many days it covers.
+    To keep the payload small, slot times are listed once in ``times`` and
+    each day in ``days`` maps to a list aligned with them, holding the number
+    of bookings the slot can still take (0 when full or unavailable) or null
+    when the day has no such slot. Days without any slots are omitted.
+
+    Args:
+        restaurant_name: The name of the restaurant
+        StartDate: The first date of the range
+        EndDate: The last date of the range, inclusive
+        PartySize: Number of people in the party
+        ChannelCode: The booking channel identifier
+        db: Async database session dependency
+        token: Authentication token dependency
+        restaurant: Restaurant resolved from the path via the restaurant cache
+
+    Returns:
+        AvailabilityCalendarResponse with restaurant info, slot times and
+        per-day availability
+
+    Raises:
+        HTTPException: 400 if the range is reversed or longer than
+            MAX_CALENDAR_DAYS
+        HTTPException: 404 if restaurant not found
+        HTTPException: 401 if authentication fails
+    """
+    if EndDate < StartDate:
+        raise HTTPException(status_code=400, detail="EndDate is before StartDate")
+    if (EndDate - StartDate).days + 1 > MAX_CALENDAR_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Date range cannot exceed {MAX_CALENDAR_DAYS} days"
+        )
+
+    occupancy = await slot_occupancy_range(
+        db, restaurant.id, StartDate, EndDate, PartySize
+    )
+
+    # One column per distinct slot time across the range
+    times = sorted({slot.time for slot, _ in occupancy})
+    column = {slot_time: i for i, slot_time in enumerate(times)}
+
+    days: Dict[date, List[Optional[int]]] = {}
+    for slot, existing_bookings in occupancy:
+        remaining = days.setdefault(slot.date, [None] * len(times))
+        remaining[column[slot.time]] = (
+            max(MAX_BOOKINGS_PER_SLOT - existing_bookings, 0) if slot.available else 0
+        )
+
+    return AvailabilityCalendarResponse(
+        restaurant=restaurant_name,
+        restaurant_id=restaurant.id,
+        start_date=StartDate,
+        end_date=EndDate,
+        party_size=PartySize,
+        channel_code=ChannelCode,
+        max_bookings_per_slot=MAX_BOOKINGS_PER_SLOT,
+        times=times,
+        days=days
+    )
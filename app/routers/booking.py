@@ -7,17 +7,43 @@ retrieval, updates, and cancellation of restaurant bookings.
 Author: AI Assistant
 """
 
-import random
-import string
+import json
+from collections import Counter, defaultdict
 from datetime import date, time, datetime
-from typing import Optional
-
-from fastapi import APIRouter, Form, HTTPException, Depends, Header
-from pydantic import BaseModel
-from sqlalchemy.orm import Session
-
-from app.database import get_db
-from app.models import Restaurant, Customer, Booking, CancellationReason
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import APIRouter, Form, HTTPException, Depends, Header, Request, Response
+from pydantic import BaseModel, Field, ValidationError, model_validator
+from sqlalchemy import Row, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from app.cache import CachedRestaurant, cancellation_reason_cache
+from app.conditional import etag_matches, make_etag, not_modified
+from app.database import conflict_insert, get_async_db
+from app.dependencies import get_restaurant
+from app.models import Customer, Booking, AvailabilitySlot
+from app.occupancy import (
+    MAX_BOOKINGS_PER_SLOT,
+    occupancy_index,
+    release_slot,
+    reserve_slot,
+    reserve_slot_places,
+)
+from app.references import generate_booking_reference
+from app.schemas import (
+    BookingBatchCancelledResponse,
+    BookingBatchCreated,
+    BookingBatchFailed,
+    BookingBatchResponse,
+    BookingCancelledResponse,
+    BookingCreatedResponse,
+    BookingCustomer,
+    BookingCustomerDetails,
+    BookingDetailsResponse,
+    BookingUpdatedResponse,
+    CancellationReasonDetails,
+)
 
 router = APIRouter(prefix="/api/ConsumerApi/v1/Restaurant", tags=["booking"])
 
@@ -59,14 +85,197 @@ def verify_token(authorization: str = Header(...)) -> str:
     return token
 
 
-def generate_booking_reference() -> str:
+# Give up after this many reference collisions for a single booking
+MAX_REFERENCE_ATTEMPTS = 10
+
+# Largest number of bookings accepted by one BookingBatch request
+MAX_BATCH_SIZE = 1000
+
+# Content types read as newline-delimited JSON, one booking per line
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+NO_AVAILABILITY = "No availability for the requested time slot"
+
+
+async def insert_booking(db: AsyncSession, **values) -> Booking:
     """
-    Generate a unique 7-character alphanumeric booking reference.
+    Insert a booking under a freshly allocated unique reference.
+
+    The insert uses ON CONFLICT DO NOTHING on the unique booking_reference
+    index, so a collision simply returns no row and is retried with a new
+    reference. No lookup is needed before inserting, and the unique index
+    keeps references unique across worker processes.
+
+    Args:
+        db: Async database session; the caller commits
+        **values: Booking column values other than booking_reference
 
     Returns:
-        str: A unique booking reference code
+        Booking: The inserted booking, populated via RETURNING
+
+    Raises:
+        RuntimeError: If no free reference was found in MAX_REFERENCE_ATTEMPTS
     """
-    return ''.join(random.choices(string.ascii_uppercase + string.digits, k=7))
+    insert = conflict_insert(db.bind.dialect.name)
+    for _ in range(MAX_REFERENCE_ATTEMPTS):
+        booking = await db.scalar(
+            insert(Booking)
+            .values(booking_reference=generate_booking_reference(), **values)
+            .on_conflict_do_nothing(index_elements=["booking_reference"])
+            .returning(Booking)
+        )
+        if booking is not None:
+            return booking
+    raise RuntimeError("Could not allocate a unique booking reference")
+
+
+async def upsert_customer(db: AsyncSession, **values) -> Customer:
+    """
+    Insert a customer, or return the existing customer with the same email.
+
+    Uses INSERT ... ON CONFLICT (email) with a no-op update, so RETURNING
+    yields the existing row in the same round trip. An existing customer's
+    details are left unchanged. Customers without an email are always new.
+
+    Args:
+        db: Async database session; the caller commits
+        **values: Customer column values
+
+    Returns:
+        Customer: The inserted or existing customer
+    """
+    insert = conflict_insert(db.bind.dialect.name)
+    statement = insert(Customer).values(**values)
+    if values.get("email"):
+        statement = statement.on_conflict_do_update(
+            index_elements=["email"], set_={"email": statement.excluded.email}
+        )
+    return await db.scalar(
+        statement.returning(Customer),
+        execution_options={"populate_existing": True}
+    )
+
+
+async def insert_bookings(
+    db: AsyncSession, bookings: List[Dict[str, Any]]
+) -> List[Row]:
+    """
+    Insert many bookings at once, each under a freshly allocated reference.
+
+    The batch counterpart of insert_booking(): all rows go out in one
+    executemany INSERT with ON CONFLICT DO NOTHING, and only bookings whose
+    reference collided are retried with new references.
+
+    Args:
+        db: Async database session; the caller commits
+        bookings: Column values for each booking, other than booking_reference
+
+    Returns:
+        List of (id, booking_reference, created_at) rows in input order
+
+    Raises:
+        RuntimeError: If no free references were found in MAX_REFERENCE_ATTEMPTS
+    """
+    insert = conflict_insert(db.bind.dialect.name)
+    statement = (
+        insert(Booking)
+        .on_conflict_do_nothing(index_elements=["booking_reference"])
+        .returning(Booking.id, Booking.booking_reference, Booking.created_at)
+    )
+
+    inserted: Dict[int, Row] = {}
+    pending = list(range(len(bookings)))
+    for _ in range(MAX_REFERENCE_ATTEMPTS):
+        if not pending:
+            break
+        # References must also be unique within the statement itself
+        references = set()
+        while len(references) < len(pending):
+            references.add(generate_booking_reference())
+        assigned = dict(zip(pending, references))
+
+        result = await db.execute(statement, [
+            {**bookings[i], "booking_reference": reference}
+            for i, reference in assigned.items()
+        ])
+        rows = {row.booking_reference: row for row in result}
+        for i, reference in assigned.items():
+            if reference in rows:
+                inserted[i] = rows[reference]
+        pending = [i for i in pending if i not in inserted]
+
+    if pending:
+        raise RuntimeError("Could not allocate a unique booking reference")
+    return [inserted[i] for i in range(len(bookings))]
+
+
+async def upsert_customers(
+    db: AsyncSession, customers: List[Dict[str, Any]]
+) -> List[int]:
+    """
+    Insert many customers at once, reusing existing customers by email.
+
+    The batch counterpart of upsert_customer(): customers with an email are
+    upserted in one executemany statement and customers without one are
+    inserted in another. Customers sharing an email within the batch resolve
+    to the same row, created with the first occurrence's details. SQLite
+    cannot return multi-row insert IDs in order, so there SQLAlchemy inserts
+    customers without an email one row at a time.
+
+    Args:
+        db: Async database session; the caller commits
+        customers: Column values for each customer
+
+    Returns:
+        List of customer IDs in input order
+    """
+    insert = conflict_insert(db.bind.dialect.name)
+    ids_by_email: Dict[str, int] = {}
+    anonymous_ids: Dict[int, int] = {}
+
+    by_email: Dict[str, Dict[str, Any]] = {}
+    for values in customers:
+        if values.get("email"):
+            by_email.setdefault(values["email"], values)
+    if by_email:
+        statement = insert(Customer)
+        statement = statement.on_conflict_do_update(
+            index_elements=["email"], set_={"email": statement.excluded.email}
+        )
+        result = await db.execute(
+            statement.returning(Customer.id, Customer.email), list(by_email.values())
+        )
+        ids_by_email = {email: customer_id for customer_id, email in result}
+
+    anonymous = [i for i, values in enumerate(customers) if not values.get("email")]
+    if anonymous:
+        result = await db.execute(
+            insert(Customer).returning(Customer.id, sort_by_parameter_order=True),
+            [customers[i] for i in anonymous]
+        )
+        anonymous_ids = dict(zip(anonymous, result.scalars()))
+
+    return [
+        ids_by_email[values["email"]] if values.get("email") else anonymous_ids[i]
+        for i, values in enumerate(customers)
+    ]
+
+
+def booking_etag(restaurant_name: str, booking_id: int, updated_at: datetime) -> str:
+    """
+    Build the ETag of a booking's GET representation.
+
+    Every write to a booking sets updated_at, so it versions the booking.
+
+    Args:
+        restaurant_name: Restaurant name echoed in the response
+        booking_id: ID of the booking
+        updated_at: When the booking was last changed
+
+    Returns:
+        str: Quoted entity tag
+    """
+    return make_etag("booking", restaurant_name, booking_id, updated_at.isoformat())
 
 
 class CustomerData(BaseModel):
@@ -88,7 +297,70 @@ class CustomerData(BaseModel):
     RestaurantSmsMarketingOptInText: Optional[str] = None
 
 
-@router.post("/{restaurant_name}/BookingWithStripeToken")
+class BookingBatchItem(BaseModel):
+    VisitDate: date
+    VisitTime: time
+    PartySize: int
+    ChannelCode: str
+    SpecialRequests: Optional[str] = None
+    IsLeaveTimeConfirmed: Optional[bool] = None
+    RoomNumber: Optional[str] = None
+    Customer: CustomerData = Field(default_factory=CustomerData)
+
+
+class BulkCancellation(BaseModel):
+    """Bookings to cancel: either BookingReferences or a VisitDate selector."""
+
+    CancellationReasonId: int
+    BookingReferences: Optional[List[str]] = None
+    VisitDate: Optional[date] = None
+    StartTime: Optional[time] = None
+    EndTime: Optional[time] = None
+
+    @model_validator(mode="after")
+    def check_selector(self) -> "BulkCancellation":
+        if (self.BookingReferences is None) == (self.VisitDate is None):
+            raise ValueError("Provide either BookingReferences or VisitDate")
+        if self.VisitDate is None and (self.StartTime or self.EndTime):
+            raise ValueError("StartTime and EndTime require VisitDate")
+        if self.StartTime and self.EndTime and self.EndTime < self.StartTime:
+            raise ValueError("EndTime is before StartTime")
+        return self
+
+
+def customer_columns(customer: CustomerData) -> Dict[str, Any]:
+    """Map customer form fields to Customer column values."""
+    return {
+        "title": customer.Title,
+        "first_name": customer.FirstName,
+        "surname": customer.Surname,
+        "mobile_country_code": customer.MobileCountryCode,
+        "mobile": customer.Mobile,
+        "phone_country_code": customer.PhoneCountryCode,
+        "phone": customer.Phone,
+        "email": customer.Email or None,
+        "receive_email_marketing": customer.ReceiveEmailMarketing or False,
+        "receive_sms_marketing": customer.ReceiveSmsMarketing or False,
+        "group_email_marketing_opt_in_text": customer.GroupEmailMarketingOptInText,
+        "group_sms_marketing_opt_in_text": customer.GroupSmsMarketingOptInText,
+        "receive_restaurant_email_marketing": (
+            customer.ReceiveRestaurantEmailMarketing or False
+        ),
+        "receive_restaurant_sms_marketing": (
+            customer.ReceiveRestaurantSmsMarketing or False
+        ),
+        "restaurant_email_marketing_opt_in_text": (
+            customer.RestaurantEmailMarketingOptInText
+        ),
+        "restaurant_sms_marketing_opt_in_text": (
+            customer.RestaurantSmsMarketingOptInText
+        ),
+    }
+
+
+@router.post(
+    "/{restaurant_name}/BookingWithStripeToken", response_model=BookingCreatedResponse
+)
 async def create_booking_with_stripe(
     restaurant_name: str,
     VisitDate: date = Form(...),
@@ -131,55 +403,45 @@ async def create_booking_with_stripe(
     RestaurantSmsMarketingOptInText: Optional[str] = Form(
         None, alias="Customer[RestaurantSmsMarketingOptInText]"
     ),
-    db: Session = Depends(get_db),
-    token: str = Depends(verify_token)
+    db: AsyncSession = Depends(get_async_db),
+    token: str = Depends(verify_token),
+    restaurant: CachedRestaurant = Depends(get_restaurant)
 ):
     """
     Create a new booking with Stripe payment token
+
+    The slot reservation, customer upsert and booking insert share one
+    transaction and return their rows via RETURNING, so a failed booking
+    leaves no orphan customer or held slot place.
     """
-    # Find restaurant
-    restaurant = db.query(Restaurant).filter(Restaurant.name == restaurant_name).first()
-    if not restaurant:
-        raise HTTPException(status_code=404, detail="Restaurant not found")
-
-    # Create or find customer
-    customer = None
-    if Email:
-        customer = db.query(Customer).filter(Customer.email == Email).first()
-
-    if not customer:
-        customer = Customer(
-            title=Title,
-            first_name=FirstName,
-            surname=Surname,
-            mobile_country_code=MobileCountryCode,
-            mobile=Mobile,
-            phone_country_code=PhoneCountryCode,
-            phone=Phone,
-            email=Email,
-            receive_email_marketing=ReceiveEmailMarketing or False,
-            receive_sms_marketing=ReceiveSmsMarketing or False,
-            group_email_marketing_opt_in_text=GroupEmailMarketingOptInText,
-            group_sms_marketing_opt_in_text=GroupSmsMarketingOptInText,
-            receive_restaurant_email_marketing=ReceiveRestaurantEmailMarketing or False,
-            receive_restaurant_sms_marketing=ReceiveRestaurantSmsMarketing or False,
-            restaurant_email_marketing_opt_in_text=RestaurantEmailMarketingOptInText,
-            restaurant_sms_marketing_opt_in_text=RestaurantSmsMarketingOptInText
-        )
-        db.add(customer)
-        db.commit()
-        db.refresh(customer)
-
-    # Generate unique booking reference
-    booking_reference = generate_booking_reference()
-    while db.query(Booking).filter(
-        Booking.booking_reference == booking_reference
-    ).first():
-        booking_reference = generate_booking_reference()
-
-    # Create booking
-    booking = Booking(
-        booking_reference=booking_reference,
+    # Atomically take a place in the slot, rejecting full or unavailable slots
+    if not await reserve_slot(db, restaurant.id, VisitDate, VisitTime, PartySize):
+        raise HTTPException(status_code=409, detail=NO_AVAILABILITY)
+
+    # Create or find customer; committed together with the booking below
+    customer = await upsert_customer(
+        db,
+        title=Title,
+        first_name=FirstName,
+        surname=Surname,
+        mobile_country_code=MobileCountryCode,
+        mobile=Mobile,
+        phone_country_code=PhoneCountryCode,
+        phone=Phone,
+        email=Email or None,
+        receive_email_marketing=ReceiveEmailMarketing or False,
+        receive_sms_marketing=ReceiveSmsMarketing or False,
+        group_email_marketing_opt_in_text=GroupEmailMarketingOptInText,
+        group_sms_marketing_opt_in_text=GroupSmsMarketingOptInText,
+        receive_restaurant_email_marketing=ReceiveRestaurantEmailMarketing or False,
+        receive_restaurant_sms_marketing=ReceiveRestaurantSmsMarketing or False,
+        restaurant_email_marketing_opt_in_text=RestaurantEmailMarketingOptInText,
+        restaurant_sms_marketing_opt_in_text=RestaurantSmsMarketingOptInText
+    )
+
+    # Create booking under a unique reference
+    booking = await insert_booking(
+        db,
         restaurant_id=restaurant.id,
         customer_id=customer.id,
         visit_date=VisitDate,
@@ -191,62 +453,314 @@ async def create_booking_with_stripe(
         room_number=RoomNumber,
         status="confirmed"
     )
+    await db.commit()
+    occupancy_index.add(restaurant.id, VisitDate, VisitTime)
 
-    db.add(booking)
-    db.commit()
-    db.refresh(booking)
+    return BookingCreatedResponse(
+        booking_reference=booking.booking_reference,
+        booking_id=booking.id,
+        restaurant=restaurant_name,
+        visit_date=VisitDate,
+        visit_time=VisitTime,
+        party_size=PartySize,
+        channel_code=ChannelCode,
+        special_requests=SpecialRequests,
+        is_leave_time_confirmed=IsLeaveTimeConfirmed,
+        room_number=RoomNumber,
+        customer=BookingCustomer(
+            id=customer.id,
+            title=customer.title,
+            first_name=customer.first_name,
+            surname=customer.surname,
+            email=customer.email,
+            mobile=customer.mobile
+        ),
+        status="confirmed",
+        created_at=booking.created_at
+    )
 
-    return {
-        "booking_reference": booking_reference,
-        "booking_id": booking.id,
-        "restaurant": restaurant_name,
-        "visit_date": VisitDate,
-        "visit_time": VisitTime,
-        "party_size": PartySize,
-        "channel_code": ChannelCode,
-        "special_requests": SpecialRequests,
-        "is_leave_time_confirmed": IsLeaveTimeConfirmed,
-        "room_number": RoomNumber,
-        "customer": {
-            "id": customer.id,
-            "title": customer.title,
-            "first_name": customer.first_name,
-            "surname": customer.surname,
-            "email": customer.email,
-            "mobile": customer.mobile
-        },
-        "status": "confirmed",
-        "created_at": booking.created_at
-    }
+
+@router.post("/{restaurant_name}/BookingBatch", response_model=BookingBatchResponse)
+async def create_booking_batch(
+    restaurant_name: str,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    token: str = Depends(verify_token),
+    restaurant: CachedRestaurant = Depends(get_restaurant)
+):
+    """
+    Create many bookings in one request
+
+    The body is a JSON array of bookings, or one booking per line when sent as
+    newline-delimited JSON (application/x-ndjson). Each booking takes the
+    BookingWithStripeToken fields with the customer nested under "Customer".
+
+    Capacity is checked for the whole batch against a single read of the
+    affected slots and reserved with one guarded UPDATE per slot. Customers
+    and bookings are then written with executemany inserts, all in one
+    transaction. Bookings that are invalid or do not fit are reported in
+    their result entry while the rest of the batch is still created.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    body = await request.body()
+    if content_type in NDJSON_MEDIA_TYPES:
+        entries: List[Any] = [line for line in body.splitlines() if line.strip()]
+    else:
+        try:
+            entries = json.loads(body)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Malformed JSON body")
+        if not isinstance(entries, list):
+            raise HTTPException(
+                status_code=400, detail="Expected a JSON array of bookings"
+            )
+    if len(entries) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Batch cannot exceed {MAX_BATCH_SIZE} bookings"
+        )
+
+    results: List[Any] = [None] * len(entries)
+
+    def reject(index: int, status_code: int, detail: Any) -> None:
+        results[index] = BookingBatchFailed(
+            index=index, status_code=status_code, detail=detail
+        )
+
+    items: Dict[int, BookingBatchItem] = {}
+    for index, entry in enumerate(entries):
+        try:
+            if isinstance(entry, bytes):
+                entry = json.loads(entry)
+            items[index] = BookingBatchItem.model_validate(entry)
+        except ValidationError as error:
+            reject(index, 422, json.loads(error.json(include_url=False)))
+        except ValueError:
+            reject(index, 422, "Malformed JSON")
+
+    # Check capacity for the whole batch against one read of its slots
+    slots: Dict[Tuple[date, time], AvailabilitySlot] = {}
+    requested_slots = {(item.VisitDate, item.VisitTime) for item in items.values()}
+    if requested_slots:
+        slots = {
+            (slot.date, slot.time): slot
+            for slot in await db.scalars(
+                select(AvailabilitySlot).where(
+                    AvailabilitySlot.restaurant_id == restaurant.id,
+                    tuple_(AvailabilitySlot.date, AvailabilitySlot.time).in_(
+                        requested_slots
+                    )
+                )
+            )
+        }
+
+    fitting: Dict[Tuple[date, time], List[int]] = defaultdict(list)
+    for index, item in items.items():
+        key = (item.VisitDate, item.VisitTime)
+        slot = slots.get(key)
+        if (
+            slot is None
+            or not slot.available
+            or slot.max_party_size is None
+            or slot.max_party_size < item.PartySize
+            or slot.booked_count + len(fitting[key]) >= MAX_BOOKINGS_PER_SLOT
+        ):
+            reject(index, 409, NO_AVAILABILITY)
+        else:
+            fitting[key].append(index)
+
+    # Reserve places per slot; if a slot filled up concurrently, fall back to
+    # reserving its bookings one at a time
+    booked: List[int] = []
+    for key, indexes in fitting.items():
+        if await reserve_slot_places(db, slots[key].id, len(indexes)):
+            booked.extend(indexes)
+            continue
+        for index in indexes:
+            if await reserve_slot(db, restaurant.id, *key, items[index].PartySize):
+                booked.append(index)
+            else:
+                reject(index, 409, NO_AVAILABILITY)
+    booked.sort()
+
+    customer_ids = await upsert_customers(
+        db, [customer_columns(items[index].Customer) for index in booked]
+    )
+    rows = await insert_bookings(db, [
+        {
+            "restaurant_id": restaurant.id,
+            "customer_id": customer_id,
+            "visit_date": items[index].VisitDate,
+            "visit_time": items[index].VisitTime,
+            "party_size": items[index].PartySize,
+            "channel_code": items[index].ChannelCode,
+            "special_requests": items[index].SpecialRequests,
+            "is_leave_time_confirmed": items[index].IsLeaveTimeConfirmed or False,
+            "room_number": items[index].RoomNumber,
+            "status": "confirmed",
+        }
+        for index, customer_id in zip(booked, customer_ids)
+    ])
+    await db.commit()
+
+    for index, customer_id, row in zip(booked, customer_ids, rows):
+        item = items[index]
+        occupancy_index.add(restaurant.id, item.VisitDate, item.VisitTime)
+        results[index] = BookingBatchCreated(
+            index=index,
+            status_code=200,
+            booking_reference=row.booking_reference,
+            booking_id=row.id,
+            visit_date=item.VisitDate,
+            visit_time=item.VisitTime,
+            party_size=item.PartySize,
+            customer_id=customer_id,
+            status="confirmed",
+            created_at=row.created_at
+        )
+
+    return BookingBatchResponse(
+        restaurant=restaurant_name,
+        total=len(entries),
+        created=len(booked),
+        failed=len(entries) - len(booked),
+        results=results
+    )
 
 
-@router.post("/{restaurant_name}/Booking/{booking_reference}/Cancel")
+@router.post(
+    "/{restaurant_name}/BookingBatch/Cancel",
+    response_model=BookingBatchCancelledResponse,
+    response_model_exclude_none=True
+)
+async def cancel_booking_batch(
+    restaurant_name: str,
+    cancellation: BulkCancellation,
+    db: AsyncSession = Depends(get_async_db),
+    token: str = Depends(verify_token),
+    restaurant: CachedRestaurant = Depends(get_restaurant)
+):
+    """
+    Cancel many bookings at once, e.g. when the restaurant closes
+
+    Selects confirmed bookings either by BookingReferences or by VisitDate,
+    optionally narrowed to StartTime..EndTime (inclusive), and cancels them
+    in a single set-based UPDATE. A VisitDate selector also closes the
+    matching availability slots, so no new bookings can be made in them;
+    with BookingReferences the cancelled bookings' places are given back
+    instead.
+    """
+    cancellation_reason = await cancellation_reason_cache.get(
+        db, cancellation.CancellationReasonId
+    )
+    if not cancellation_reason:
+        raise HTTPException(status_code=400, detail="Invalid cancellation reason")
+
+    if cancellation.VisitDate is not None:
+        booking_filter = [Booking.visit_date == cancellation.VisitDate]
+        slot_filter = [AvailabilitySlot.date == cancellation.VisitDate]
+        if cancellation.StartTime:
+            booking_filter.append(Booking.visit_time >= cancellation.StartTime)
+            slot_filter.append(AvailabilitySlot.time >= cancellation.StartTime)
+        if cancellation.EndTime:
+            booking_filter.append(Booking.visit_time <= cancellation.EndTime)
+            slot_filter.append(AvailabilitySlot.time <= cancellation.EndTime)
+    else:
+        booking_filter = [
+            Booking.booking_reference.in_(cancellation.BookingReferences)
+        ]
+
+    result = await db.execute(
+        update(Booking)
+        .where(
+            Booking.restaurant_id == restaurant.id,
+            Booking.status == "confirmed",
+            *booking_filter
+        )
+        .values(
+            status="cancelled",
+            cancellation_reason_id=cancellation.CancellationReasonId,
+            updated_at=datetime.utcnow()
+        )
+        .returning(Booking.booking_reference, Booking.visit_date, Booking.visit_time)
+        .execution_options(synchronize_session=False)
+    )
+    cancelled = result.all()
+    released = Counter(
+        (restaurant.id, visit_date, visit_time)
+        for _, visit_date, visit_time in cancelled
+    )
+
+    slots_closed = 0
+    if cancellation.VisitDate is not None:
+        # Every confirmed booking in the closed slots was just cancelled
+        result = await db.execute(
+            update(AvailabilitySlot)
+            .where(AvailabilitySlot.restaurant_id == restaurant.id, *slot_filter)
+            .values(available=False, booked_count=0)
+            .execution_options(synchronize_session=False)
+        )
+        slots_closed = result.rowcount
+    else:
+        for slot, places in released.items():
+            await release_slot(db, *slot, places=places)
+
+    await db.commit()
+    for slot, places in released.items():
+        occupancy_index.add(*slot, delta=-places)
+    if slots_closed:
+        occupancy_index.invalidate_slots(restaurant.id, cancellation.VisitDate)
+
+    cancelled_references = [reference for reference, _, _ in cancelled]
+    not_cancelled = None
+    if cancellation.BookingReferences is not None:
+        # Unknown, other restaurants' or already cancelled bookings
+        not_cancelled = sorted(
+            set(cancellation.BookingReferences) - set(cancelled_references)
+        )
+    return BookingBatchCancelledResponse(
+        restaurant=restaurant_name,
+        cancellation_reason_id=cancellation.CancellationReasonId,
+        cancellation_reason=cancellation_reason.reason,
+        cancelled_count=len(cancelled_references),
+        cancelled_references=cancelled_references,
+        slots_closed=slots_closed,
+        not_cancelled=not_cancelled
+    )
+
+
+@router.post(
+    "/{restaurant_name}/Booking/{booking_reference}/Cancel",
+    response_model=BookingCancelledResponse
+)
 async def cancel_booking(
     restaurant_name: str,
     booking_reference: str,
     micrositeName: str = Form(...),
     bookingReference: str = Form(...),
     cancellationReasonId: int = Form(...),
-    db: Session = Depends(get_db),
-    token: str = Depends(verify_token)
+    db: AsyncSession = Depends(get_async_db),
+    token: str = Depends(verify_token),
+    restaurant: CachedRestaurant = Depends(get_restaurant)
 ):
     """
     Cancel an existing booking
+
+    The status change is an UPDATE guarded on the status read here, so when
+    the same booking is cancelled concurrently only one request cancels it
+    and gives its place in the slot back.
     """
     # Validate booking reference matches
     if booking_reference != bookingReference:
         raise HTTPException(status_code=400, detail="Booking reference mismatch")
 
-    # Find restaurant
-    restaurant = db.query(Restaurant).filter(Restaurant.name == restaurant_name).first()
-    if not restaurant:
-        raise HTTPException(status_code=404, detail="Restaurant not found")
-
     # Find booking
-    booking = db.query(Booking).filter(
-        Booking.booking_reference == booking_reference,
-        Booking.restaurant_id == restaurant.id
-    ).first()
+    booking = await db.scalar(
+        select(Booking).where(
+            Booking.booking_reference == booking_reference,
+            Booking.restaurant_id == restaurant.id
+        )
+    )
     if not booking:
         raise HTTPException(status_code=404, detail="Booking not found")
 
@@ -255,97 +769,143 @@ async def cancel_booking(
         raise HTTPException(status_code=400, detail="Booking is already cancelled")
 
     # Validate cancellation reason
-    cancellation_reason = db.query(CancellationReason).filter(
-        CancellationReason.id == cancellationReasonId
-    ).first()
+    cancellation_reason = await cancellation_reason_cache.get(db, cancellationReasonId)
     if not cancellation_reason:
         raise HTTPException(status_code=400, detail="Invalid cancellation reason")
 
-    # Update booking status
-    booking.status = "cancelled"
-    booking.cancellation_reason_id = cancellationReasonId
-    booking.updated_at = datetime.utcnow()
+    # Update booking status, unless another request changed it since it was read
+    was_confirmed = booking.status == "confirmed"
+    cancelled_at = await db.scalar(
+        update(Booking)
+        .where(Booking.id == booking.id, Booking.status == booking.status)
+        .values(
+            status="cancelled",
+            cancellation_reason_id=cancellationReasonId,
+            updated_at=datetime.utcnow()
+        )
+        .returning(Booking.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    if cancelled_at is None:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Booking is already cancelled")
+    if was_confirmed:
+        await release_slot(db, restaurant.id, booking.visit_date, booking.visit_time)
 
-    db.commit()
-    db.refresh(booking)
+    await db.commit()
+    if was_confirmed:
+        occupancy_index.add(
+            restaurant.id, booking.visit_date, booking.visit_time, delta=-1
+        )
 
-    return {
-        "booking_reference": booking_reference,
-        "booking_id": booking.id,
-        "restaurant": restaurant_name,
-        "microsite_name": micrositeName,
-        "cancellation_reason_id": cancellationReasonId,
-        "cancellation_reason": cancellation_reason.reason,
-        "status": "cancelled",
-        "cancelled_at": booking.updated_at,
-        "message": f"Booking {booking_reference} has been successfully cancelled"
-    }
+    return BookingCancelledResponse(
+        booking_reference=booking_reference,
+        booking_id=booking.id,
+        restaurant=restaurant_name,
+        microsite_name=micrositeName,
+        cancellation_reason_id=cancellationReasonId,
+        cancellation_reason=cancellation_reason.reason,
+        status="cancelled",
+        cancelled_at=cancelled_at,
+        message=f"Booking {booking_reference} has been successfully cancelled"
+    )
 
 
-@router.get("/{restaurant_name}/Booking/{booking_reference}")
+@router.get(
+    "/{restaurant_name}/Booking/{booking_reference}",
+    response_model=BookingDetailsResponse
+)
 async def get_booking(
     restaurant_name: str,
     booking_reference: str,
-    db: Session = Depends(get_db),
-    token: str = Depends(verify_token)
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+    token: str = Depends(verify_token),
+    restaurant: CachedRestaurant = Depends(get_restaurant)
 ):
     """
     Get booking details by reference
+
+    The booking and its customer are loaded in one joined query, while the
+    restaurant and cancellation reason come from in-process caches, so a
+    lookup with warm caches is a single SQL statement.
+
+    The response carries an ETag derived from the booking's updated_at. When
+    If-None-Match is sent, only the booking's id and updated_at are queried
+    first, and a match returns 304 without loading or building the body.
     """
-    # Find restaurant
-    restaurant = db.query(Restaurant).filter(Restaurant.name == restaurant_name).first()
-    if not restaurant:
-        raise HTTPException(status_code=404, detail="Restaurant not found")
+    if if_none_match:
+        current = (await db.execute(
+            select(Booking.id, Booking.updated_at).where(
+                Booking.booking_reference == booking_reference,
+                Booking.restaurant_id == restaurant.id
+            )
+        )).first()
+        if current:
+            etag = booking_etag(restaurant_name, *current)
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
 
     # Find booking with customer data
-    booking = db.query(Booking).filter(
-        Booking.booking_reference == booking_reference,
-        Booking.restaurant_id == restaurant.id
-    ).first()
+    booking = await db.scalar(
+        select(Booking)
+        .options(joinedload(Booking.customer))
+        .where(
+            Booking.booking_reference == booking_reference,
+            Booking.restaurant_id == restaurant.id
+        )
+    )
     if not booking:
         raise HTTPException(status_code=404, detail="Booking not found")
+    response.headers["ETag"] = booking_etag(
+        restaurant_name, booking.id, booking.updated_at
+    )
 
     # Get cancellation reason if cancelled
     cancellation_reason = None
     if booking.status == "cancelled" and booking.cancellation_reason_id:
-        reason = db.query(CancellationReason).filter(
-            CancellationReason.id == booking.cancellation_reason_id
-        ).first()
+        reason = await cancellation_reason_cache.get(
+            db, booking.cancellation_reason_id
+        )
         if reason:
-            cancellation_reason = {
-                "id": reason.id,
-                "reason": reason.reason,
-                "description": reason.description
-            }
+            cancellation_reason = CancellationReasonDetails(
+                id=reason.id,
+                reason=reason.reason,
+                description=reason.description
+            )
 
-    return {
-        "booking_reference": booking_reference,
-        "booking_id": booking.id,
-        "restaurant": restaurant_name,
-        "visit_date": booking.visit_date,
-        "visit_time": booking.visit_time,
-        "party_size": booking.party_size,
-        "channel_code": booking.channel_code,
-        "special_requests": booking.special_requests,
-        "is_leave_time_confirmed": booking.is_leave_time_confirmed,
-        "room_number": booking.room_number,
-        "status": booking.status,
-        "customer": {
-            "id": booking.customer.id,
-            "title": booking.customer.title,
-            "first_name": booking.customer.first_name,
-            "surname": booking.customer.surname,
-            "email": booking.customer.email,
-            "mobile": booking.customer.mobile,
-            "phone": booking.customer.phone
-        },
-        "cancellation_reason": cancellation_reason,
-        "created_at": booking.created_at,
-        "updated_at": booking.updated_at
-    }
+    return BookingDetailsResponse(
+        booking_reference=booking_reference,
+        booking_id=booking.id,
+        restaurant=restaurant_name,
+        visit_date=booking.visit_date,
+        visit_time=booking.visit_time,
+        party_size=booking.party_size,
+        channel_code=booking.channel_code,
+        special_requests=booking.special_requests,
+        is_leave_time_confirmed=booking.is_leave_time_confirmed,
+        room_number=booking.room_number,
+        status=booking.status,
+        customer=BookingCustomerDetails(
+            id=booking.customer.id,
+            title=booking.customer.title,
+            first_name=booking.customer.first_name,
+            surname=booking.customer.surname,
+            email=booking.customer.email,
+            mobile=booking.customer.mobile,
+            phone=booking.customer.phone
+        ),
+        cancellation_reason=cancellation_reason,
+        created_at=booking.created_at,
+        updated_at=booking.updated_at
+    )
 
 
-@router.patch("/{restaurant_name}/Booking/{booking_reference}")
+@router.patch(
+    "/{restaurant_name}/Booking/{booking_reference}",
+    response_model=BookingUpdatedResponse
+)
 async def update_booking(
     restaurant_name: str,
     booking_reference: str,
@@ -354,22 +914,25 @@ async def update_booking(
     PartySize: Optional[int] = Form(None),
     SpecialRequests: Optional[str] = Form(None),
     IsLeaveTimeConfirmed: Optional[bool] = Form(None),
-    db: Session = Depends(get_db),
-    token: str = Depends(verify_token)
+    db: AsyncSession = Depends(get_async_db),
+    token: str = Depends(verify_token),
+    restaurant: CachedRestaurant = Depends(get_restaurant)
 ):
     """
     Update an existing booking
-    """
-    # Find restaurant
-    restaurant = db.query(Restaurant).filter(Restaurant.name == restaurant_name).first()
-    if not restaurant:
-        raise HTTPException(status_code=404, detail="Restaurant not found")
 
+    The changes are written with an UPDATE guarded on the booking's status
+    and slot as read here. A concurrent cancel or move of the same booking
+    makes the guard fail and the request is rejected with 409, so the old
+    slot's place is only ever given back once.
+    """
     # Find booking
-    booking = db.query(Booking).filter(
-        Booking.booking_reference == booking_reference,
-        Booking.restaurant_id == restaurant.id
-    ).first()
+    booking = await db.scalar(
+        select(Booking).where(
+            Booking.booking_reference == booking_reference,
+            Booking.restaurant_id == restaurant.id
+        )
+    )
     if not booking:
         raise HTTPException(status_code=404, detail="Booking not found")
 
@@ -378,49 +941,79 @@ async def update_booking(
         raise HTTPException(status_code=400, detail="Cannot update cancelled booking")
 
     # Track updates
-    updates = {}
-    updated = False
-
-    if VisitDate is not None and VisitDate != booking.visit_date:
-        booking.visit_date = VisitDate
-        updates["visit_date"] = VisitDate
-        updated = True
-
-    if VisitTime is not None and VisitTime != booking.visit_time:
-        booking.visit_time = VisitTime
-        updates["visit_time"] = VisitTime
-        updated = True
-
-    if PartySize is not None and PartySize != booking.party_size:
-        booking.party_size = PartySize
-        updates["party_size"] = PartySize
-        updated = True
-
-    if SpecialRequests is not None and SpecialRequests != booking.special_requests:
-        booking.special_requests = SpecialRequests
-        updates["special_requests"] = SpecialRequests
-        updated = True
-
-    if (IsLeaveTimeConfirmed is not None and
-            IsLeaveTimeConfirmed != booking.is_leave_time_confirmed):
-        booking.is_leave_time_confirmed = IsLeaveTimeConfirmed
-        updates["is_leave_time_confirmed"] = IsLeaveTimeConfirmed
-        updated = True
+    changes = {
+        "visit_date": VisitDate,
+        "visit_time": VisitTime,
+        "party_size": PartySize,
+        "special_requests": SpecialRequests,
+        "is_leave_time_confirmed": IsLeaveTimeConfirmed,
+    }
+    updates = {
+        column: value for column, value in changes.items()
+        if value is not None and value != getattr(booking, column)
+    }
+    updated = bool(updates)
+    updated_at = booking.updated_at
 
     if updated:
-        booking.updated_at = datetime.utcnow()
-        db.commit()
-        db.refresh(booking)
-
-    return {
-        "booking_reference": booking_reference,
-        "booking_id": booking.id,
-        "restaurant": restaurant_name,
-        "updates": updates,
-        "status": "updated" if updated else "no_changes",
-        "updated_at": booking.updated_at,
-        "message": (
+        previous_slot = (restaurant.id, booking.visit_date, booking.visit_time)
+        new_slot = (
+            restaurant.id,
+            updates.get("visit_date", booking.visit_date),
+            updates.get("visit_time", booking.visit_time)
+        )
+        party_size = updates.get("party_size", booking.party_size)
+        moved = booking.status == "confirmed" and new_slot != previous_slot
+
+        # Moving a booking takes a place in the new slot before freeing the old;
+        # a booking that stays put must still fit its slot's party size limit
+        if moved:
+            if not await reserve_slot(db, *new_slot, party_size):
+                raise HTTPException(status_code=409, detail=NO_AVAILABILITY)
+        elif "party_size" in updates:
+            max_party_size = await db.scalar(
+                select(AvailabilitySlot.max_party_size).where(
+                    AvailabilitySlot.restaurant_id == restaurant.id,
+                    AvailabilitySlot.date == new_slot[1],
+                    AvailabilitySlot.time == new_slot[2]
+                )
+            )
+            if max_party_size is None or max_party_size < party_size:
+                raise HTTPException(status_code=409, detail=NO_AVAILABILITY)
+
+        updated_at = await db.scalar(
+            update(Booking)
+            .where(
+                Booking.id == booking.id,
+                Booking.status == booking.status,
+                Booking.visit_date == booking.visit_date,
+                Booking.visit_time == booking.visit_time
+            )
+            .values(**updates, updated_at=datetime.utcnow())
+            .returning(Booking.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        if updated_at is None:
+            await db.rollback()
+            raise HTTPException(
+                status_code=409, detail="Booking was changed by another request"
+            )
+        if moved:
+            await release_slot(db, *previous_slot)
+
+        await db.commit()
+        if moved:
+            occupancy_index.move(previous_slot, new_slot)
+
+    return BookingUpdatedResponse(
+        booking_reference=booking_reference,
+        booking_id=booking.id,
+        restaurant=restaurant_name,
+        updates=updates,
+        status="updated" if updated else "no_changes",
+        updated_at=updated_at,
+        message=(
             f"Booking {booking_reference} has been "
             f"{'successfully updated' if updated else 'checked - no changes made'}"
         )
-    }
+    )
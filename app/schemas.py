@@ -0,0 +1,184 @@
+"""
+Response Models for Restaurant Booking API.
+
+This module declares the Pydantic models returned by the API routers. Typed
+responses document the API schema and let FastAPI serialize them with
+pydantic-core instead of walking hand-built dicts with jsonable_encoder.
+
+Author: AI Assistant
+"""
+
+from datetime import date, datetime, time
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import BaseModel
+
+
+class AvailableSlot(BaseModel):
+    """One time slot in an availability search."""
+
+    time: time
+    available: bool
+    max_party_size: Optional[int]
+    current_bookings: int
+
+
+class AvailabilitySearchResponse(BaseModel):
+    """Slots for one day with their availability."""
+
+    restaurant: str
+    restaurant_id: int
+    visit_date: date
+    party_size: int
+    channel_code: str
+    available_slots: List[AvailableSlot]
+    total_slots: int
+
+
+class AvailabilityCalendarResponse(BaseModel):
+    """Remaining bookings per slot time for each day in a date range."""
+
+    restaurant: str
+    restaurant_id: int
+    start_date: date
+    end_date: date
+    party_size: int
+    channel_code: str
+    max_bookings_per_slot: int
+    times: List[time]
+    days: Dict[date, List[Optional[int]]]
+
+
+class BookingCustomer(BaseModel):
+    """Customer details returned with a new booking."""
+
+    id: int
+    title: Optional[str]
+    first_name: Optional[str]
+    surname: Optional[str]
+    email: Optional[str]
+    mobile: Optional[str]
+
+
+class BookingCustomerDetails(BookingCustomer):
+    """Customer details returned when a booking is looked up."""
+
+    phone: Optional[str]
+
+
+class BookingCreatedResponse(BaseModel):
+    """A booking created by BookingWithStripeToken."""
+
+    booking_reference: str
+    booking_id: int
+    restaurant: str
+    visit_date: date
+    visit_time: time
+    party_size: int
+    channel_code: str
+    special_requests: Optional[str]
+    is_leave_time_confirmed: Optional[bool]
+    room_number: Optional[str]
+    customer: BookingCustomer
+    status: str
+    created_at: datetime
+
+
+class BookingBatchCreated(BaseModel):
+    """Result entry for a booking created by BookingBatch."""
+
+    index: int
+    status_code: int
+    booking_reference: str
+    booking_id: int
+    visit_date: date
+    visit_time: time
+    party_size: int
+    customer_id: int
+    status: str
+    created_at: datetime
+
+
+class BookingBatchFailed(BaseModel):
+    """Result entry for a BookingBatch booking that was not created."""
+
+    index: int
+    status_code: int
+    detail: Any
+
+
+class BookingBatchResponse(BaseModel):
+    """Per-booking results of a BookingBatch request, in request order."""
+
+    restaurant: str
+    total: int
+    created: int
+    failed: int
+    results: List[Union[BookingBatchCreated, BookingBatchFailed]]
+
+
+class BookingCancelledResponse(BaseModel):
+    """A booking cancelled by reference."""
+
+    booking_reference: str
+    booking_id: int
+    restaurant: str
+    microsite_name: str
+    cancellation_reason_id: int
+    cancellation_reason: str
+    status: str
+    cancelled_at: datetime
+    message: str
+
+
+class BookingBatchCancelledResponse(BaseModel):
+    """Outcome of a bulk cancellation or closure."""
+
+    restaurant: str
+    cancellation_reason_id: int
+    cancellation_reason: str
+    cancelled_count: int
+    cancelled_references: List[str]
+    slots_closed: int
+    # Only present when bookings were selected by reference
+    not_cancelled: Optional[List[str]] = None
+
+
+class CancellationReasonDetails(BaseModel):
+    """Why a booking was cancelled."""
+
+    id: int
+    reason: str
+    description: Optional[str]
+
+
+class BookingDetailsResponse(BaseModel):
+    """A booking looked up by reference."""
+
+    booking_reference: str
+    booking_id: int
+    restaurant: str
+    visit_date: date
+    visit_time: time
+    party_size: int
+    channel_code: str
+    special_requests: Optional[str]
+    is_leave_time_confirmed: Optional[bool]
+    room_number: Optional[str]
+    status: str
+    customer: BookingCustomerDetails
+    cancellation_reason: Optional[CancellationReasonDetails]
+    created_at: datetime
+    updated_at: datetime
+
+
+class BookingUpdatedResponse(BaseModel):
+    """Outcome of a booking update."""
+
+    booking_reference: str
+    booking_id: int
+    restaurant: str
+    updates: Dict[str, Any]
+    status: str
+    updated_at: datetime
+    message: str
@@ -0,0 +1,128 @@
+"""
+Booking Reference Allocation Stress Test.
+
+Several worker processes allocate booking references concurrently against
+one shared database through app.routers.booking.insert_booking, then the
+bookings table is checked for duplicates. Passing a shorter --length shrinks
+the reference space so collisions, and therefore retries, actually happen.
+
+Usage:
+    python -m benchmarks.booking_references [--workers 4] [--per-worker 50000]
+        [--length 7] [--database-url postgresql://...]
+
+Author: AI Assistant
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import tempfile
+import time as timer
+from datetime import date, time
+from pathlib import Path
+from typing import Tuple
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.references as references
+import app.routers.booking as booking_router
+from app.database import apply_sqlite_pragmas, async_database_url, sqlite_pragmas
+from app.models import Base, Booking, Customer, Restaurant
+
+COMMIT_EVERY = 50
+
+# SQLite's busy handler is not fair, so waiting writers need generous patience
+SQLITE_BUSY_TIMEOUT = "60000"
+
+
+def allocate(args: Tuple[str, int, int]) -> Tuple[int, int]:
+    """
+    Allocate references in one worker process.
+
+    Returns:
+        Tuple of (references allocated, reference candidates generated)
+    """
+    url, count, length = args
+    references.REFERENCE_LENGTH = length
+    generated = 0
+    generate = booking_router.generate_booking_reference
+
+    def counting_generator() -> str:
+        nonlocal generated
+        generated += 1
+        return generate()
+
+    booking_router.generate_booking_reference = counting_generator
+
+    async def run() -> None:
+        engine = create_async_engine(async_database_url(url))
+        if engine.dialect.name == "sqlite":
+            pragmas = dict(
+                sqlite_pragmas("production"), busy_timeout=SQLITE_BUSY_TIMEOUT
+            )
+            apply_sqlite_pragmas(engine.sync_engine, pragmas)
+        async with async_sessionmaker(engine)() as db:
+            for i in range(count):
+                await booking_router.insert_booking(
+                    db,
+                    restaurant_id=1,
+                    customer_id=1,
+                    visit_date=date(2030, 1, 15),
+                    visit_time=time(19, 0),
+                    party_size=2,
+                    channel_code="STRESS"
+                )
+                if (i + 1) % COMMIT_EVERY == 0:
+                    await db.commit()
+            await db.commit()
+        await engine.dispose()
+
+    asyncio.run(run())
+    return count, generated
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--per-worker", type=int, default=50000)
+    parser.add_argument("--length", type=int, default=7)
+    parser.add_argument("--database-url", help="defaults to a temporary SQLite file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.database_url or f"sqlite:///{Path(tmp) / 'references.db'}"
+        engine = create_engine(url)
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        with sessionmaker(bind=engine)() as db:
+            db.add(Restaurant(id=1, name="Stress", microsite_name="Stress"))
+            db.add(Customer(id=1, email="stress@example.com"))
+            db.commit()
+
+        started = timer.perf_counter()
+        with multiprocessing.get_context("spawn").Pool(args.workers) as pool:
+            results = pool.map(
+                allocate, [(url, args.per_worker, args.length)] * args.workers
+            )
+        elapsed = timer.perf_counter() - started
+
+        with engine.connect() as conn:
+            rows, distinct = conn.execute(select(
+                func.count(Booking.id),
+                func.count(func.distinct(Booking.booking_reference))
+            )).one()
+        engine.dispose()
+
+    allocated = sum(count for count, _ in results)
+    generated = sum(candidates for _, candidates in results)
+    print(f"allocated {allocated} references in {elapsed:.1f}s "
+          f"({allocated / elapsed:.0f}/s), {generated - allocated} collisions retried")
+    print(f"rows={rows} distinct={distinct}")
+    if not rows == distinct == allocated:
+        raise SystemExit("duplicate or missing booking references")
+
+
+if __name__ == "__main__":
+    main()
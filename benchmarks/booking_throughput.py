@@ -0,0 +1,109 @@
+"""
+Booking Creation Throughput Benchmark.
+
+Compares bookings per second for the previous creation flow (customer
+lookup, customer commit and refresh, reference lookup, booking commit and
+refresh) against the current single-transaction flow (customer upsert and
+booking insert with RETURNING, one commit). Every tenth booking is made by a
+returning customer.
+
+Usage:
+    python -m benchmarks.booking_throughput [--bookings 2000]
+
+Author: AI Assistant
+"""
+
+import argparse
+import asyncio
+import time as timer
+from datetime import time
+from typing import Callable, Dict
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.models import Booking, Customer
+from app.routers.booking import (
+    generate_booking_reference, insert_booking, upsert_customer
+)
+from benchmarks.common import VISIT_DATE, temporary_database
+
+
+def email_for(i: int) -> str:
+    return f"guest{i // 10 if i % 10 else i}@example.com"
+
+
+async def legacy_create(db: AsyncSession, i: int) -> None:
+    """The booking creation flow before customer upsert and RETURNING."""
+    customer = await db.scalar(select(Customer).where(Customer.email == email_for(i)))
+    if not customer:
+        customer = Customer(first_name="Guest", email=email_for(i))
+        db.add(customer)
+        await db.commit()
+        await db.refresh(customer)
+
+    booking_reference = generate_booking_reference()
+    while await db.scalar(
+        select(Booking).where(Booking.booking_reference == booking_reference)
+    ):
+        booking_reference = generate_booking_reference()
+
+    booking = Booking(
+        booking_reference=booking_reference, restaurant_id=1, customer_id=customer.id,
+        visit_date=VISIT_DATE, visit_time=time(19, 0), party_size=2,
+        channel_code="BENCH", status="confirmed"
+    )
+    db.add(booking)
+    await db.commit()
+    await db.refresh(booking)
+
+
+async def current_create(db: AsyncSession, i: int) -> None:
+    """The current single-transaction booking creation flow."""
+    customer = await upsert_customer(db, first_name="Guest", email=email_for(i))
+    await insert_booking(
+        db, restaurant_id=1, customer_id=customer.id, visit_date=VISIT_DATE,
+        visit_time=time(19, 0), party_size=2, channel_code="BENCH",
+        status="confirmed"
+    )
+    await db.commit()
+
+
+async def run_flow(
+    async_engine: AsyncEngine, create: Callable, bookings: int
+) -> Dict[str, float]:
+    statements = []
+    event.listen(
+        async_engine.sync_engine, "before_cursor_execute",
+        lambda *args: statements.append(args[2])
+    )
+    SessionLocal = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+    started = timer.perf_counter()
+    for i in range(bookings):
+        async with SessionLocal() as db:
+            await create(db, i)
+    elapsed = timer.perf_counter() - started
+    return {
+        "bookings/s": bookings / elapsed,
+        "statements/booking": len(statements) / bookings,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--bookings", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'flow':<10}{'bookings/s':>12}{'statements/booking':>22}")
+    for label, create in (("legacy", legacy_create), ("current", current_create)):
+        # On disk, since the flows differ in how many commits they make
+        with temporary_database(in_memory=False) as (_, async_engine):
+            result = asyncio.run(run_flow(async_engine, create, args.bookings))
+        print(
+            f"{label:<10}{result['bookings/s']:>12.0f}"
+            f"{result['statements/booking']:>22.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
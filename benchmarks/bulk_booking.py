@@ -0,0 +1,106 @@
+"""
+Bulk Booking Import Benchmark.
+
+Compares importing bookings one BookingWithStripeToken request at a time
+against sending them to BookingBatch in batches. Bookings fill every slot of
+the seeded days to capacity, and every tenth booking is made by a returning
+customer.
+
+Usage:
+    python -m benchmarks.bulk_booking [--bookings 3000] [--batch-size 500]
+
+Author: AI Assistant
+"""
+
+import argparse
+import asyncio
+import math
+import time as timer
+from datetime import datetime, time, timedelta
+from typing import Any, Callable, Dict, List
+
+import httpx
+
+from app.occupancy import MAX_BOOKINGS_PER_SLOT
+from benchmarks.common import (
+    BASE_PATH, VISIT_DATE, Engines, api_client, temporary_database
+)
+
+SLOTS_PER_DAY = 40
+
+
+def bookings_for(count: int) -> List[Dict[str, Any]]:
+    """Bookings filling consecutive slots, MAX_BOOKINGS_PER_SLOT per slot."""
+    start = datetime.combine(VISIT_DATE, time(12, 0))
+    bookings = []
+    for i in range(count):
+        day, slot = divmod(i // MAX_BOOKINGS_PER_SLOT, SLOTS_PER_DAY)
+        bookings.append({
+            "VisitDate": (VISIT_DATE + timedelta(days=day)).isoformat(),
+            "VisitTime": (start + timedelta(minutes=15 * slot)).time().isoformat(),
+            "PartySize": 2,
+            "ChannelCode": "BENCH",
+            "Customer": {"Email": f"guest{i // 10 if i % 10 else i}@example.com"},
+        })
+    return bookings
+
+
+async def import_one_by_one(
+    client: httpx.AsyncClient, bookings: List[Dict[str, Any]], batch_size: int
+) -> int:
+    created = 0
+    for booking in bookings:
+        form = {k: v for k, v in booking.items() if k != "Customer"}
+        form["Customer[Email]"] = booking["Customer"]["Email"]
+        resp = await client.post(f"{BASE_PATH}/BookingWithStripeToken", data=form)
+        created += resp.status_code == 200
+    return created
+
+
+async def import_in_batches(
+    client: httpx.AsyncClient, bookings: List[Dict[str, Any]], batch_size: int
+) -> int:
+    created = 0
+    for offset in range(0, len(bookings), batch_size):
+        resp = await client.post(
+            f"{BASE_PATH}/BookingBatch", json=bookings[offset:offset + batch_size]
+        )
+        created += resp.json()["created"]
+    return created
+
+
+async def time_import(
+    engines: Engines,
+    importer: Callable,
+    bookings: List[Dict[str, Any]],
+    batch_size: int
+) -> Dict[str, float]:
+    async with api_client(engines) as client:
+        started = timer.perf_counter()
+        created = await importer(client, bookings, batch_size)
+        elapsed = timer.perf_counter() - started
+    return {"created": created, "bookings/s": created / elapsed}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--bookings", type=int, default=3000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    bookings = bookings_for(args.bookings)
+    days = math.ceil(args.bookings / (SLOTS_PER_DAY * MAX_BOOKINGS_PER_SLOT))
+
+    print(f"{'import':<14}{'created':>9}{'bookings/s':>12}")
+    for label, importer in (
+        ("one-by-one", import_one_by_one), ("batched", import_in_batches)
+    ):
+        with temporary_database(SLOTS_PER_DAY, days) as engines:
+            result = asyncio.run(
+                time_import(engines, importer, bookings, args.batch_size)
+            )
+        print(f"{label:<14}{result['created']:>9}{result['bookings/s']:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Shared Benchmark Helpers.
+
+Builds throwaway seeded databases, in memory unless commit costs matter, and
+in-process API clients bound to them through app.main.create_app(), so
+benchmarks never touch the project's restaurant_booking.db.
+
+Author: AI Assistant
+"""
+
+import tempfile
+from contextlib import asynccontextmanager, contextmanager
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import AsyncIterator, Iterator, Tuple
+
+import httpx
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import MEMORY_DATABASE_URL, create_engines
+from app.models import Base, Restaurant, AvailabilitySlot, CancellationReason
+from app.routers.availability import MOCK_BEARER_TOKEN
+
+RESTAURANT = "TheHungryUnicorn"
+BASE_PATH = f"/api/ConsumerApi/v1/Restaurant/{RESTAURANT}"
+VISIT_DATE = date(2030, 1, 15)
+
+Engines = Tuple[Engine, AsyncEngine]
+
+
+@contextmanager
+def temporary_database(
+    slots_per_day: int = 8, days: int = 1, in_memory: bool = True
+) -> Iterator[Engines]:
+    """
+    Create a seeded SQLite database that is discarded afterwards.
+
+    Args:
+        slots_per_day: Number of 15-minute slots per day, starting at 12:00
+        days: Number of days of slots starting at VISIT_DATE
+        in_memory: Keep the database in memory; False uses a file in a
+            temporary directory, for benchmarks that include commit costs
+
+    Yields:
+        Tuple of (sync engine, async engine) bound to the database
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, async_engine = create_engines(
+            MEMORY_DATABASE_URL if in_memory else f"sqlite:///{Path(tmp) / 'bench.db'}"
+        )
+        Base.metadata.create_all(bind=engine)
+
+        with sessionmaker(bind=engine)() as db:
+            restaurant = Restaurant(name=RESTAURANT, microsite_name=RESTAURANT)
+            db.add(restaurant)
+            db.add(CancellationReason(id=1, reason="Customer Request"))
+            db.flush()
+            start = datetime.combine(VISIT_DATE, time(12, 0))
+            db.add_all(
+                AvailabilitySlot(
+                    restaurant_id=restaurant.id,
+                    date=VISIT_DATE + timedelta(days=day),
+                    time=(start + timedelta(minutes=15 * i)).time()
+                )
+                for day in range(days)
+                for i in range(slots_per_day)
+            )
+            db.commit()
+
+        try:
+            yield engine, async_engine
+        finally:
+            async_engine.sync_engine.dispose()
+            engine.dispose()
+
+
+@asynccontextmanager
+async def api_client(engines: Engines) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    In-process HTTP client for an API instance bound to the given database.
+
+    Args:
+        engines: (sync engine, async engine) from temporary_database()
+
+    Yields:
+        httpx.AsyncClient sending authenticated requests straight to the app
+    """
+    from app.main import create_app
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=create_app(engines=engines)),
+        base_url="http://bench",
+        headers={"Authorization": f"Bearer {MOCK_BEARER_TOKEN}"}
+    ) as client:
+        yield client
@@ -0,0 +1,59 @@
+"""
+Response Compression Benchmark.
+
+Reports, for representative JSON responses, the compressed size and the time
+spent compressing with each content coding this process supports. Useful for
+choosing COMPRESSION_MINIMUM_SIZE and the compression levels.
+
+Usage:
+    python -m benchmarks.compression [--repeat 200]
+
+Author: AI Assistant
+"""
+
+import argparse
+import time as timer
+
+from fastapi.responses import ORJSONResponse
+
+from app.compression import Compressor, available_encodings
+from benchmarks.serialization import (
+    availability_calendar,
+    availability_search,
+    booking_batch,
+    booking_details,
+)
+
+
+def compress(encoding: str, body: bytes) -> bytes:
+    compressor = Compressor(encoding)
+    return compressor.compress(body) + compressor.finish()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    responses = {
+        "availability search": availability_search,
+        "availability calendar": availability_calendar,
+        "booking details": booking_details,
+        "booking batch": booking_batch,
+    }
+    print(f"{'response':<24}{'encoding':>9}{'bytes':>9}{'ratio':>8}{'µs':>10}")
+    for label, build in responses.items():
+        body = ORJSONResponse(build().model_dump(mode="json")).body
+        print(f"{label:<24}{'identity':>9}{len(body):>9}{1:>8.1f}{0:>10.1f}")
+        for encoding in available_encodings():
+            size = len(compress(encoding, body))
+            started = timer.perf_counter()
+            for _ in range(args.repeat):
+                compress(encoding, body)
+            elapsed = (timer.perf_counter() - started) / args.repeat * 1e6
+            print(f"{'':<24}{encoding:>9}{size:>9}{len(body) / size:>8.1f}"
+                  f"{elapsed:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
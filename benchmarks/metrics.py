@@ -0,0 +1,76 @@
+"""
+Request Metrics Overhead Benchmark.
+
+Measures what MetricsMiddleware adds to each request, by calling a minimal
+ASGI app directly with and without the middleware, and how long a /metrics
+scrape takes to render once every API route has recorded requests.
+
+Usage:
+    python -m benchmarks.metrics [--requests 100000]
+
+Author: AI Assistant
+"""
+
+import argparse
+import asyncio
+import time as timer
+from types import SimpleNamespace
+
+from fastapi.routing import APIRoute
+
+from app.main import app
+from app.metrics import Metrics, MetricsMiddleware
+
+ROUTE = SimpleNamespace(path="/api/ConsumerApi/v1/Restaurant/{restaurant_name}/")
+
+
+async def endpoint(scope, receive, send) -> None:
+    scope["route"] = ROUTE  # Set by FastAPI when it routes a request
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def discard(message) -> None:
+    pass
+
+
+async def time_requests(asgi_app, requests: int) -> float:
+    """Return mean microseconds per request through an ASGI app."""
+    started = timer.perf_counter()
+    for _ in range(requests):
+        scope = {"type": "http", "method": "GET", "path": "/"}
+        await asgi_app(scope, None, discard)
+    return (timer.perf_counter() - started) / requests * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=100000)
+    args = parser.parse_args()
+
+    bare = asyncio.run(time_requests(endpoint, args.requests))
+    wrapped = asyncio.run(
+        time_requests(MetricsMiddleware(endpoint, Metrics()), args.requests)
+    )
+    print(f"{'request':<12}{'us':>10}")
+    print(f"{'bare':<12}{bare:>10.2f}")
+    print(f"{'metrics':<12}{wrapped:>10.2f}")
+    print(f"per-request overhead: {wrapped - bare:.2f} us")
+
+    metrics = Metrics()
+    routes = [route for route in app.routes if isinstance(route, APIRoute)]
+    metrics.register_routes(routes)
+    for i in range(args.requests):
+        route = routes[i % len(routes)]
+        status = (200, 404, 409)[i % 3]
+        metrics.observe(min(route.methods), route.path, status, i % 50 / 1000)
+    repeat = 100
+    started = timer.perf_counter()
+    for _ in range(repeat):
+        body = metrics.render()
+    elapsed = (timer.perf_counter() - started) / repeat * 1e3
+    print(f"scrape of {len(routes)} routes: {elapsed:.2f} ms, {len(body):,} bytes")
+
+
+if __name__ == "__main__":
+    main()
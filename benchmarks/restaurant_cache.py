@@ -0,0 +1,76 @@
+"""
+Restaurant Cache Benchmark.
+
+Quantifies the per-request saving of the shared restaurant lookup cache by
+timing the get_restaurant dependency on its own and a full availability
+search request, each with the cache enabled and disabled (TTL of 0).
+
+Usage:
+    python -m benchmarks.restaurant_cache [--requests 2000]
+
+Author: AI Assistant
+"""
+
+import argparse
+import asyncio
+import time as timer
+
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from app.cache import restaurant_cache
+from app.dependencies import get_restaurant
+from benchmarks.common import (
+    BASE_PATH, RESTAURANT, VISIT_DATE, Engines, api_client, temporary_database
+)
+
+
+async def time_lookup(async_engine: AsyncEngine, requests: int) -> float:
+    """Return mean microseconds per get_restaurant call."""
+    SessionLocal = async_sessionmaker(bind=async_engine)
+    async with SessionLocal() as db:
+        await get_restaurant(RESTAURANT, db)  # Warm connection and cache
+        started = timer.perf_counter()
+        for _ in range(requests):
+            await get_restaurant(RESTAURANT, db)
+        return (timer.perf_counter() - started) / requests * 1e6
+
+
+async def time_search(engines: Engines, requests: int) -> float:
+    """Return mean microseconds per availability search request."""
+    form = {
+        "VisitDate": VISIT_DATE.isoformat(), "PartySize": 2, "ChannelCode": "ONLINE"
+    }
+    async with api_client(engines) as client:
+        await client.post(f"{BASE_PATH}/AvailabilitySearch", data=form)
+        started = timer.perf_counter()
+        for _ in range(requests):
+            await client.post(f"{BASE_PATH}/AvailabilitySearch", data=form)
+        return (timer.perf_counter() - started) / requests * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    configured_ttl = restaurant_cache.ttl
+    results = {}
+    with temporary_database() as engines:
+        for label, ttl in (("uncached", 0), ("cached", configured_ttl or 300)):
+            restaurant_cache.ttl = ttl
+            restaurant_cache.invalidate()
+            results[label] = (
+                asyncio.run(time_lookup(engines[1], args.requests)),
+                asyncio.run(time_search(engines, args.requests)),
+            )
+    restaurant_cache.ttl = configured_ttl
+
+    print(f"{'':<10}{'lookup us':>12}{'search us':>12}")
+    for label, (lookup, search) in results.items():
+        print(f"{label:<10}{lookup:>12.1f}{search:>12.1f}")
+    saving = results["uncached"][1] - results["cached"][1]
+    print(f"per-request saving: {saving:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
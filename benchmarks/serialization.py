@@ -0,0 +1,144 @@
+"""
+Response Serialization Benchmark.
+
+Compares the per-response cost of the previous serialization path (a
+hand-built dict of date/time objects walked by jsonable_encoder and rendered
+by the stdlib json module) against the current one (a response model dumped
+by pydantic-core and rendered by orjson) for large availability and booking
+responses. No database or HTTP is involved; only serialization is timed.
+
+Usage:
+    python -m benchmarks.serialization [--repeat 200]
+
+Author: AI Assistant
+"""
+
+import argparse
+import time as timer
+from datetime import datetime, time, timedelta
+from typing import Callable, Dict
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import BaseModel
+
+from app.occupancy import MAX_BOOKINGS_PER_SLOT
+from app.schemas import (
+    AvailabilityCalendarResponse,
+    AvailabilitySearchResponse,
+    AvailableSlot,
+    BookingBatchCreated,
+    BookingBatchResponse,
+    BookingCustomerDetails,
+    BookingDetailsResponse,
+)
+from benchmarks.common import RESTAURANT, VISIT_DATE
+
+CREATED_AT = datetime(2030, 1, 1, 12, 30, 15, 123456)
+
+
+def slot_times(count: int):
+    start = datetime.combine(VISIT_DATE, time(0, 0))
+    return [(start + timedelta(minutes=15 * i)).time() for i in range(count)]
+
+
+def availability_search() -> BaseModel:
+    """A day of 96 quarter-hour slots."""
+    slots = [
+        AvailableSlot(time=t, available=i % 4 != 0, max_party_size=8,
+                      current_bookings=i % 4)
+        for i, t in enumerate(slot_times(96))
+    ]
+    return AvailabilitySearchResponse(
+        restaurant=RESTAURANT, restaurant_id=1, visit_date=VISIT_DATE, party_size=2,
+        channel_code="ONLINE", available_slots=slots, total_slots=len(slots)
+    )
+
+
+def availability_calendar() -> BaseModel:
+    """90 days of 48 slots each."""
+    times = slot_times(48)
+    return AvailabilityCalendarResponse(
+        restaurant=RESTAURANT, restaurant_id=1, start_date=VISIT_DATE,
+        end_date=VISIT_DATE + timedelta(days=89), party_size=2,
+        channel_code="ONLINE", max_bookings_per_slot=MAX_BOOKINGS_PER_SLOT,
+        times=times,
+        days={
+            VISIT_DATE + timedelta(days=day): [(day + i) % 4 for i in range(len(times))]
+            for day in range(90)
+        }
+    )
+
+
+def booking_details() -> BaseModel:
+    """A single booking lookup."""
+    return BookingDetailsResponse(
+        booking_reference="ABC1234", booking_id=1, restaurant=RESTAURANT,
+        visit_date=VISIT_DATE, visit_time=time(19, 0), party_size=2,
+        channel_code="ONLINE", special_requests="Window seat",
+        is_leave_time_confirmed=False, room_number=None, status="confirmed",
+        customer=BookingCustomerDetails(
+            id=1, title="Ms", first_name="Alice", surname="Smith",
+            email="alice@example.com", mobile="07700900000", phone=None
+        ),
+        cancellation_reason=None, created_at=CREATED_AT, updated_at=CREATED_AT
+    )
+
+
+def booking_batch() -> BaseModel:
+    """BookingBatch results for 1000 created bookings."""
+    results = [
+        BookingBatchCreated(
+            index=i, status_code=200, booking_reference=f"REF{i:04d}", booking_id=i,
+            visit_date=VISIT_DATE, visit_time=time(19, 0), party_size=2,
+            customer_id=i, status="confirmed", created_at=CREATED_AT
+        )
+        for i in range(1000)
+    ]
+    return BookingBatchResponse(
+        restaurant=RESTAURANT, total=1000, created=1000, failed=0, results=results
+    )
+
+
+def legacy_render(model: BaseModel) -> Callable[[], bytes]:
+    payload = model.model_dump()  # Plain dict with date/time objects
+    return lambda: JSONResponse(jsonable_encoder(payload)).body
+
+
+def current_render(model: BaseModel) -> Callable[[], bytes]:
+    return lambda: ORJSONResponse(model.model_dump(mode="json")).body
+
+
+def time_render(render: Callable[[], bytes], repeat: int) -> float:
+    """Return mean microseconds per rendered response."""
+    render()
+    started = timer.perf_counter()
+    for _ in range(repeat):
+        render()
+    return (timer.perf_counter() - started) / repeat * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    responses: Dict[str, Callable[[], BaseModel]] = {
+        "availability search": availability_search,
+        "availability calendar": availability_calendar,
+        "booking details": booking_details,
+        "booking batch": booking_batch,
+    }
+    print(f"{'response':<24}{'bytes':>9}{'legacy µs':>12}{'current µs':>12}"
+          f"{'speedup':>9}")
+    for label, build in responses.items():
+        model = build()
+        legacy = time_render(legacy_render(model), args.repeat)
+        current = time_render(current_render(model), args.repeat)
+        size = len(current_render(model)())
+        print(f"{label:<24}{size:>9}{legacy:>12.1f}{current:>12.1f}"
+              f"{legacy / current:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
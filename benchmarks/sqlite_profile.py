@@ -0,0 +1,142 @@
+"""
+SQLite Tuning Profile Benchmark.
+
+Measures read and write throughput under a mixed load for each SQLite tuning
+profile defined in app.database. Reader threads run the availability search
+occupancy query while writer threads insert and commit bookings, all against
+a fresh on-disk database per profile.
+
+Usage:
+    python -m benchmarks.sqlite_profile [--seconds 5] [--readers 4] [--writers 2]
+
+Author: AI Assistant
+"""
+
+import argparse
+import tempfile
+import threading
+import time as timer
+from datetime import date, time
+from pathlib import Path
+from typing import Dict
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.database import SQLITE_PROFILES, apply_sqlite_pragmas, sqlite_pragmas
+from app.models import Base, Restaurant, Customer, Booking, AvailabilitySlot
+
+VISIT_DATE = date(2030, 1, 15)
+SLOT_TIMES = [time(h, m) for h in (12, 13, 19, 20) for m in (0, 30)]
+
+
+def run_profile(
+    profile: str, seconds: float, readers: int, writers: int
+) -> Dict[str, float]:
+    """
+    Run the mixed workload against a fresh database tuned with one profile.
+
+    Returns:
+        Dict with reads/s, writes/s and the number of lock errors
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(
+            f"sqlite:///{Path(tmp) / 'bench.db'}",
+            connect_args={"check_same_thread": False},
+            pool_size=readers + writers
+        )
+        apply_sqlite_pragmas(engine, sqlite_pragmas(profile))
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine)
+
+        with Session() as db:
+            restaurant = Restaurant(name="Bench", microsite_name="Bench")
+            customer = Customer(email="bench@example.com")
+            db.add_all([restaurant, customer])
+            db.flush()
+            db.add_all(
+                AvailabilitySlot(restaurant_id=restaurant.id, date=VISIT_DATE, time=t)
+                for t in SLOT_TIMES
+            )
+            db.commit()
+            restaurant_id, customer_id = restaurant.id, customer.id
+
+        counts = {"reads": 0, "writes": 0, "locked": 0}
+        lock = threading.Lock()
+        deadline = timer.perf_counter() + seconds
+
+        def reader() -> None:
+            query = (
+                select(Booking.visit_time, func.count(Booking.id))
+                .where(
+                    Booking.restaurant_id == restaurant_id,
+                    Booking.visit_date == VISIT_DATE,
+                    Booking.status == "confirmed"
+                )
+                .group_by(Booking.visit_time)
+            )
+            done = 0
+            while timer.perf_counter() < deadline:
+                with Session() as db:
+                    db.execute(query).all()
+                done += 1
+            with lock:
+                counts["reads"] += done
+
+        def writer(worker: int) -> None:
+            done = locked = 0
+            while timer.perf_counter() < deadline:
+                with Session() as db:
+                    db.add(Booking(
+                        booking_reference=f"W{worker}-{done}-{locked}",
+                        restaurant_id=restaurant_id,
+                        customer_id=customer_id,
+                        visit_date=VISIT_DATE,
+                        visit_time=SLOT_TIMES[done % len(SLOT_TIMES)],
+                        party_size=2,
+                        channel_code="BENCH"
+                    ))
+                    try:
+                        db.commit()
+                        done += 1
+                    except OperationalError:
+                        db.rollback()
+                        locked += 1
+            with lock:
+                counts["writes"] += done
+                counts["locked"] += locked
+
+        threads = [threading.Thread(target=reader) for _ in range(readers)]
+        threads += [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        engine.dispose()
+
+    return {
+        "reads/s": counts["reads"] / seconds,
+        "writes/s": counts["writes"] / seconds,
+        "locked": counts["locked"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--writers", type=int, default=2)
+    args = parser.parse_args()
+
+    print(f"{'profile':<12}{'reads/s':>12}{'writes/s':>12}{'locked':>10}")
+    for profile in SQLITE_PROFILES:
+        result = run_profile(profile, args.seconds, args.readers, args.writers)
+        print(
+            f"{profile:<12}{result['reads/s']:>12.0f}"
+            f"{result['writes/s']:>12.0f}{result['locked']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
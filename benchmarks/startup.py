@@ -0,0 +1,99 @@
+"""
+Server Startup Benchmark.
+
+Measures how long the application startup hook takes in each startup mode,
+each in a fresh interpreter so nothing is warm:
+
+- fresh: migrate an empty database and seed the sample data
+- existing: migration and sample data checks on an initialized database
+- snapshot: restore a prebuilt snapshot (DATABASE_SNAPSHOT) of the sample
+  data, and of a large generated dataset
+
+For the large dataset the time to generate it with ``python -m app.seed`` is
+shown for comparison. Import time is reported separately; it is the same in
+every mode.
+
+Usage:
+    python -m benchmarks.startup [--restaurants 20] [--days 90]
+
+Author: AI Assistant
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time as timer
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+# Run in a fresh interpreter: prints import and startup hook seconds
+CHILD = """
+import asyncio, time
+started = time.perf_counter()
+import app.main
+imported = time.perf_counter()
+asyncio.run(app.main.app.router.startup())
+print(imported - started, time.perf_counter() - imported)
+"""
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def start(database: Path, snapshot: Optional[Path] = None) -> Tuple[float, float]:
+    """Run the startup hook against a database; return (import, startup) seconds."""
+    env: Dict[str, str] = dict(os.environ, DATABASE_URL=f"sqlite:///{database}")
+    env.pop("DATABASE_SNAPSHOT", None)
+    if snapshot is not None:
+        env["DATABASE_SNAPSHOT"] = str(snapshot)
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD], cwd=ROOT, env=env,
+        capture_output=True, text=True, check=True
+    ).stdout
+    imported, started = output.split("\n")[-2].split()
+    return float(imported), float(started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--restaurants", type=int, default=20)
+    parser.add_argument("--days", type=int, default=90)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        rows = []
+
+        sample = tmp / "sample.db"
+        rows.append(("fresh database", "sample", *start(sample)))
+        rows.append(("existing database", "sample", *start(sample)))
+        shutil.copy(sample, tmp / "sample-snapshot.db")
+        rows.append((
+            "snapshot", "sample",
+            *start(tmp / "restored.db", tmp / "sample-snapshot.db")
+        ))
+
+        large = tmp / "large-snapshot.db"
+        label = f"{args.restaurants}x{args.days}d"
+        started = timer.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "app.seed", f"--database-url=sqlite:///{large}",
+             f"--restaurants={args.restaurants}", f"--days={args.days}",
+             "--slot-minutes=15", "--booking-density=0.4", "--seed=1"],
+            cwd=ROOT, capture_output=True, check=True
+        )
+        rows.append((
+            "generate (app.seed)", label, float("nan"),
+            timer.perf_counter() - started
+        ))
+        rows.append(("snapshot", label, *start(tmp / "restored-large.db", large)))
+
+    print(f"{'mode':<22}{'data':<14}{'import ms':>11}{'startup ms':>12}")
+    for mode, data, imported, started in rows:
+        print(f"{mode:<22}{data:<14}{imported * 1000:>11.0f}{started * 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""baseline schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 01:51:49.271219
+
+Schema as previously created by ``Base.metadata.create_all``. Databases that
+predate migrations are stamped at this revision instead of running it.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'restaurants',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('microsite_name', sa.String(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_restaurants_id', 'restaurants', ['id'])
+    op.create_index('ix_restaurants_name', 'restaurants', ['name'], unique=True)
+    op.create_index(
+        'ix_restaurants_microsite_name', 'restaurants', ['microsite_name'], unique=True
+    )
+
+    op.create_table(
+        'customers',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(), nullable=True),
+        sa.Column('first_name', sa.String(), nullable=True),
+        sa.Column('surname', sa.String(), nullable=True),
+        sa.Column('mobile_country_code', sa.String(), nullable=True),
+        sa.Column('mobile', sa.String(), nullable=True),
+        sa.Column('phone_country_code', sa.String(), nullable=True),
+        sa.Column('phone', sa.String(), nullable=True),
+        sa.Column('email', sa.String(), nullable=True),
+        sa.Column('receive_email_marketing', sa.Boolean(), nullable=True),
+        sa.Column('receive_sms_marketing', sa.Boolean(), nullable=True),
+        sa.Column('group_email_marketing_opt_in_text', sa.Text(), nullable=True),
+        sa.Column('group_sms_marketing_opt_in_text', sa.Text(), nullable=True),
+        sa.Column('receive_restaurant_email_marketing', sa.Boolean(), nullable=True),
+        sa.Column('receive_restaurant_sms_marketing', sa.Boolean(), nullable=True),
+        sa.Column('restaurant_email_marketing_opt_in_text', sa.Text(), nullable=True),
+        sa.Column('restaurant_sms_marketing_opt_in_text', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_customers_email', 'customers', ['email'])
+    op.create_index('ix_customers_id', 'customers', ['id'])
+
+    op.create_table(
+        'cancellation_reasons',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('reason', sa.String(), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_cancellation_reasons_id', 'cancellation_reasons', ['id'])
+
+    op.create_table(
+        'bookings',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('booking_reference', sa.String(), nullable=False),
+        sa.Column('restaurant_id', sa.Integer(), nullable=False),
+        sa.Column('customer_id', sa.Integer(), nullable=False),
+        sa.Column('visit_date', sa.Date(), nullable=False),
+        sa.Column('visit_time', sa.Time(), nullable=False),
+        sa.Column('party_size', sa.Integer(), nullable=False),
+        sa.Column('channel_code', sa.String(), nullable=False),
+        sa.Column('special_requests', sa.Text(), nullable=True),
+        sa.Column('is_leave_time_confirmed', sa.Boolean(), nullable=True),
+        sa.Column('room_number', sa.String(), nullable=True),
+        sa.Column('status', sa.String(), nullable=True),
+        sa.Column('cancellation_reason_id', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['restaurant_id'], ['restaurants.id']),
+        sa.ForeignKeyConstraint(['customer_id'], ['customers.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_bookings_booking_reference', 'bookings', ['booking_reference'], unique=True
+    )
+    op.create_index('ix_bookings_id', 'bookings', ['id'])
+
+    op.create_table(
+        'availability_slots',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('restaurant_id', sa.Integer(), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('time', sa.Time(), nullable=False),
+        sa.Column('max_party_size', sa.Integer(), nullable=True),
+        sa.Column('available', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['restaurant_id'], ['restaurants.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_availability_slots_id', 'availability_slots', ['id'])
+
+
+def downgrade() -> None:
+    op.drop_table('availability_slots')
+    op.drop_table('bookings')
+    op.drop_table('cancellation_reasons')
+    op.drop_table('customers')
+    op.drop_table('restaurants')
@@ -0,0 +1,38 @@
+"""composite indexes for booking and availability hot paths
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 02:05:12.418305
+
+Availability search filters slots on (restaurant_id, date, max_party_size)
+and counts confirmed bookings on (restaurant_id, visit_date) grouped by
+visit_time and filtered on status. Both were full table scans.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_bookings_restaurant_visit',
+        'bookings',
+        ['restaurant_id', 'visit_date', 'visit_time', 'status']
+    )
+    op.create_index(
+        'ix_availability_slots_restaurant_date',
+        'availability_slots',
+        ['restaurant_id', 'date', 'max_party_size']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_availability_slots_restaurant_date', 'availability_slots')
+    op.drop_index('ix_bookings_restaurant_visit', 'bookings')
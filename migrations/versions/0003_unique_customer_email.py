@@ -0,0 +1,51 @@
+"""unique customer email
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 02:31:40.902117
+
+Booking creation upserts customers with ON CONFLICT (email), which needs a
+unique index. Empty emails become NULL (NULLs never conflict), and customers
+sharing an email are merged into the oldest record before the index is
+rebuilt as unique.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("UPDATE customers SET email = NULL WHERE email = ''")
+    op.execute(
+        """
+        UPDATE bookings SET customer_id = (
+            SELECT MIN(keep.id) FROM customers keep
+            JOIN customers dupe ON dupe.email = keep.email
+            WHERE dupe.id = bookings.customer_id
+        )
+        WHERE customer_id IN (
+            SELECT c.id FROM customers c
+            WHERE c.id > (SELECT MIN(d.id) FROM customers d WHERE d.email = c.email)
+        )
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM customers
+        WHERE id > (SELECT MIN(d.id) FROM customers d WHERE d.email = customers.email)
+        """
+    )
+    op.drop_index('ix_customers_email', 'customers')
+    op.create_index('ix_customers_email', 'customers', ['email'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_customers_email', 'customers')
+    op.create_index('ix_customers_email', 'customers', ['email'])
@@ -0,0 +1,43 @@
+"""per-slot booked counter for atomic reservations
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 02:52:16.530871
+
+Bookings reserve capacity with a guarded UPDATE on this counter, so it is
+backfilled from the confirmed bookings already in each slot.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('availability_slots') as batch_op:
+        batch_op.add_column(
+            sa.Column('booked_count', sa.Integer(), nullable=False, server_default='0')
+        )
+    op.execute(
+        """
+        UPDATE availability_slots SET booked_count = (
+            SELECT COUNT(*) FROM bookings
+            WHERE bookings.restaurant_id = availability_slots.restaurant_id
+            AND bookings.visit_date = availability_slots.date
+            AND bookings.visit_time = availability_slots.time
+            AND bookings.status = 'confirmed'
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('availability_slots') as batch_op:
+        batch_op.drop_column('booked_count')
@@ -0,0 +1,97 @@
+"""weekly slot templates and booking archive for rolling availability
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 03:05:41.207315
+
+The maintenance job generates future slots from slot_templates and moves
+past bookings into archived_bookings. Templates are backfilled from the
+weekdays and times of the slots already in each restaurant.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    slot_templates = op.create_table(
+        'slot_templates',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('restaurant_id', sa.Integer(), nullable=False),
+        sa.Column('weekday', sa.Integer(), nullable=False),
+        sa.Column('time', sa.Time(), nullable=False),
+        sa.Column('max_party_size', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['restaurant_id'], ['restaurants.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint(
+            'restaurant_id', 'weekday', 'time',
+            name='uq_slot_templates_restaurant_weekday_time'
+        )
+    )
+    op.create_index('ix_slot_templates_id', 'slot_templates', ['id'])
+
+    op.create_table(
+        'archived_bookings',
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('booking_reference', sa.String(), nullable=False),
+        sa.Column('restaurant_id', sa.Integer(), nullable=False),
+        sa.Column('customer_id', sa.Integer(), nullable=False),
+        sa.Column('visit_date', sa.Date(), nullable=False),
+        sa.Column('visit_time', sa.Time(), nullable=False),
+        sa.Column('party_size', sa.Integer(), nullable=False),
+        sa.Column('channel_code', sa.String(), nullable=False),
+        sa.Column('special_requests', sa.Text(), nullable=True),
+        sa.Column('is_leave_time_confirmed', sa.Boolean(), nullable=True),
+        sa.Column('room_number', sa.String(), nullable=True),
+        sa.Column('status', sa.String(), nullable=True),
+        sa.Column('cancellation_reason_id', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.Column('archived_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_archived_bookings_booking_reference',
+        'archived_bookings', ['booking_reference']
+    )
+
+    slots = sa.table(
+        'availability_slots',
+        sa.column('restaurant_id', sa.Integer()),
+        sa.column('date', sa.Date()),
+        sa.column('time', sa.Time()),
+        sa.column('max_party_size', sa.Integer())
+    )
+    templates = {}
+    for restaurant_id, slot_date, slot_time, max_party_size in op.get_bind().execute(
+        sa.select(
+            slots.c.restaurant_id, slots.c.date, slots.c.time,
+            sa.func.max(slots.c.max_party_size)
+        ).group_by(slots.c.restaurant_id, slots.c.date, slots.c.time)
+    ):
+        key = (restaurant_id, slot_date.weekday(), slot_time)
+        templates[key] = max(templates.get(key, 0), max_party_size or 8)
+    if templates:
+        op.bulk_insert(slot_templates, [
+            {
+                'restaurant_id': restaurant_id, 'weekday': weekday,
+                'time': slot_time, 'max_party_size': max_party_size
+            }
+            for (restaurant_id, weekday, slot_time), max_party_size
+            in sorted(templates.items())
+        ])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_archived_bookings_booking_reference', 'archived_bookings')
+    op.drop_table('archived_bookings')
+    op.drop_index('ix_slot_templates_id', 'slot_templates')
+    op.drop_table('slot_templates')
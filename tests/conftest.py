@@ -1,6 +1,230 @@
+"""
+Shared fixtures.
+
+Server tests run against a fresh SQLite file per test by default, each with
+its own app instance from app.main.create_app(), so they can run in parallel
+with ``pytest -n auto`` (pytest-xdist). Set TEST_DATABASE_URL to run them
+against another database: ``sqlite://`` for a private in-memory database per
+test, or e.g. ``postgresql://postgres@localhost/booking_test`` for another
+backend, whose tables are dropped before each test.
+
+Booking tests seed TheHungryUnicorn with seed_restaurant and drive the API
+through the book, book_ref, cancel and booked_count helpers. Modules import the shared
+constants with ``from conftest import BASE_PATH, VISIT_DATE``.
+"""
+
+import asyncio
+import os
 import sys
+from datetime import date, time
 from pathlib import Path
 
+import pytest
+
 # project root is parent of the tests directory
 ROOT = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(ROOT))
\ No newline at end of file
+sys.path.insert(0, str(ROOT))
+
+# Restaurant seeded by seed_restaurant and the API path of its resources
+RESTAURANT_NAME = "TheHungryUnicorn"
+BASE_PATH = f"/api/ConsumerApi/v1/Restaurant/{RESTAURANT_NAME}"
+
+# Day seed_restaurant creates slots for and book() books
+VISIT_DATE = date(2030, 1, 15)
+
+
+@pytest.fixture
+def engines(tmp_path):
+    """Sync and asyncio engines on an empty test database, one per test."""
+    from sqlalchemy import MetaData
+    from app.database import create_engines
+
+    url = os.getenv("TEST_DATABASE_URL") or f"sqlite:///{tmp_path / 'test.db'}"
+    engine, async_engine = create_engines(url)
+    leftovers = MetaData()
+    leftovers.reflect(bind=engine)
+    leftovers.drop_all(bind=engine)
+    yield engine, async_engine
+    async_engine.sync_engine.dispose()
+    engine.dispose()
+
+
+@pytest.fixture
+def empty_db_engine(engines):
+    """Engine on an empty test database, one per test."""
+    return engines[0]
+
+
+@pytest.fixture
+def db_engine(empty_db_engine):
+    """Isolated test database with the full schema."""
+    from app.models import Base
+
+    Base.metadata.create_all(bind=empty_db_engine)
+    return empty_db_engine
+
+
+@pytest.fixture
+def async_db_engine(db_engine, engines):
+    """asyncio engine on the same database as db_engine."""
+    return engines[1]
+
+
+@pytest.fixture
+def db_session(db_engine):
+    from sqlalchemy.orm import sessionmaker
+
+    session = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def client(db_engine, async_db_engine):
+    """TestClient for a mock server bound to the isolated test database."""
+    from fastapi.testclient import TestClient
+    from app.cache import cancellation_reason_cache, restaurant_cache
+    from app.main import create_app
+    from app.routers.availability import MOCK_BEARER_TOKEN
+
+    app = create_app(engines=(db_engine, async_db_engine))
+    restaurant_cache.invalidate()
+    cancellation_reason_cache.invalidate()
+    test_client = TestClient(app)
+    test_client.headers["Authorization"] = f"Bearer {MOCK_BEARER_TOKEN}"
+    yield test_client
+    restaurant_cache.invalidate()
+    cancellation_reason_cache.invalidate()
+
+
+@pytest.fixture
+def query_counter(async_db_engine):
+    """List that collects every SQL statement the API runs on the test DB."""
+    from sqlalchemy import event
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context,
+                              executemany):
+        statements.append(statement)
+
+    sync_engine = async_db_engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+def seed_restaurant(db_session):
+    """
+    Function adding TheHungryUnicorn with slots and cancellation reasons.
+
+    Slots are created at every time in ``slot_times`` on every day in
+    ``dates``; those in ``unavailable`` are closed. ``reasons`` maps
+    cancellation reason IDs to their text. Returns the restaurant's ID.
+    """
+    from app.models import AvailabilitySlot, CancellationReason, Restaurant
+
+    def seed(
+        slot_times=(time(19, 0), time(20, 0)),
+        dates=(VISIT_DATE,),
+        unavailable=(),
+        reasons=None
+    ):
+        if reasons is None:
+            reasons = {1: "Customer Request"}
+        restaurant = Restaurant(name=RESTAURANT_NAME, microsite_name=RESTAURANT_NAME)
+        db_session.add(restaurant)
+        db_session.add_all(
+            CancellationReason(id=reason_id, reason=reason)
+            for reason_id, reason in reasons.items()
+        )
+        db_session.flush()
+        db_session.add_all(
+            AvailabilitySlot(
+                restaurant_id=restaurant.id, date=day, time=slot_time,
+                available=slot_time not in unavailable
+            )
+            for day in dates
+            for slot_time in (*slot_times, *unavailable)
+        )
+        db_session.commit()
+        return restaurant.id
+
+    return seed
+
+
+@pytest.fixture
+def book(client):
+    """
+    Function posting a BookingWithStripeToken request; returns the response.
+
+    Keyword arguments other than the visit and party size are customer
+    fields, e.g. ``book(Email="alice@example.com")``.
+    """
+    def book(visit_time="19:00:00", party_size=2, visit_date=VISIT_DATE, **customer):
+        return client.post(f"{BASE_PATH}/BookingWithStripeToken", data={
+            "VisitDate": visit_date.isoformat(),
+            "VisitTime": visit_time,
+            "PartySize": party_size,
+            "ChannelCode": "ONLINE",
+            **{f"Customer[{field}]": value for field, value in customer.items()},
+        })
+
+    return book
+
+
+@pytest.fixture
+def book_ref(book):
+    """Function making a booking that must succeed; returns its reference."""
+    def book_ref(*args, **kwargs):
+        resp = book(*args, **kwargs)
+        assert resp.status_code == 200
+        return resp.json()["booking_reference"]
+
+    return book_ref
+
+
+@pytest.fixture
+def cancel(client):
+    """Function cancelling a booking by reference; returns the response."""
+    def cancel(reference, reason_id=1):
+        return client.post(f"{BASE_PATH}/Booking/{reference}/Cancel", data={
+            "micrositeName": RESTAURANT_NAME,
+            "bookingReference": reference,
+            "cancellationReasonId": reason_id,
+        })
+
+    return cancel
+
+
+@pytest.fixture
+def booked_count(db_session):
+    """Function reading a slot's booked_count counter from the database."""
+    from app.models import AvailabilitySlot
+
+    def booked_count(slot_time, visit_date=VISIT_DATE):
+        db_session.expire_all()
+        return db_session.query(AvailabilitySlot.booked_count).filter(
+            AvailabilitySlot.date == visit_date, AvailabilitySlot.time == slot_time
+        ).scalar()
+
+    return booked_count
+
+
+@pytest.fixture
+def warm_index(async_db_engine):
+    """Function warming the occupancy index from the test database."""
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+    from app.occupancy import occupancy_index
+
+    async def rebuild():
+        async with async_sessionmaker(async_db_engine)() as db:
+            await occupancy_index.rebuild(db)
+
+    def warm():
+        asyncio.run(rebuild())
+        return occupancy_index
+
+    yield warm
+    occupancy_index.clear()
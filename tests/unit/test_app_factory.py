@@ -0,0 +1,77 @@
+from datetime import date, timedelta
+
+import pytest
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from sqlalchemy import inspect
+
+from app.cache import cancellation_reason_cache, restaurant_cache
+from app.database import MEMORY_DATABASE_URL
+from app.main import create_app
+from app.occupancy import occupancy_index
+from app.routers.availability import MOCK_BEARER_TOKEN
+
+BASE_PATH = "/api/ConsumerApi/v1/Restaurant/TheHungryUnicorn"
+
+
+@pytest.fixture
+def serve():
+    """Start a mock server on a new in-memory database."""
+    def serve():
+        restaurant_cache.invalidate()
+        cancellation_reason_cache.invalidate()
+        client = TestClient(create_app(MEMORY_DATABASE_URL, background_jobs=False))
+        client.headers["Authorization"] = f"Bearer {MOCK_BEARER_TOKEN}"
+        return client
+
+    yield serve
+    restaurant_cache.invalidate()
+    cancellation_reason_cache.invalidate()
+
+
+def book_first_available_slot(client):
+    visit_date = (date.today() + timedelta(days=1)).isoformat()
+    slots = client.post(f"{BASE_PATH}/AvailabilitySearch", data={
+        "VisitDate": visit_date, "PartySize": 2, "ChannelCode": "ONLINE"
+    }).json()["available_slots"]
+    slot = next(slot for slot in slots if slot["available"])
+
+    resp = client.post(f"{BASE_PATH}/BookingWithStripeToken", data={
+        "VisitDate": visit_date,
+        "VisitTime": slot["time"],
+        "PartySize": 2,
+        "ChannelCode": "ONLINE",
+        "Customer[Email]": "alice@example.com",
+    })
+    assert resp.status_code == 200
+    return resp.json()["booking_reference"]
+
+
+def test_in_memory_servers_are_seeded_and_isolated(serve):
+    with serve() as first:
+        ref = book_first_available_slot(first)
+        assert first.get(f"{BASE_PATH}/Booking/{ref}").status_code == 200
+        assert occupancy_index.ready
+
+    # Shutdown releases the database and the process-wide occupancy index
+    assert not occupancy_index.ready
+    with serve() as second:
+        assert second.get(f"{BASE_PATH}/Booking/{ref}").status_code == 404
+
+
+def test_servers_bound_to_a_database_do_not_touch_its_contents(
+    db_engine, async_db_engine
+):
+    with TestClient(create_app(engines=(db_engine, async_db_engine))) as client:
+        assert client.get("/").status_code == 200
+    assert "alembic_version" not in inspect(db_engine).get_table_names()
+
+
+def test_root_lists_every_api_route(client):
+    advertised = set(client.get("/").json()["endpoints"].values())
+    api_routes = {
+        route.path for route in client.app.routes
+        if isinstance(route, APIRoute) and route.path.startswith("/api/")
+    }
+
+    assert api_routes <= advertised
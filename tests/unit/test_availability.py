@@ -0,0 +1,125 @@
+from datetime import datetime, time, timedelta
+
+from app.models import AvailabilitySlot
+from conftest import BASE_PATH, VISIT_DATE
+
+SEARCH_PATH = f"{BASE_PATH}/AvailabilitySearch"
+CALENDAR_PATH = f"{BASE_PATH}/AvailabilityCalendar"
+
+
+def quarter_hours(count):
+    start = datetime.combine(VISIT_DATE, time(12, 0))
+    return tuple((start + timedelta(minutes=15 * i)).time() for i in range(count))
+
+
+def days(count):
+    return tuple(VISIT_DATE + timedelta(days=day) for day in range(count))
+
+
+def search(client, visit_date=VISIT_DATE):
+    resp = client.post(SEARCH_PATH, data={
+        "VisitDate": visit_date.isoformat(), "PartySize": 2, "ChannelCode": "ONLINE"
+    })
+    assert resp.status_code == 200
+    return resp.json()
+
+
+def test_availability_counts_confirmed_bookings_per_slot(
+    client, seed_restaurant, book_ref, cancel
+):
+    seed_restaurant(slot_times=quarter_hours(4))
+    for _ in range(3):
+        book_ref("12:00:00")
+    book_ref("12:15:00")
+    cancel(book_ref("12:15:00"))
+
+    slots = {s["time"]: s for s in search(client)["available_slots"]}
+
+    assert slots["12:00:00"]["current_bookings"] == 3
+    assert slots["12:00:00"]["available"] is False
+    assert slots["12:15:00"]["current_bookings"] == 1
+    assert slots["12:15:00"]["available"] is True
+    assert slots["12:30:00"]["current_bookings"] == 0
+
+
+def test_availability_query_count_is_independent_of_slot_count(
+    client, db_session, seed_restaurant, query_counter
+):
+    times = quarter_hours(40)
+    seed_restaurant(slot_times=times, dates=days(2))
+    next_day = days(2)[1]
+    db_session.query(AvailabilitySlot).filter(
+        AvailabilitySlot.date == next_day, AvailabilitySlot.time >= times[8]
+    ).delete()
+    db_session.commit()
+    search(client)  # warm the restaurant cache
+
+    query_counter.clear()
+    assert search(client, next_day)["total_slots"] == 8
+    few_slots = len(query_counter)
+
+    query_counter.clear()
+    assert search(client)["total_slots"] == 40
+
+    assert len(query_counter) == few_slots
+    assert few_slots == 1
+
+
+def calendar(client, day_count):
+    resp = client.post(CALENDAR_PATH, data={
+        "StartDate": VISIT_DATE.isoformat(),
+        "EndDate": days(day_count)[-1].isoformat(),
+        "PartySize": 2,
+        "ChannelCode": "ONLINE",
+    })
+    assert resp.status_code == 200
+    return resp.json()
+
+
+def test_calendar_reports_remaining_bookings_per_day(
+    client, db_session, seed_restaurant, book_ref, cancel
+):
+    restaurant_id = seed_restaurant(
+        slot_times=(time(12, 0), time(13, 0)), dates=days(2)
+    )
+    db_session.add(AvailabilitySlot(
+        restaurant_id=restaurant_id, date=VISIT_DATE, time=time(14, 0), available=False
+    ))
+    db_session.commit()
+    for _ in range(2):
+        book_ref("12:00:00")
+    cancel(book_ref("12:00:00"))
+
+    result = calendar(client, 3)
+
+    assert result["times"] == ["12:00:00", "13:00:00", "14:00:00"]
+    assert result["days"] == {
+        "2030-01-15": [1, 3, 0],
+        "2030-01-16": [3, 3, None],
+    }
+
+
+def test_calendar_query_count_is_independent_of_range(
+    client, seed_restaurant, query_counter
+):
+    seed_restaurant(slot_times=(time(12, 0), time(13, 0)), dates=days(60))
+    calendar(client, 1)  # warm the restaurant cache
+    query_counter.clear()
+    assert len(calendar(client, 7)["days"]) == 7
+    week = len(query_counter)
+
+    query_counter.clear()
+    assert len(calendar(client, 60)["days"]) == 60
+
+    assert len(query_counter) == week
+    assert week == 1
+
+
+def test_calendar_rejects_invalid_ranges(client, seed_restaurant):
+    seed_restaurant()
+    for end in (VISIT_DATE - timedelta(days=1), VISIT_DATE + timedelta(days=90)):
+        resp = client.post(CALENDAR_PATH, data={
+            "StartDate": VISIT_DATE.isoformat(), "EndDate": end.isoformat(),
+            "PartySize": 2, "ChannelCode": "ONLINE",
+        })
+        assert resp.status_code == 400
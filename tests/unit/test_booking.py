@@ -0,0 +1,154 @@
+import pytest
+from sqlalchemy import text
+
+from conftest import BASE_PATH
+
+
+@pytest.fixture
+def create(seed_restaurant, book):
+    """Function booking as Alice, seeding the restaurant on the first call."""
+    seed_restaurant()
+
+    def create(email="alice@example.com", visit_time="19:00:00"):
+        resp = book(visit_time, FirstName="Alice", Email=email)
+        assert resp.status_code == 200
+        return resp.json()
+
+    return create
+
+
+def test_booking_lifecycle(client, create, cancel):
+    created = create()
+    ref = created["booking_reference"]
+    assert created["customer"]["email"] == "alice@example.com"
+
+    info = client.get(f"{BASE_PATH}/Booking/{ref}").json()
+    assert info["visit_time"] == "19:00:00"
+    assert info["customer"]["first_name"] == "Alice"
+    assert info["cancellation_reason"] is None
+
+    updated = client.patch(f"{BASE_PATH}/Booking/{ref}", data={"PartySize": 4}).json()
+    assert updated["status"] == "updated"
+    assert updated["updates"] == {"party_size": 4}
+
+    cancelled = cancel(ref).json()
+    assert cancelled["status"] == "cancelled"
+    assert cancelled["cancellation_reason"] == "Customer Request"
+
+    info = client.get(f"{BASE_PATH}/Booking/{ref}").json()
+    assert info["status"] == "cancelled"
+    assert info["cancellation_reason"]["reason"] == "Customer Request"
+
+
+def test_returning_customer_is_reused(create):
+    first = create()
+    second = create(visit_time="20:00:00")
+
+    assert first["customer"]["id"] == second["customer"]["id"]
+    assert first["booking_reference"] != second["booking_reference"]
+
+
+def test_unknown_restaurant_returns_404(client):
+    resp = client.get("/api/ConsumerApi/v1/Restaurant/Nowhere/Booking/ABC1234")
+    assert resp.status_code == 404
+
+
+def test_reference_collision_is_retried_without_lookup(
+    create, query_counter, monkeypatch
+):
+    first = create()["booking_reference"]
+
+    references = iter([first, first, "NEWREF1"])
+    monkeypatch.setattr(
+        "app.routers.booking.generate_booking_reference", lambda: next(references)
+    )
+    query_counter.clear()
+
+    assert create(email="bob@example.com")["booking_reference"] == "NEWREF1"
+    assert not any(
+        s.lstrip().startswith("SELECT") and "FROM bookings" in s for s in query_counter
+    )
+    inserts = [
+        s for s in query_counter if s.lstrip().startswith("INSERT INTO bookings")
+    ]
+    assert len(inserts) == 3
+
+
+def test_references_are_base36_numbers_least_significant_digit_first():
+    from app.references import encode_reference, reference_space
+
+    assert encode_reference(0) == "0000000"
+    assert encode_reference(36 + 35) == "Z100000"
+    assert encode_reference(reference_space() - 1) == "ZZZZZZZ"
+
+
+def test_generated_references_are_seven_alphanumeric_characters():
+    from app.routers.booking import generate_booking_reference
+
+    references = {generate_booking_reference() for _ in range(1000)}
+
+    assert len(references) == 1000
+    assert all(len(ref) == 7 and ref.isalnum() and ref.upper() == ref
+               for ref in references)
+
+
+def test_booking_is_created_in_one_transaction(create, query_counter):
+    create()
+    query_counter.clear()
+
+    create(visit_time="20:00:00")
+
+    writes = [s.split()[0] for s in query_counter]
+    assert writes == ["UPDATE", "INSERT", "INSERT"]
+    assert "ON CONFLICT (email)" in query_counter[1]
+
+
+def test_failed_booking_leaves_no_orphan_customer(create, db_session, monkeypatch):
+    from app.models import Customer
+
+    async def fail(db, **values):
+        raise RuntimeError("booking insert failed")
+
+    monkeypatch.setattr("app.routers.booking.insert_booking", fail)
+
+    with pytest.raises(RuntimeError):
+        create()
+    assert db_session.query(Customer).count() == 0
+
+
+def test_get_booking_is_a_single_statement(client, create, cancel, query_counter):
+    ref = create()["booking_reference"]
+    cancel(ref)  # warms the restaurant and cancellation reason caches
+
+    query_counter.clear()
+    info = client.get(f"{BASE_PATH}/Booking/{ref}").json()
+
+    assert info["customer"]["email"] == "alice@example.com"
+    assert info["cancellation_reason"]["reason"] == "Customer Request"
+    assert len(query_counter) == 1
+    assert "JOIN customers" in query_counter[0]
+
+
+def test_cancellation_reasons_added_elsewhere_are_found(
+    create, cancel, db_session, query_counter
+):
+    first = create()["booking_reference"]
+    second = create(visit_time="20:00:00")["booking_reference"]
+    third = create(email="carol@example.com")["booking_reference"]
+    assert cancel(first).status_code == 200
+
+    # Raw SQL bypasses the ORM hooks, like a write from another process
+    db_session.execute(text(
+        "INSERT INTO cancellation_reasons (id, reason) VALUES (3, 'Weather')"
+    ))
+    db_session.commit()
+
+    cancelled = cancel(second, reason_id=3).json()
+    assert cancelled["cancellation_reason"] == "Weather"
+
+    unknown = cancel(third, reason_id=99)
+    assert unknown.json()["detail"] == "Invalid cancellation reason"
+    # The miss is cached: repeating the unknown ID does not reload the table
+    query_counter.clear()
+    assert cancel(third, reason_id=99).status_code == 400
+    assert not any("cancellation_reasons" in s for s in query_counter)
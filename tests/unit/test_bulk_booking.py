@@ -0,0 +1,125 @@
+import json
+from datetime import time
+
+import pytest
+from sqlalchemy import update
+
+from app.models import AvailabilitySlot, Booking, Customer
+from conftest import BASE_PATH, VISIT_DATE
+
+
+@pytest.fixture
+def seeded(seed_restaurant):
+    return seed_restaurant(unavailable=(time(21, 0),))
+
+
+def item(visit_time="19:00:00", email=None, **fields):
+    return {
+        "VisitDate": VISIT_DATE.isoformat(),
+        "VisitTime": visit_time,
+        "PartySize": 2,
+        "ChannelCode": "ONLINE",
+        "Customer": {"Email": email},
+        **fields
+    }
+
+
+def post_batch(client, items):
+    resp = client.post(f"{BASE_PATH}/BookingBatch", json=items)
+    assert resp.status_code == 200
+    return resp.json()
+
+
+def test_batch_reports_per_item_results(client, db_session, seeded, booked_count):
+    result = post_batch(client, [
+        item(email="a@example.com"),
+        item(email="b@example.com"),
+        {"VisitDate": VISIT_DATE.isoformat()},  # missing fields
+        item(),
+        item(),  # 19:00 is full by now
+        item("20:00:00", email="a@example.com"),
+        item("21:00:00"),  # unavailable
+        item("20:00:00", PartySize=20),  # too large for the slot
+    ])
+
+    statuses = [r["status_code"] for r in result["results"]]
+    assert statuses == [200, 200, 422, 200, 409, 200, 409, 409]
+    assert (result["total"], result["created"], result["failed"]) == (8, 4, 4)
+
+    results = result["results"]
+    assert results[0]["customer_id"] == results[5]["customer_id"]
+    references = {r["booking_reference"] for r in results if r["status_code"] == 200}
+    assert len(references) == 4
+    assert db_session.query(Booking).count() == 4
+    assert db_session.query(Customer).count() == 3
+    assert booked_count(time(19, 0)) == 3
+    assert booked_count(time(20, 0)) == 1
+
+    booking = client.get(f"{BASE_PATH}/Booking/{results[0]['booking_reference']}")
+    assert booking.json()["customer"]["email"] == "a@example.com"
+
+
+def test_batch_respects_existing_bookings(client, seeded, booked_count):
+    post_batch(client, [item(), item()])
+
+    result = post_batch(client, [item(), item(), item("20:00:00")])
+
+    assert [r["status_code"] for r in result["results"]] == [200, 409, 200]
+    assert booked_count(time(19, 0)) == 3
+
+
+def test_batch_rejects_slots_without_a_party_size_limit(
+    client, db_session, seeded, booked_count
+):
+    db_session.add(AvailabilitySlot(
+        restaurant_id=seeded, date=VISIT_DATE, time=time(22, 0)
+    ))
+    db_session.flush()
+    db_session.execute(
+        update(AvailabilitySlot)
+        .where(AvailabilitySlot.time == time(22, 0))
+        .values(max_party_size=None)
+    )
+    db_session.commit()
+
+    result = post_batch(client, [item("22:00:00"), item()])
+
+    assert [r["status_code"] for r in result["results"]] == [409, 200]
+    assert booked_count(time(22, 0)) == 0
+
+
+def test_batch_accepts_ndjson(client, seeded):
+    body = "\n".join([json.dumps(item()), "{not json", "", json.dumps(item())])
+
+    resp = client.post(
+        f"{BASE_PATH}/BookingBatch",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"}
+    )
+
+    assert [r["status_code"] for r in resp.json()["results"]] == [200, 422, 200]
+
+
+def test_batch_statement_count_is_independent_of_size(
+    client, seeded, query_counter
+):
+    post_batch(client, [item()])  # warm the restaurant cache
+    query_counter.clear()
+    post_batch(client, [item(email="a@example.com"), item("20:00:00", email="b@x.io")])
+    small = len(query_counter)
+
+    query_counter.clear()
+    post_batch(client, [item(email=f"{i}@example.com") for i in range(2)]
+               + [item("20:00:00", email=f"{i}@x.io") for i in range(3)])
+
+    assert len(query_counter) == small
+
+
+def test_malformed_batches_are_rejected(client, seeded):
+    for body in ("{not json", json.dumps(item()), json.dumps([item()] * 1001)):
+        resp = client.post(
+            f"{BASE_PATH}/BookingBatch",
+            content=body,
+            headers={"Content-Type": "application/json"}
+        )
+        assert resp.status_code == 400
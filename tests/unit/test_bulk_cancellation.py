@@ -0,0 +1,122 @@
+from datetime import date, time
+
+import pytest
+
+from app.models import AvailabilitySlot, Booking
+from conftest import BASE_PATH, VISIT_DATE
+
+NEXT_DATE = date(2030, 1, 16)
+SLOT_TIMES = (time(18, 0), time(19, 0), time(20, 0))
+
+
+@pytest.fixture
+def seeded(seed_restaurant):
+    return seed_restaurant(
+        slot_times=SLOT_TIMES,
+        dates=(VISIT_DATE, NEXT_DATE),
+        reasons={1: "Customer Request", 2: "Restaurant Closure"}
+    )
+
+
+def slots(db, visit_date=VISIT_DATE):
+    db.expire_all()
+    return {
+        slot.time: (slot.available, slot.booked_count)
+        for slot in db.query(AvailabilitySlot).filter(
+            AvailabilitySlot.date == visit_date
+        )
+    }
+
+
+def test_closure_cancels_bookings_and_closes_slots(
+    client, db_session, seeded, book, book_ref
+):
+    early = book_ref("18:00:00")
+    late = [book_ref("19:00:00"), book_ref("20:00:00")]
+    next_day = book_ref("19:00:00", visit_date=NEXT_DATE)
+
+    resp = client.post(f"{BASE_PATH}/BookingBatch/Cancel", json={
+        "CancellationReasonId": 2,
+        "VisitDate": VISIT_DATE.isoformat(),
+        "StartTime": "19:00:00",
+    })
+
+    result = resp.json()
+    assert result["cancelled_count"] == 2
+    assert sorted(result["cancelled_references"]) == sorted(late)
+    assert result["slots_closed"] == 2
+    assert result["cancellation_reason"] == "Restaurant Closure"
+    assert slots(db_session) == {
+        time(18, 0): (True, 1),
+        time(19, 0): (False, 0),
+        time(20, 0): (False, 0),
+    }
+    statuses = dict(db_session.query(Booking.booking_reference, Booking.status))
+    assert statuses[early] == statuses[next_day] == "confirmed"
+    assert all(statuses[ref] == "cancelled" for ref in late)
+
+    assert book("19:00:00").status_code == 409
+
+
+def test_cancel_by_references_releases_places(client, db_session, seeded, book_ref):
+    refs = [book_ref("19:00:00") for _ in range(3)]
+
+    resp = client.post(f"{BASE_PATH}/BookingBatch/Cancel", json={
+        "CancellationReasonId": 1,
+        "BookingReferences": refs[:2] + ["MISSING"],
+    })
+
+    result = resp.json()
+    assert result["cancelled_count"] == 2
+    assert result["not_cancelled"] == ["MISSING"]
+    assert result["slots_closed"] == 0
+    assert slots(db_session)[time(19, 0)] == (True, 1)
+
+    again = client.post(f"{BASE_PATH}/BookingBatch/Cancel", json={
+        "CancellationReasonId": 1, "BookingReferences": refs[:1],
+    })
+    assert again.json()["cancelled_count"] == 0
+
+
+def test_bulk_cancel_statement_count_is_independent_of_size(
+    client, seeded, book_ref, query_counter
+):
+    for visit_time in ("18:00:00", "19:00:00", "20:00:00"):
+        for _ in range(3):
+            book_ref(visit_time)
+    book_ref("19:00:00", visit_date=NEXT_DATE)
+    client.post(f"{BASE_PATH}/BookingBatch/Cancel", json={
+        "CancellationReasonId": 2, "VisitDate": "2030-01-17",
+    })  # warms the cancellation reason cache
+
+    query_counter.clear()
+    client.post(f"{BASE_PATH}/BookingBatch/Cancel", json={
+        "CancellationReasonId": 2, "VisitDate": "2030-01-16",
+    })
+    one_booking = len(query_counter)
+
+    query_counter.clear()
+    client.post(f"{BASE_PATH}/BookingBatch/Cancel", json={
+        "CancellationReasonId": 2, "VisitDate": VISIT_DATE.isoformat(),
+    })
+
+    assert len(query_counter) == one_booking
+
+
+def test_bulk_cancel_validates_selector_and_reason(client, seeded):
+    for body in (
+        {"CancellationReasonId": 2},
+        {"CancellationReasonId": 2, "VisitDate": "2030-01-15",
+         "BookingReferences": ["ABC"]},
+        {"CancellationReasonId": 2, "StartTime": "19:00:00",
+         "BookingReferences": ["ABC"]},
+        {"CancellationReasonId": 2, "VisitDate": "2030-01-15",
+         "StartTime": "20:00:00", "EndTime": "19:00:00"},
+    ):
+        resp = client.post(f"{BASE_PATH}/BookingBatch/Cancel", json=body)
+        assert resp.status_code == 422
+
+    resp = client.post(f"{BASE_PATH}/BookingBatch/Cancel", json={
+        "CancellationReasonId": 99, "VisitDate": "2030-01-15",
+    })
+    assert resp.status_code == 400
@@ -0,0 +1,109 @@
+import gzip
+from datetime import date, datetime, time, timedelta
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.compression import CompressionMiddleware, negotiate_encoding
+from app.models import Restaurant, AvailabilitySlot
+
+BASE_PATH = "/api/ConsumerApi/v1/Restaurant/TheHungryUnicorn"
+VISIT_DATE = date(2030, 1, 15)
+
+
+def seed(db, slot_count):
+    restaurant = Restaurant(name="TheHungryUnicorn", microsite_name="TheHungryUnicorn")
+    db.add(restaurant)
+    db.flush()
+    start = datetime.combine(VISIT_DATE, time(0, 0))
+    for i in range(slot_count):
+        db.add(AvailabilitySlot(
+            restaurant_id=restaurant.id, date=VISIT_DATE,
+            time=(start + timedelta(minutes=15 * i)).time()
+        ))
+    db.commit()
+
+
+def search(client, accept_encoding, etag=None):
+    headers = {"Accept-Encoding": accept_encoding}
+    if etag:
+        headers["If-None-Match"] = etag
+    return client.post(f"{BASE_PATH}/AvailabilitySearch", headers=headers, data={
+        "VisitDate": VISIT_DATE.isoformat(), "PartySize": 2, "ChannelCode": "ONLINE"
+    })
+
+
+def test_large_json_response_is_gzipped(client, db_session):
+    seed(db_session, slot_count=96)
+    plain = search(client, "identity")
+    compressed = search(client, "gzip")
+
+    assert "content-encoding" not in plain.headers
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert int(compressed.headers["content-length"]) < len(plain.content) / 4
+    assert compressed.json() == plain.json()
+    assert "Accept-Encoding" in plain.headers["vary"]
+    assert "Accept-Encoding" in compressed.headers["vary"]
+
+
+def test_small_response_is_not_compressed(client, db_session):
+    seed(db_session, slot_count=1)
+    resp = search(client, "gzip")
+
+    assert resp.status_code == 200
+    assert "content-encoding" not in resp.headers
+
+
+def test_compressed_response_has_weak_etag_that_revalidates(client, db_session):
+    seed(db_session, slot_count=96)
+    plain_etag = search(client, "identity").headers["ETag"]
+    etag = search(client, "gzip").headers["ETag"]
+
+    assert etag == f"W/{plain_etag}"
+    assert search(client, "gzip", etag).status_code == 304
+
+
+def test_middleware_checks_content_type_and_streams():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=100, encodings=["gzip"])
+
+    @app.get("/text")
+    async def text():
+        return PlainTextResponse("x" * 1000)
+
+    @app.get("/binary")
+    async def binary():
+        return PlainTextResponse("x" * 1000, media_type="application/octet-stream")
+
+    @app.get("/stream")
+    async def stream():
+        async def lines():
+            for i in range(50):
+                yield f'{{"line": {i}}}\n'
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    client = TestClient(app)
+    headers = {"Accept-Encoding": "gzip"}
+
+    assert client.get("/text", headers=headers).headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in client.get("/binary", headers=headers).headers
+
+    streamed = client.get("/stream", headers=headers)
+    assert streamed.headers["content-encoding"] == "gzip"
+    assert "content-length" not in streamed.headers
+    assert streamed.text.count("\n") == 50
+
+    with client.stream("GET", "/stream", headers=headers) as resp:
+        raw = b"".join(resp.iter_raw())
+    assert gzip.decompress(raw).decode().startswith('{"line": 0}')
+
+
+def test_negotiate_encoding():
+    server = ["br", "zstd", "gzip"]
+    assert negotiate_encoding("gzip, deflate, br", server) == "br"
+    assert negotiate_encoding("br;q=0, gzip;q=0.5", server) == "gzip"
+    assert negotiate_encoding("*", ["gzip"]) == "gzip"
+    assert negotiate_encoding("*, gzip;q=0", ["gzip"]) is None
+    assert negotiate_encoding("identity", server) is None
+    assert negotiate_encoding(None, server) is None
@@ -0,0 +1,86 @@
+import pytest
+
+from app.conditional import etag_matches
+from conftest import BASE_PATH, VISIT_DATE
+
+
+@pytest.fixture
+def seeded(seed_restaurant):
+    return seed_restaurant(reasons={2: "Restaurant Closure"})
+
+
+def search(client, etag=None):
+    headers = {"If-None-Match": etag} if etag else {}
+    return client.post(f"{BASE_PATH}/AvailabilitySearch", headers=headers, data={
+        "VisitDate": VISIT_DATE.isoformat(), "PartySize": 2, "ChannelCode": "ONLINE"
+    })
+
+
+def test_unchanged_booking_returns_304(client, seeded, book_ref, query_counter):
+    ref = book_ref()
+    first = client.get(f"{BASE_PATH}/Booking/{ref}")
+    etag = first.headers["ETag"]
+
+    query_counter.clear()
+    resp = client.get(f"{BASE_PATH}/Booking/{ref}", headers={"If-None-Match": etag})
+
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["ETag"] == etag
+    assert len(query_counter) == 1
+    assert "JOIN" not in query_counter[0]
+
+
+def test_booking_etag_changes_when_booking_changes(client, seeded, book_ref):
+    ref = book_ref()
+    etag = client.get(f"{BASE_PATH}/Booking/{ref}").headers["ETag"]
+
+    client.patch(f"{BASE_PATH}/Booking/{ref}", data={"PartySize": 4})
+    resp = client.get(f"{BASE_PATH}/Booking/{ref}", headers={"If-None-Match": etag})
+
+    assert resp.status_code == 200
+    assert resp.json()["party_size"] == 4
+    assert resp.headers["ETag"] != etag
+
+
+def test_availability_etag_without_index(client, seeded, book_ref):
+    etag = search(client).headers["ETag"]
+
+    assert search(client, etag).status_code == 304
+
+    book_ref()
+    changed = search(client, etag)
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+def test_availability_etag_from_index_needs_no_queries(
+    client, seeded, warm_index, book_ref, query_counter
+):
+    warm_index()
+    search(client)  # warms the restaurant cache
+    etag = search(client).headers["ETag"]
+
+    query_counter.clear()
+    assert search(client, etag).status_code == 304
+    assert query_counter == []
+
+    book_ref()
+    booked = search(client, etag)
+    assert booked.status_code == 200
+    assert booked.json()["available_slots"][0]["current_bookings"] == 1
+
+    client.post(f"{BASE_PATH}/BookingBatch/Cancel", json={
+        "CancellationReasonId": 2, "VisitDate": VISIT_DATE.isoformat(),
+        "StartTime": "20:00:00",
+    })
+    closed = search(client, booked.headers["ETag"])
+    assert closed.status_code == 200
+    assert closed.json()["available_slots"][1]["available"] is False
+
+
+def test_if_none_match_parsing():
+    assert etag_matches('"a", W/"b"', '"b"')
+    assert etag_matches("*", '"b"')
+    assert not etag_matches('"a"', '"b"')
+    assert not etag_matches(None, '"b"')
@@ -0,0 +1,84 @@
+import asyncio
+import os
+
+import pytest
+
+import app.__main__ as launcher
+from app import init_db
+from app.maintenance import MaintenanceScheduler
+
+
+@pytest.fixture
+def environ(monkeypatch):
+    """Private copy of the environment for the launcher to modify."""
+    env = {
+        key: value for key, value in os.environ.items()
+        if not key.startswith(("SERVER_", "SQLITE_", "MAINTENANCE_"))
+    }
+    monkeypatch.setattr(os, "environ", env)
+    return env
+
+
+@pytest.fixture
+def uvicorn_run(monkeypatch):
+    calls = []
+    monkeypatch.setattr(launcher.uvicorn, "run", lambda app, **kw: calls.append(kw))
+    monkeypatch.setattr(init_db, "prepare_database", lambda: calls.append("prepared"))
+    return calls
+
+
+def test_dev_mode_reloads_in_one_process(environ, uvicorn_run):
+    launcher.main([])
+
+    (options,) = uvicorn_run
+    assert options["reload"] is True
+    assert "workers" not in options
+    assert options["access_log"] is True
+
+
+def test_production_mode_prepares_database_once_for_all_workers(
+    environ, uvicorn_run
+):
+    environ["SERVER_KEEP_ALIVE"] = "30"
+    launcher.main([
+        "--mode", "production", "--workers", "4", "--loop", "uvloop",
+        "--http", "httptools", "--backlog", "4096"
+    ])
+
+    prepared, options = uvicorn_run
+    assert prepared == "prepared"
+    assert options["workers"] == 4
+    assert options["loop"] == "uvloop"
+    assert options["http"] == "httptools"
+    assert options["backlog"] == 4096
+    assert options["timeout_keep_alive"] == 30
+    assert options["access_log"] is False
+    assert "reload" not in options
+
+    assert environ["DATABASE_PREPARED"] == "1"
+    assert environ["OCCUPANCY_INDEX"] == "0"
+    assert environ["SQLITE_PROFILE"] == "production"
+    assert environ["MAINTENANCE_LOCK_FILE"]
+
+
+def test_single_production_worker_keeps_occupancy_index(environ, uvicorn_run):
+    environ["SQLITE_PROFILE"] = "default"
+    launcher.main(["--mode", "production", "--workers", "1", "--access-log"])
+
+    assert uvicorn_run[1]["access_log"] is True
+    assert "OCCUPANCY_INDEX" not in environ
+    assert environ["SQLITE_PROFILE"] == "default"
+
+
+def test_only_one_scheduler_holds_the_maintenance_lock(tmp_path):
+    lock_file = str(tmp_path / "maintenance.lock")
+    first = MaintenanceScheduler(lock_file=lock_file)
+    second = MaintenanceScheduler(lock_file=lock_file)
+
+    assert first.holds_lock()
+    assert not second.holds_lock()
+
+    asyncio.run(first.stop())
+    assert second.holds_lock()
+    asyncio.run(second.stop())
+    assert MaintenanceScheduler(lock_file=None).holds_lock()
@@ -0,0 +1,154 @@
+import asyncio
+from datetime import date, time, timedelta
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.maintenance import (
+    MaintenanceScheduler, archive_bookings, extend_availability, prune_slots,
+    run_maintenance,
+)
+from app.models import (
+    ArchivedBooking, AvailabilitySlot, Booking, Customer, Restaurant, SlotTemplate
+)
+from app.occupancy import occupancy_index
+
+MONDAY = date(2030, 1, 7)
+
+
+def seed(db):
+    restaurant = Restaurant(name="TheHungryUnicorn", microsite_name="TheHungryUnicorn")
+    db.add(restaurant)
+    db.flush()
+    db.add_all([
+        SlotTemplate(restaurant_id=restaurant.id, weekday=0, time=time(12, 0)),
+        SlotTemplate(restaurant_id=restaurant.id, weekday=0, time=time(19, 0)),
+        SlotTemplate(
+            restaurant_id=restaurant.id, weekday=1, time=time(19, 0), max_party_size=4
+        ),
+    ])
+    db.commit()
+    return restaurant.id
+
+
+def seed_past(db, restaurant_id, days):
+    customer = Customer(first_name="Past", email="past@example.com")
+    db.add(customer)
+    db.flush()
+    for day in range(days):
+        visit_date = MONDAY - timedelta(days=day + 1)
+        db.add(AvailabilitySlot(
+            restaurant_id=restaurant_id, date=visit_date, time=time(19, 0)
+        ))
+        db.add(Booking(
+            booking_reference=f"PAST{day:03d}", restaurant_id=restaurant_id,
+            customer_id=customer.id, visit_date=visit_date, visit_time=time(19, 0),
+            party_size=2, channel_code="ONLINE", status="confirmed"
+        ))
+    db.commit()
+
+
+@pytest.fixture
+def run(async_db_engine):
+    SessionLocal = async_sessionmaker(async_db_engine, expire_on_commit=False)
+
+    def run(job, *args, **kwargs):
+        async def go():
+            async with SessionLocal() as db:
+                return await job(db, *args, **kwargs)
+        return asyncio.run(go())
+
+    return run
+
+
+def test_window_is_extended_from_weekly_templates(db_session, run):
+    restaurant_id = seed(db_session)
+
+    # Monday and Tuesday have templates, the rest of the week has none
+    assert run(extend_availability, restaurant_id, MONDAY, window_days=14) == 6
+    assert run(extend_availability, restaurant_id, MONDAY, window_days=14) == 0
+
+    slots = db_session.execute(
+        select(AvailabilitySlot.date, AvailabilitySlot.time,
+               AvailabilitySlot.max_party_size)
+        .order_by(AvailabilitySlot.date, AvailabilitySlot.time)
+    ).all()
+    assert slots[:3] == [
+        (MONDAY, time(12, 0), 8),
+        (MONDAY, time(19, 0), 8),
+        (MONDAY + timedelta(days=1), time(19, 0), 4),
+    ]
+
+    # A week later the window rolls forward by one more week of slots
+    later = MONDAY + timedelta(days=7)
+    assert run(extend_availability, restaurant_id, later, window_days=14) == 3
+
+
+def test_window_extension_commits_whole_days_per_batch(db_session, run):
+    restaurant_id = seed(db_session)
+
+    added = run(extend_availability, restaurant_id, MONDAY, window_days=7, batch_size=1)
+
+    assert added == 3
+    assert db_session.scalar(select(func.max(AvailabilitySlot.date))) == (
+        MONDAY + timedelta(days=1)
+    )
+
+
+def test_past_slots_are_pruned_and_bookings_archived_in_batches(
+    db_session, run, async_db_engine
+):
+    restaurant_id = seed(db_session)
+    seed_past(db_session, restaurant_id, days=5)
+
+    async def rebuild():
+        async with async_sessionmaker(async_db_engine)() as db:
+            await occupancy_index.rebuild(db)
+
+    asyncio.run(rebuild())
+    try:
+        oldest = MONDAY - timedelta(days=5)
+        assert occupancy_index.count(restaurant_id, oldest, time(19, 0)) == 1
+
+        assert run(prune_slots, restaurant_id, MONDAY - timedelta(days=2),
+                   batch_size=2) == 3
+        assert run(archive_bookings, restaurant_id, MONDAY - timedelta(days=1),
+                   batch_size=3) == 4
+
+        assert occupancy_index.count(restaurant_id, oldest, time(19, 0)) == 0
+    finally:
+        occupancy_index.clear()
+
+    assert db_session.scalar(select(func.count(AvailabilitySlot.id))) == 2
+    remaining = db_session.scalars(select(Booking.booking_reference)).all()
+    archived = db_session.scalars(
+        select(ArchivedBooking.booking_reference).order_by(ArchivedBooking.id)
+    ).all()
+    assert remaining == ["PAST000"]
+    assert archived == ["PAST001", "PAST002", "PAST003", "PAST004"]
+
+
+def test_run_maintenance_reports_totals(db_session, run):
+    seed(db_session)
+
+    result = run(run_maintenance, today=MONDAY)
+
+    assert result == {"slots_added": 15, "slots_pruned": 0, "bookings_archived": 0}
+
+
+def test_scheduler_runs_in_background(db_session, async_db_engine):
+    seed(db_session)
+    scheduler = MaintenanceScheduler(
+        async_sessionmaker(async_db_engine, expire_on_commit=False), interval=60
+    )
+
+    async def go():
+        scheduler.start()
+        while scheduler.last_result is None:
+            await asyncio.sleep(0.01)
+        await scheduler.stop()
+
+    asyncio.run(asyncio.wait_for(go(), timeout=10))
+
+    assert scheduler.last_result["slots_added"] > 0
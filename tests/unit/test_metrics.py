@@ -0,0 +1,115 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool
+
+from app.metrics import Histogram, Metrics, MetricsMiddleware
+from app.models import Restaurant
+
+BASE_PATH = "/api/ConsumerApi/v1/Restaurant"
+SEARCH_ROUTE = f"{BASE_PATH}/{{restaurant_name}}/AvailabilitySearch"
+BOOKING_ROUTE = f"{BASE_PATH}/{{restaurant_name}}/Booking/{{booking_reference}}"
+
+
+def scrape(client):
+    resp = client.get("/metrics")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    samples = {}
+    for line in resp.text.splitlines():
+        if line and not line.startswith("#"):
+            series, value = line.rsplit(" ", 1)
+            samples[series] = float(value)
+    return samples
+
+
+def test_requests_are_counted_by_route_template_and_status(client, db_session):
+    db_session.add(
+        Restaurant(name="TheHungryUnicorn", microsite_name="TheHungryUnicorn")
+    )
+    db_session.commit()
+
+    for _ in range(2):
+        client.post(f"{BASE_PATH}/TheHungryUnicorn/AvailabilitySearch", data={
+            "VisitDate": "2030-01-15", "PartySize": 2, "ChannelCode": "ONLINE"
+        })
+    client.get(f"{BASE_PATH}/TheHungryUnicorn/Booking/NOSUCH1")
+    client.get("/no-such-page")
+
+    samples = scrape(client)
+
+    search = f'method="POST",route="{SEARCH_ROUTE}"'
+    assert samples[f'http_requests_total{{{search},status="200"}}'] == 2
+    assert samples[f'http_request_duration_seconds_count{{{search}}}'] == 2
+    assert samples[f'http_request_duration_seconds_bucket{{{search},le="+Inf"}}'] == 2
+    assert samples[f'http_requests_in_flight{{{search}}}'] == 0
+    booking = f'method="GET",route="{BOOKING_ROUTE}",status="404"'
+    assert samples[f"http_requests_total{{{booking}}}"] == 1
+    unmatched = 'method="GET",route="unmatched",status="404"'
+    assert samples[f"http_requests_total{{{unmatched}}}"] == 1
+    # The scrape itself is being served
+    assert samples['http_requests_in_flight{method="GET",route="/metrics"}'] == 1
+    # Routes that have not been requested are reported too
+    assert samples[
+        f'http_request_duration_seconds_count{{method="PATCH",route="{BOOKING_ROUTE}"}}'
+    ] == 0
+    assert samples['db_pool_checked_out{engine="async"}'] == 0
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram([0.1, 1.0])
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value)
+
+    assert histogram.cumulative() == [("0.1", 2), ("1", 3), ("+Inf", 4)]
+    assert histogram.count == 4
+    assert histogram.sum == pytest.approx(3.65)
+
+
+def test_failed_and_in_flight_requests_are_reported():
+    metrics = Metrics()
+    rendered = []
+
+    async def app(scope, receive, send):
+        scope["route"] = SimpleNamespace(path="/items/{item_id}")
+        rendered.append(metrics.render())
+        raise RuntimeError("boom")
+
+    async def call():
+        scope = {"type": "http", "method": "GET", "path": "/items/1"}
+        try:
+            await MetricsMiddleware(app, metrics)(scope, None, None)
+        except RuntimeError:
+            pass
+
+    asyncio.run(call())
+
+    assert 'http_requests_in_flight{method="GET",route="/items/{item_id}"} 1' in (
+        rendered[0]
+    )
+    assert metrics.requests == {("GET", "/items/{item_id}", 500): 1}
+    assert 'http_requests_in_flight{method="GET",route="/items/{item_id}"} 0' in (
+        metrics.render()
+    )
+
+
+def test_pool_gauges_follow_checked_out_connections(tmp_path):
+    queue_engine = create_engine(f"sqlite:///{tmp_path / 'queue.db'}")
+    null_engine = create_engine(f"sqlite:///{tmp_path / 'null.db'}", poolclass=NullPool)
+    metrics = Metrics()
+    metrics.add_engine("queue", queue_engine)
+    metrics.add_engine("null", null_engine)
+
+    with queue_engine.connect(), null_engine.connect():
+        gauges = metrics.pool_gauges()
+    assert ("queue", 1) in gauges["checked_out"]
+    assert ("null", 1) in gauges["checked_out"]
+    assert gauges["size"] == [("queue", 5)]
+
+    gauges = metrics.pool_gauges()
+    assert gauges["checked_out"] == [("queue", 0), ("null", 0)]
+    assert gauges["checked_in"] == [("queue", 1)]
+    queue_engine.dispose()
+    null_engine.dispose()
@@ -0,0 +1,97 @@
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from sqlalchemy import inspect, text
+
+from app.init_db import BASELINE_REVISION, alembic_config, create_tables
+from app.models import Base
+
+
+def test_migrations_match_models(empty_db_engine):
+    create_tables(bind=empty_db_engine)
+
+    with empty_db_engine.connect() as conn:
+        diff = compare_metadata(MigrationContext.configure(conn), Base.metadata)
+        indexes = {ix["name"] for ix in inspect(conn).get_indexes("bookings")}
+
+    assert diff == []
+    assert "ix_bookings_restaurant_visit" in indexes
+
+
+def test_legacy_database_is_stamped_and_upgraded(empty_db_engine):
+    engine = empty_db_engine
+    # A pre-migration database: the baseline schema without alembic_version
+    with engine.begin() as conn:
+        config = alembic_config()
+        config.attributes["connection"] = conn
+        command.upgrade(config, BASELINE_REVISION)
+        conn.execute(text("DROP TABLE alembic_version"))
+
+    create_tables(bind=engine)
+
+    with engine.connect() as conn:
+        version = conn.execute(text("SELECT version_num FROM alembic_version")).scalar()
+        diff = compare_metadata(MigrationContext.configure(conn), Base.metadata)
+
+    assert version == "0005"
+    assert diff == []
+
+
+def test_booked_count_is_backfilled_from_confirmed_bookings(empty_db_engine):
+    engine = empty_db_engine
+    with engine.begin() as conn:
+        config = alembic_config()
+        config.attributes["connection"] = conn
+        command.upgrade(config, "0003")
+        conn.execute(text(
+            "INSERT INTO restaurants (id, name, microsite_name) VALUES (1, 'R', 'R')"
+        ))
+        conn.execute(text("INSERT INTO customers (id, email) VALUES (1, 'a@b.c')"))
+        conn.execute(text(
+            "INSERT INTO availability_slots (restaurant_id, date, time) "
+            "VALUES (1, '2030-01-15', '19:00:00')"
+        ))
+        for reference, status in (("A", "confirmed"), ("B", "confirmed"),
+                                  ("C", "cancelled")):
+            conn.execute(text(
+                "INSERT INTO bookings (booking_reference, restaurant_id, customer_id,"
+                " visit_date, visit_time, party_size, channel_code, status) "
+                "VALUES (:ref, 1, 1, '2030-01-15', '19:00:00', 2, 'ONLINE', :status)"
+            ), {"ref": reference, "status": status})
+
+    create_tables(bind=engine)
+
+    with engine.connect() as conn:
+        count = conn.execute(text("SELECT booked_count FROM availability_slots")).scalar()
+
+    assert count == 2
+
+
+def test_slot_templates_are_backfilled_from_existing_slots(empty_db_engine):
+    engine = empty_db_engine
+    with engine.begin() as conn:
+        config = alembic_config()
+        config.attributes["connection"] = conn
+        command.upgrade(config, "0004")
+        conn.execute(text(
+            "INSERT INTO restaurants (id, name, microsite_name) VALUES (1, 'R', 'R')"
+        ))
+        # Two Mondays at 19:00 and a Tuesday at 12:00
+        for slot_date, slot_time, max_party_size in (
+            ("2030-01-14", "19:00:00", 8), ("2030-01-21", "19:00:00", 6),
+            ("2030-01-15", "12:00:00", 4),
+        ):
+            conn.execute(text(
+                "INSERT INTO availability_slots "
+                "(restaurant_id, date, time, max_party_size) "
+                "VALUES (1, :date, :time, :max_party_size)"
+            ), {"date": slot_date, "time": slot_time, "max_party_size": max_party_size})
+
+    create_tables(bind=engine)
+
+    with engine.connect() as conn:
+        templates = conn.execute(text(
+            "SELECT weekday, max_party_size FROM slot_templates ORDER BY weekday"
+        )).all()
+
+    assert [tuple(row) for row in templates] == [(0, 8), (1, 4)]
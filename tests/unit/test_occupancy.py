@@ -0,0 +1,157 @@
+import asyncio
+from datetime import time, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.maintenance import MaintenanceScheduler
+from app.models import AvailabilitySlot, Booking, Customer
+from conftest import BASE_PATH, VISIT_DATE
+
+
+def run(engine, operation):
+    async def with_session():
+        async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+            return await operation(db)
+    return asyncio.run(with_session())
+
+
+@pytest.fixture
+def index(seed_restaurant, warm_index):
+    seed_restaurant()
+    return warm_index()
+
+
+def test_index_tracks_booking_writes(
+    client, index, book_ref, cancel, async_db_engine
+):
+    first = book_ref("19:00:00")
+    book_ref("19:00:00")
+    assert index.count(1, VISIT_DATE, time(19, 0)) == 2
+
+    client.patch(f"{BASE_PATH}/Booking/{first}", data={"VisitTime": "20:00:00"})
+    assert index.count(1, VISIT_DATE, time(19, 0)) == 1
+    assert index.count(1, VISIT_DATE, time(20, 0)) == 1
+
+    cancel(first)
+    assert index.count(1, VISIT_DATE, time(20, 0)) == 0
+
+    assert run(async_db_engine, index.verify) == {}
+
+
+def test_availability_reads_counts_from_index(
+    client, index, book_ref, query_counter
+):
+    book_ref("19:00:00")
+    query_counter.clear()
+
+    resp = client.post(f"{BASE_PATH}/AvailabilitySearch", data={
+        "VisitDate": VISIT_DATE.isoformat(), "PartySize": 2, "ChannelCode": "ONLINE"
+    })
+
+    slots = {s["time"]: s["current_bookings"] for s in resp.json()["available_slots"]}
+    assert slots == {"19:00:00": 1, "20:00:00": 0}
+    assert query_counter == []
+
+
+def test_calendar_reads_slots_from_index(client, index, book_ref, query_counter):
+    book_ref("19:00:00")
+    query_counter.clear()
+
+    resp = client.post(f"{BASE_PATH}/AvailabilityCalendar", data={
+        "StartDate": VISIT_DATE.isoformat(),
+        "EndDate": (VISIT_DATE + timedelta(days=1)).isoformat(),
+        "PartySize": 2, "ChannelCode": "ONLINE"
+    })
+
+    assert resp.status_code == 200
+    assert query_counter == []
+
+
+def test_closed_slots_are_reloaded_once(client, index, book_ref, query_counter):
+    book_ref("19:00:00")
+    closure = client.post(f"{BASE_PATH}/BookingBatch/Cancel", json={
+        "CancellationReasonId": 1, "VisitDate": VISIT_DATE.isoformat(),
+        "StartTime": "20:00:00", "EndTime": "20:00:00"
+    })
+    assert closure.status_code == 200
+    query_counter.clear()
+
+    def search():
+        return client.post(f"{BASE_PATH}/AvailabilitySearch", data={
+            "VisitDate": VISIT_DATE.isoformat(), "PartySize": 2,
+            "ChannelCode": "ONLINE"
+        }).json()["available_slots"]
+
+    slots = {s["time"]: s["available"] for s in search()}
+    assert slots == {"19:00:00": True, "20:00:00": False}
+    assert len(query_counter) == 1
+
+    query_counter.clear()
+    assert {s["time"]: s["available"] for s in search()} == slots
+    assert query_counter == []
+
+
+def test_verify_reports_and_repairs_drift(index, book_ref, async_db_engine):
+    book_ref("19:00:00")
+    index.add(1, VISIT_DATE, time(20, 0), delta=2)
+
+    async def repair(db):
+        return await index.verify(db, repair=True)
+
+    mismatches = run(async_db_engine, repair)
+
+    assert mismatches == {(1, VISIT_DATE, time(20, 0)): (2, 0)}
+    assert index.count(1, VISIT_DATE, time(20, 0)) == 0
+    assert index.count(1, VISIT_DATE, time(19, 0)) == 1
+
+
+def test_verify_changes_versions_of_days_whose_slots_changed(
+    index, db_session, async_db_engine
+):
+    next_day = VISIT_DATE + timedelta(days=1)
+    versions = {day: index.version(1, day) for day in (VISIT_DATE, next_day)}
+    db_session.add(AvailabilitySlot(restaurant_id=1, date=next_day, time=time(19, 0)))
+    db_session.commit()
+
+    async def repair(db):
+        return await index.verify(db, repair=True)
+
+    assert run(async_db_engine, repair) == {}
+    assert index.version(1, next_day) != versions[next_day]
+    assert index.version(1, VISIT_DATE) == versions[VISIT_DATE]
+    assert [slot.time for slot, _ in index.slots(1, next_day, next_day, 2)] == []
+
+    run(async_db_engine, lambda db: index.load_day_slots(db, 1, [next_day]))
+    assert [slot.time for slot, _ in index.slots(1, next_day, next_day, 2)] == [
+        time(19, 0)
+    ]
+
+
+def test_scheduler_repairs_bookings_written_by_other_processes(
+    index, db_session, async_db_engine
+):
+    customer = Customer(email="walk-in@example.com")
+    db_session.add(customer)
+    db_session.flush()
+    db_session.add(Booking(
+        booking_reference="OTHER01", restaurant_id=1, customer_id=customer.id,
+        visit_date=VISIT_DATE, visit_time=time(19, 0), party_size=2,
+        channel_code="PHONE", status="confirmed"
+    ))
+    db_session.commit()
+    version = index.version(1, VISIT_DATE)
+    scheduler = MaintenanceScheduler(
+        async_sessionmaker(async_db_engine, expire_on_commit=False),
+        interval=60, lock_file=None
+    )
+
+    async def go():
+        scheduler.start()
+        while index.count(1, VISIT_DATE, time(19, 0)) == 0:
+            await asyncio.sleep(0.01)
+        await scheduler.stop()
+
+    asyncio.run(asyncio.wait_for(go(), timeout=10))
+
+    assert index.version(1, VISIT_DATE) != version
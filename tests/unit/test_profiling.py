@@ -0,0 +1,104 @@
+import pstats
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.main
+import app.profiling
+from app.models import Restaurant
+from app.profiling import ProfilingMiddleware
+
+SEARCH_PATH = "/api/ConsumerApi/v1/Restaurant/TheHungryUnicorn/AvailabilitySearch"
+FORM = {"VisitDate": "2030-01-15", "PartySize": 2, "ChannelCode": "ONLINE"}
+
+
+@pytest.fixture
+def profiled(client, db_session, tmp_path):
+    """Client whose app profiles requests into a profiles directory."""
+    db_session.add(
+        Restaurant(name="TheHungryUnicorn", microsite_name="TheHungryUnicorn")
+    )
+    db_session.commit()
+    middleware = ProfilingMiddleware(
+        client.app, directory=str(tmp_path / "profiles")
+    )
+    profiled_client = TestClient(middleware)
+    profiled_client.headers.update(client.headers)
+    return profiled_client, middleware
+
+
+def test_untriggered_requests_are_not_profiled(profiled, tmp_path):
+    client, _ = profiled
+
+    resp = client.post(SEARCH_PATH, data=FORM)
+
+    assert resp.status_code == 200
+    assert "X-Profile-Artifact" not in resp.headers
+    assert not (tmp_path / "profiles").exists()
+
+
+def test_header_triggers_a_cprofile_profile(profiled):
+    client, _ = profiled
+
+    resp = client.post(SEARCH_PATH, data=FORM, headers={"X-Profile": "cprofile"})
+
+    assert resp.status_code == 200
+    artifact = Path(resp.headers["X-Profile-Artifact"])
+    assert artifact.suffix == ".prof"
+    assert "POST-api-ConsumerApi" in artifact.name
+    functions = {name for _, _, name in pstats.Stats(str(artifact)).stats}
+    assert "availability_search" in functions
+
+
+def test_query_parameter_triggers_a_pyinstrument_profile(profiled):
+    pytest.importorskip("pyinstrument")
+    client, _ = profiled
+
+    resp = client.post(f"{SEARCH_PATH}?profile=pyinstrument", data=FORM)
+
+    assert resp.status_code == 200
+    artifact = Path(resp.headers["X-Profile-Artifact"])
+    assert artifact.suffix == ".html"
+    assert "availability_search" in artifact.read_text(encoding="utf-8")
+
+
+def test_requests_during_a_profile_are_served_unprofiled(profiled):
+    client, middleware = profiled
+    middleware.busy = True
+
+    resp = client.post(SEARCH_PATH, data=FORM, headers={"X-Profile": "1"})
+
+    assert resp.status_code == 200
+    assert resp.headers["X-Profile"] == "busy"
+    assert "X-Profile-Artifact" not in resp.headers
+
+
+def test_profiler_that_fails_to_start_does_not_block_later_profiles(
+    profiled, monkeypatch
+):
+    client, middleware = profiled
+
+    def refuse(profiler, path):
+        raise ValueError("Another profiling tool is already active")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(app.profiling, "Profile", refuse)
+        resp = client.post(SEARCH_PATH, data=FORM, headers={"X-Profile": "1"})
+
+    assert resp.status_code == 200
+    assert resp.headers["X-Profile"] == "unavailable"
+    assert not middleware.busy
+    resp = client.post(SEARCH_PATH, data=FORM, headers={"X-Profile": "cprofile"})
+    assert Path(resp.headers["X-Profile-Artifact"]).exists()
+
+
+def test_profiling_middleware_is_only_installed_when_enabled(monkeypatch):
+    def installed():
+        return ProfilingMiddleware in [
+            middleware.cls for middleware in app.main.create_app().user_middleware
+        ]
+
+    assert not installed()
+    monkeypatch.setattr(app.main, "PROFILING_ENABLED", True)
+    assert installed()
@@ -0,0 +1,84 @@
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.main
+from app.cache import restaurant_cache
+from app.models import Restaurant
+from app.query_stats import normalize_sql
+from app.routers.availability import MOCK_BEARER_TOKEN
+
+SEARCH_PATH = "/api/ConsumerApi/v1/Restaurant/TheHungryUnicorn/AvailabilitySearch"
+SEARCH_ROUTE = (
+    "/api/ConsumerApi/v1/Restaurant/{restaurant_name}/AvailabilitySearch"
+)
+FORM = {"VisitDate": "2030-01-15", "PartySize": 2, "ChannelCode": "ONLINE"}
+
+
+def seed(db):
+    db.add(Restaurant(name="TheHungryUnicorn", microsite_name="TheHungryUnicorn"))
+    db.commit()
+
+
+@pytest.fixture
+def debug_client(monkeypatch, db_engine, async_db_engine):
+    """Build a TestClient for a debug-mode app on the test database."""
+    monkeypatch.setattr(app.main, "DEBUG", True)
+    restaurant_cache.invalidate()
+
+    def build(slow_query_ms=0):
+        monkeypatch.setattr(app.main, "SLOW_QUERY_MS", slow_query_ms)
+        client = TestClient(app.main.create_app(engines=(db_engine, async_db_engine)))
+        client.headers["Authorization"] = f"Bearer {MOCK_BEARER_TOKEN}"
+        return client
+
+    yield build
+    restaurant_cache.invalidate()
+
+
+def test_debug_headers_report_statements_per_request(debug_client, db_session):
+    seed(db_session)
+    client = debug_client()
+
+    first = client.post(SEARCH_PATH, data=FORM)
+    # The restaurant lookup is served from the cache the second time
+    second = client.post(SEARCH_PATH, data=FORM)
+
+    assert first.headers["X-DB-Query-Count"] == "2"
+    assert second.headers["X-DB-Query-Count"] == "1"
+    assert float(first.headers["X-DB-Time-Ms"]) > 0
+
+
+def test_headers_are_off_outside_debug_mode(client, db_session):
+    seed(db_session)
+
+    resp = client.post(SEARCH_PATH, data=FORM)
+
+    assert "X-DB-Query-Count" not in resp.headers
+
+
+def test_slow_queries_are_logged_with_their_route(debug_client, db_session, caplog):
+    seed(db_session)
+    client = debug_client(slow_query_ms=1e-6)
+
+    with caplog.at_level(logging.WARNING, logger="app.slow_queries"):
+        client.post(SEARCH_PATH, data=FORM)
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert len(messages) == 2
+    assert all(f"in POST {SEARCH_ROUTE}: SELECT" in message for message in messages)
+    assert any("WHERE restaurants.name = ?" in message for message in messages)
+
+
+def test_sql_is_normalized_for_logging():
+    assert normalize_sql(
+        "SELECT * FROM bookings\n  WHERE id IN (?, ?, ?) AND status = 'confirmed'"
+        " AND party_size > 4 AND anon_1.x = $1"
+    ) == (
+        "SELECT * FROM bookings WHERE id IN (...) AND status = ? "
+        "AND party_size > ? AND anon_1.x = ?"
+    )
+    assert normalize_sql(
+        "INSERT INTO t (a, b) VALUES (%(a_m0)s, %(b_m0)s), (%(a_m1)s, %(b_m1)s)"
+    ) == "INSERT INTO t (a, b) VALUES (...), ..."
@@ -0,0 +1,58 @@
+from app.cache import RestaurantCache, restaurant_cache
+from app.models import Restaurant
+
+BOOKING_PATH = "/api/ConsumerApi/v1/Restaurant/{}/Booking/ABC1234"
+
+
+def restaurant_queries(statements):
+    return [s for s in statements if "FROM restaurants" in s]
+
+
+def test_restaurant_is_loaded_once_across_requests(
+    client, db_session, query_counter
+):
+    db_session.add(Restaurant(name="TheHungryUnicorn", microsite_name="THU"))
+    db_session.commit()
+
+    for _ in range(3):
+        resp = client.get(BOOKING_PATH.format("TheHungryUnicorn"))
+        assert resp.json()["detail"] == "Booking not found"
+
+    assert len(restaurant_queries(query_counter)) == 1
+
+
+def test_unknown_restaurant_is_not_cached(client, db_session):
+    assert client.get(BOOKING_PATH.format("Newcomer")).status_code == 404
+
+    db_session.add(Restaurant(name="Newcomer", microsite_name="Newcomer"))
+    db_session.commit()
+
+    assert client.get(BOOKING_PATH.format("Newcomer")).json() == {
+        "detail": "Booking not found"
+    }
+
+
+def test_updating_a_restaurant_invalidates_the_cache(client, db_session):
+    restaurant = Restaurant(name="OldName", microsite_name="OldName")
+    db_session.add(restaurant)
+    db_session.commit()
+    client.get(BOOKING_PATH.format("OldName"))
+    assert restaurant_cache.get("OldName") is not None
+
+    restaurant.name = "NewName"
+    db_session.commit()
+
+    assert restaurant_cache.get("OldName") is None
+    assert client.get(BOOKING_PATH.format("OldName")).status_code == 404
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr("app.cache.time.monotonic", lambda: clock[0])
+    cache = RestaurantCache(ttl=60)
+    cache.put(Restaurant(id=1, name="TheHungryUnicorn", microsite_name="THU"))
+
+    clock[0] += 59
+    assert cache.get("TheHungryUnicorn").id == 1
+    clock[0] += 1
+    assert cache.get("TheHungryUnicorn") is None
@@ -0,0 +1,91 @@
+from datetime import date, time
+
+from sqlalchemy import func, select
+
+from app.models import AvailabilitySlot, Booking, Customer, Restaurant
+from app.occupancy import MAX_BOOKINGS_PER_SLOT
+from app.seed import SEEDED_TABLES, reset_data, seed_database, slot_times
+
+START_DATE = date(2030, 1, 1)
+TIMES = slot_times(time(12, 0), time(14, 0), 30)
+
+
+def seed(engine, **options):
+    with engine.begin() as connection:
+        reset_data(connection)
+        return seed_database(connection, start_date=START_DATE, times=TIMES, **options)
+
+
+def dump(engine):
+    with engine.connect() as connection:
+        return {
+            table.name: connection.execute(
+                select(table).order_by(table.c.id)
+            ).all()
+            for table in SEEDED_TABLES
+        }
+
+
+def test_slot_times():
+    assert TIMES == [time(12, 0), time(12, 30), time(13, 0), time(13, 30)]
+
+
+def test_seeding_is_deterministic(db_engine):
+    options = dict(restaurants=3, days=5, booking_density=0.5, seed=7)
+    counts = seed(db_engine, **options)
+    first = dump(db_engine)
+    seed(db_engine, **options)
+
+    assert dump(db_engine) == first
+    assert counts["availability_slots"] == 3 * 5 * len(TIMES)
+    assert counts["bookings"] == len(first["bookings"]) > 0
+
+    seed(db_engine, **dict(options, seed=8))
+    assert dump(db_engine) != first
+
+
+def test_booked_count_matches_seeded_bookings(db_engine, db_session):
+    seed(db_engine, restaurants=2, days=10, booking_density=0.6, seed=1)
+
+    confirmed = (
+        select(func.count(Booking.id))
+        .where(
+            Booking.restaurant_id == AvailabilitySlot.restaurant_id,
+            Booking.visit_date == AvailabilitySlot.date,
+            Booking.visit_time == AvailabilitySlot.time,
+        )
+        .scalar_subquery()
+    )
+    mismatched = db_session.scalar(
+        select(func.count(AvailabilitySlot.id))
+        .where(AvailabilitySlot.booked_count != confirmed)
+    )
+    assert mismatched == 0
+    assert db_session.scalar(
+        select(func.max(AvailabilitySlot.booked_count))
+    ) <= MAX_BOOKINGS_PER_SLOT
+    assert db_session.scalar(
+        select(func.sum(AvailabilitySlot.booked_count))
+        .where(AvailabilitySlot.available.is_(False))
+    ) in (None, 0)
+    assert db_session.scalar(
+        select(func.count(func.distinct(Booking.booking_reference)))
+    ) == db_session.scalar(select(func.count(Customer.id)))
+
+
+def test_seeded_data_serves_api(client, db_engine):
+    seed(db_engine, restaurants=2, days=1, unavailable_ratio=0, seed=3)
+    with db_engine.connect() as connection:
+        names = connection.scalars(
+            select(Restaurant.name).order_by(Restaurant.id)
+        ).all()
+    assert names[0] == "TheHungryUnicorn"
+
+    resp = client.post(
+        f"/api/ConsumerApi/v1/Restaurant/{names[1]}/BookingWithStripeToken",
+        data={
+            "VisitDate": START_DATE.isoformat(), "VisitTime": "12:00:00",
+            "PartySize": 2, "ChannelCode": "ONLINE", "Customer[Email]": "new@x.com",
+        },
+    )
+    assert resp.status_code == 200
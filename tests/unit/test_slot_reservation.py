@@ -0,0 +1,134 @@
+import asyncio
+import os
+from datetime import time
+
+import httpx
+import pytest
+
+from app.database import MEMORY_DATABASE_URL
+from app.models import Booking
+from app.occupancy import MAX_BOOKINGS_PER_SLOT
+from conftest import BASE_PATH, VISIT_DATE
+
+
+@pytest.fixture
+def seeded(seed_restaurant):
+    return seed_restaurant(unavailable=(time(21, 0),))
+
+
+def test_slot_capacity_is_enforced_and_released_on_cancel(
+    seeded, book, cancel, booked_count
+):
+    refs = [book().json()["booking_reference"] for _ in range(MAX_BOOKINGS_PER_SLOT)]
+
+    full = book()
+    assert full.status_code == 409
+    assert booked_count(time(19, 0)) == MAX_BOOKINGS_PER_SLOT
+
+    cancel(refs[0])
+    assert booked_count(time(19, 0)) == MAX_BOOKINGS_PER_SLOT - 1
+    assert book().status_code == 200
+
+
+def test_unbookable_slots_are_rejected(seeded, book, db_session):
+    assert book(visit_time="21:00:00").status_code == 409  # unavailable
+    assert book(visit_time="18:00:00").status_code == 409  # no slot
+    assert book(party_size=9).status_code == 409  # over max party size
+    assert db_session.query(Booking).count() == 0
+
+
+def test_moving_a_booking_transfers_its_reservation(
+    seeded, client, book, booked_count
+):
+    ref = book().json()["booking_reference"]
+    for _ in range(MAX_BOOKINGS_PER_SLOT):
+        book(visit_time="20:00:00")
+
+    rejected = client.patch(
+        f"{BASE_PATH}/Booking/{ref}", data={"VisitTime": "20:00:00"}
+    )
+    assert rejected.status_code == 409
+
+    moved = client.patch(
+        f"{BASE_PATH}/Booking/{ref}", data={"VisitTime": "19:00:00", "PartySize": 4}
+    )
+    assert moved.json()["status"] == "updated"
+    assert booked_count(time(19, 0)) == 1
+    assert booked_count(time(20, 0)) == MAX_BOOKINGS_PER_SLOT
+
+
+def test_party_size_changes_respect_the_slot_limit(
+    seeded, client, book, booked_count
+):
+    ref = book().json()["booking_reference"]
+
+    too_large = client.patch(f"{BASE_PATH}/Booking/{ref}", data={"PartySize": 9})
+    assert too_large.status_code == 409
+
+    resized = client.patch(f"{BASE_PATH}/Booking/{ref}", data={"PartySize": 8})
+    assert resized.json()["status"] == "updated"
+    assert booked_count(time(19, 0)) == 1
+
+
+def post_concurrently(client, path, forms):
+    """Post forms at once; requests share one event loop so they interleave."""
+    async def post_all():
+        transport = httpx.ASGITransport(app=client.app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test", headers=client.headers
+        ) as http:
+            responses = await asyncio.gather(*(
+                http.post(path, data=form) for form in forms
+            ))
+        return [response.status_code for response in responses]
+
+    return asyncio.run(post_all())
+
+
+@pytest.mark.skipif(
+    os.getenv("TEST_DATABASE_URL") == MEMORY_DATABASE_URL,
+    reason="in-memory databases do not support concurrent writers"
+)
+def test_concurrent_bookings_never_oversell_a_slot(
+    seeded, client, db_session, booked_count
+):
+    attempts = 24
+    form = {
+        "VisitDate": VISIT_DATE.isoformat(),
+        "VisitTime": "19:00:00",
+        "PartySize": 2,
+        "ChannelCode": "ONLINE",
+    }
+
+    statuses = post_concurrently(client, f"{BASE_PATH}/BookingWithStripeToken", [
+        {**form, "Customer[Email]": f"guest{i}@example.com"} for i in range(attempts)
+    ])
+
+    assert statuses.count(200) == MAX_BOOKINGS_PER_SLOT
+    assert statuses.count(409) == attempts - MAX_BOOKINGS_PER_SLOT
+    assert db_session.query(Booking).count() == MAX_BOOKINGS_PER_SLOT
+    assert booked_count(time(19, 0)) == MAX_BOOKINGS_PER_SLOT
+
+
+@pytest.mark.skipif(
+    os.getenv("TEST_DATABASE_URL") == MEMORY_DATABASE_URL,
+    reason="in-memory databases do not support concurrent writers"
+)
+def test_concurrent_cancels_release_a_place_once(seeded, client, book, booked_count):
+    refs = [book().json()["booking_reference"] for _ in range(MAX_BOOKINGS_PER_SLOT)]
+    attempts = 5
+    form = {
+        "micrositeName": "TheHungryUnicorn",
+        "bookingReference": refs[0],
+        "cancellationReasonId": 1,
+    }
+
+    statuses = post_concurrently(
+        client, f"{BASE_PATH}/Booking/{refs[0]}/Cancel", [form] * attempts
+    )
+
+    assert statuses.count(200) == 1
+    assert statuses.count(400) == attempts - 1
+    assert booked_count(time(19, 0)) == MAX_BOOKINGS_PER_SLOT - 1
+    assert book().status_code == 200
+    assert book().status_code == 409
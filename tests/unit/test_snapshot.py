@@ -0,0 +1,58 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, func, select, text
+
+from app.init_db import SAMPLE_TIMES, create_tables, restore_snapshot
+from app.models import AvailabilitySlot, Booking
+from app.seed import seed_database
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    path = tmp_path / "snapshot.db"
+    engine = create_engine(f"sqlite:///{path}")
+    create_tables(bind=engine)
+    with engine.begin() as connection:
+        seed_database(
+            connection, start_date=date(2030, 1, 1), times=SAMPLE_TIMES,
+            days=3, booking_density=0.5, seed=1
+        )
+        connection.exec_driver_sql("ANALYZE")
+    engine.dispose()
+    return path
+
+
+def test_restore_replaces_database_contents(snapshot, tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    with engine.begin() as connection:
+        connection.exec_driver_sql("CREATE TABLE stale (id INTEGER)")
+
+    restore_snapshot(snapshot, bind=engine)
+
+    with engine.connect() as connection:
+        tables = connection.execute(
+            text("SELECT name FROM sqlite_master WHERE type = 'table'")
+        ).scalars().all()
+        slots = connection.scalar(select(func.count(AvailabilitySlot.id)))
+        bookings = connection.scalar(select(func.count(Booking.id)))
+    engine.dispose()
+
+    assert "stale" not in tables
+    assert "sqlite_stat1" in tables
+    assert slots == 3 * len(SAMPLE_TIMES)
+    assert bookings > 0
+
+
+def test_restore_rejects_outdated_snapshot(snapshot, tmp_path):
+    outdated = create_engine(f"sqlite:///{snapshot}")
+    with outdated.begin() as connection:
+        connection.exec_driver_sql("UPDATE alembic_version SET version_num = '0003'")
+    outdated.dispose()
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    with pytest.raises(RuntimeError, match="migration head"):
+        restore_snapshot(snapshot, bind=engine)
+    with pytest.raises(RuntimeError, match="does not exist"):
+        restore_snapshot(tmp_path / "missing.db", bind=engine)
+    engine.dispose()